@@ -1,17 +1,25 @@
-from importlib.metadata import version
-
 from .cli import main as main
-from .mcp_servers import stata_mcp
 
-__version__ = version("stata-mcp")
 __author__ = "Song Tan <sepine@statamcp.com>"
 
 
+def __getattr__(name: str):
+    # PEP 562: the MCP server (mcp, pydantic, httpx, ...) is only imported when it is used,
+    # so `stata-mcp --version` and the CLI subcommands start fast
+    if name == "stata_mcp":
+        from .mcp_servers import stata_mcp
+        return stata_mcp
+    if name == "__version__":
+        from importlib.metadata import version
+        return version("stata-mcp")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "stata_mcp",
 ]
 
 
 if __name__ == "__main__":
-    print(f"Hello Stata-MCP@v{__version__}")
+    print(f"Hello Stata-MCP@v{__getattr__('__version__')}")
     main()
@@ -1,12 +1,25 @@
-from .agent_as_rag import HandoffAgent, KnowledgeBase
-from .agent_as_tool import StataAgent
-from .repl_agents import REPLAgent
-from .set_model import set_model
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .agent_as_rag import HandoffAgent, KnowledgeBase
+    from .agent_as_tool import StataAgent
+    from .repl_agents import REPLAgent
+    from .set_model import set_model
+
+__getattr__, __dir__ = lazy_module(__name__, {
+    "HandoffAgent": ".agent_as_rag",
+    "KnowledgeBase": ".agent_as_rag",
+    "StataAgent": ".agent_as_tool",
+    "REPLAgent": ".repl_agents",
+    "set_model": ".set_model",
+})
 
 __all__ = [
     "set_model",
     "REPLAgent",
     "StataAgent",
     "KnowledgeBase",
-    "HandoffAgent",
+    "HandoffAgent"
 ]
@@ -43,6 +43,11 @@ def main() -> None:
         action="store_true",
         help="Check whether Stata-MCP can be used on this computer",
     )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Measure the cold start time of the MCP server",
+    )
 
     # Agent subcommand
     agent_parser = subparsers.add_parser(
@@ -78,6 +83,11 @@ def main() -> None:
         from ..utils.usable import usable
         sys.exit(usable())
 
+    # Handle --benchmark flag
+    if args.benchmark:
+        from ..utils.benchmark import benchmark
+        sys.exit(benchmark())
+
     # Handle subcommands
     if args.command == "agent":
         if args.agent_action == "run":
@@ -214,6 +214,99 @@ class Config:
             raise StataCLINotFoundError()
         return cli
 
+    @property
+    def POOL_SIZE(self) -> int:
+        """Get the number of warm Stata workers kept for stata_do.
+
+        Returns:
+            int: Number of pre-started Stata workers, 0 means the pool is disabled
+
+        Configuration priority:
+            1. Environment variable: STATA_MCP__POOL__SIZE
+            2. Config file: [STATA.pool] SIZE
+            3. Default: 0 (disabled, a new Stata process per do-file)
+        """
+        return self._get_config_value(
+            config_keys=["STATA", "pool", "SIZE"],
+            env_var="STATA_MCP__POOL__SIZE",
+            default=0,
+            converter=self._to_int,
+            validator=lambda x: isinstance(x, int) and x >= 0
+        )
+
+    @property
+    def POOL_MAX_JOBS(self) -> int:
+        """Get the number of jobs a warm Stata worker runs before it is recycled."""
+        return self._get_config_value(
+            config_keys=["STATA", "pool", "MAX_JOBS"],
+            env_var="STATA_MCP__POOL__MAX_JOBS",
+            default=50,
+            converter=self._to_int,
+            validator=lambda x: isinstance(x, int) and x > 0
+        )
+
+    @property
+    def CACHE_ON(self) -> bool:
+        """Whether stata_do returns the cached log of an identical run (same do-file, same data)."""
+        return self._get_config_value(
+            config_keys=["STATA", "cache", "CACHE_ON"],
+            env_var="STATA_MCP__CACHE_ON",
+            default=True,
+            converter=self._to_bool,
+            validator=lambda x: isinstance(x, bool)
+        )
+
+    @property
+    def CACHE_MAX_MB(self) -> int:
+        """Get the disk budget of the do-file result cache in MB, the least recently used logs are evicted first."""
+        return self._get_config_value(
+            config_keys=["STATA", "cache", "MAX_MB"],
+            env_var="STATA_MCP__CACHE__MAX_MB",
+            default=256,
+            converter=self._to_int,
+            validator=lambda x: isinstance(x, int) and x > 0
+        )
+
+    @property
+    def MAX_CONCURRENCY(self) -> int | None:
+        """Get the number of do-files stata_do_batch runs at the same time.
+
+        Returns:
+            int | None: Maximum concurrent Stata processes, None means half of the CPU cores
+
+        Configuration priority:
+            1. Environment variable: STATA_MCP__SCHEDULER__MAX_CONCURRENCY
+            2. Config file: [STATA.scheduler] MAX_CONCURRENCY
+            3. Default: 0 (half of the CPU cores)
+        """
+        value = self._get_config_value(
+            config_keys=["STATA", "scheduler", "MAX_CONCURRENCY"],
+            env_var="STATA_MCP__SCHEDULER__MAX_CONCURRENCY",
+            default=0,
+            converter=self._to_int,
+            validator=lambda x: isinstance(x, int) and x >= 0
+        )
+        return value or None
+
+    @property
+    def MIN_FREE_RAM_MB(self) -> int | None:
+        """Get the free RAM in MB required before stata_do_batch starts another do-file.
+
+        Note:
+            -1 means no admission control (will be converted to None)
+        """
+        value = self._get_config_value(
+            config_keys=["STATA", "scheduler", "MIN_FREE_RAM_MB"],
+            env_var="STATA_MCP__SCHEDULER__MIN_FREE_RAM_MB",
+            default=1024,
+            converter=self._to_int,
+            validator=lambda x: isinstance(x, int)
+        )
+
+        if value == -1:
+            return None
+        return value
+
     @property
     def IS_GUARD(self) -> bool:
         return self._get_config_value(
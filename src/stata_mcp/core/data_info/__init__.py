@@ -1,8 +1,13 @@
 from typing import Type
 
 from .base import DATA_INFO_REGISTRY, DataInfoBase
+from .cache import SummaryCache
 from .csv import CsvDataInfo
 from .dta import DtaDataInfo
+from .feather import FeatherDataInfo
+from .fingerprint import FileFingerprint
+from .parquet import ParquetDataInfo
+from .streaming import StreamingSummary
 from .xlsx import ExcelDataInfo
 
 
@@ -23,7 +28,12 @@ __all__ = [
     "CsvDataInfo",
     "DtaDataInfo",
     "ExcelDataInfo",
+    "ParquetDataInfo",
+    "FeatherDataInfo",
     "DataInfoBase",
+    "FileFingerprint",
+    "SummaryCache",
+    "StreamingSummary",
     "DATA_INFO_REGISTRY",
     "get_data_handler",
 ]
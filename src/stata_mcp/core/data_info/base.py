@@ -7,21 +7,29 @@
 # @Email  : sepinetam@gmail.com
 # @File   : _base.py
 
-import hashlib
-import json
 import logging
+import math
 import os
 import tomllib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from os import PathLike
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 from urllib.parse import urlparse
 
 import numpy as np
 import pandas as pd
 
+from .cache import SummaryCache
+from .distinct import DISTINCT_SKETCH_SIZE, DistinctSketch
+from .fingerprint import FileFingerprint
+from .moments import sample_intervals, summarize_numeric_frame
+from .parallel import MIN_CELLS, summarize_numeric_parallel
+from .remote import RemoteFileCache
+from .streaming import StreamingSummary
+
 # Global registry for data info classes
 # Maps file extensions to their corresponding DataInfoBase subclass
 DATA_INFO_REGISTRY: Dict[str, type] = {}
@@ -38,86 +46,30 @@ class Series:
 @dataclass
 class StringSeries(Series):
     max_display: int = 10
+    sketch_size: int = DISTINCT_SKETCH_SIZE
 
     def get_summary(self) -> Dict[str, Any]:
         return {
             "obs": self.obs,
-            "value_list": self.value_list
-        }
-
-    @property
-    def obs(self) -> int:
-        return int(self.data.size)
-
-    @property
-    def value_list(self) -> List[str]:
-        unique_values = self.data.unique()
-
-        value_list = (
-            sorted(unique_values.tolist())
-            if len(unique_values) <= self.max_display
-            else sorted(np.random.choice(unique_values, self.max_display, replace=False).tolist())
-        )
-        return value_list
-
-
-@dataclass
-class NumericSeries(Series):
-    max_decimal_places: int = 3
-
-    def get_summary(self) -> Dict[str, Any]:
-        return {
-            "obs": self.obs,
-            "mean": self.mean,
-            "stderr": self.stderr,
-            "min": self.min,
-            "max": self.max,
-            "q1": self.q1,
-            "med": self.med,
-            "q3": self.q3,
-            "skewness": self.skewness,
-            "kurtosis": self.kurtosis,
+            "value_list": self.value_list,
+            "distinct": self.sketch.cardinality,
+            "distinct_estimated": not self.sketch.is_exact,
         }
 
     @property
     def obs(self) -> int:
         return int(self.data.size)
 
-    @property
-    def min(self) -> float:
-        return round(float(self.data.min()), self.max_decimal_places)
-
-    @property
-    def max(self) -> float:
-        return round(float(self.data.max()), self.max_decimal_places)
-
-    @property
-    def med(self) -> float:
-        return round(float(self.data.median()), self.max_decimal_places)
-
-    @property
-    def q1(self) -> float:
-        return round(float(self.data.quantile(0.25)), self.max_decimal_places)
-
-    @property
-    def q3(self) -> float:
-        return round(float(self.data.quantile(0.75)), self.max_decimal_places)
-
-    @property
-    def mean(self) -> float:
-        return round(float(self.data.mean()), self.max_decimal_places)
-
-    @property
-    def stderr(self) -> float:
-        return round(float(np.std(self.data, ddof=1) / np.sqrt(self.obs)), self.max_decimal_places)
-
-    @property
-    def skewness(self) -> float:
-        return round(float(self.data.skew()), self.max_decimal_places)
+    @cached_property
+    def sketch(self) -> DistinctSketch:
+        """The distinct values with the smallest seeded hashes, so the listed values are stable."""
+        sketch = DistinctSketch(self.sketch_size)
+        sketch.update(self.data)
+        return sketch
 
     @property
-    def kurtosis(self) -> float:
-        return round(float(self.data.kurtosis()), self.max_decimal_places)
+    def value_list(self) -> List[str]:
+        return self.sketch.sample(self.max_display)
 
 
 class DataInfoBase(ABC):
@@ -126,6 +78,13 @@ class DataInfoBase(ABC):
     # Registry of supported file extensions (to be overridden by subclasses)
     supported_extensions: list[str] = []
 
+    # Whether the subclass reads the data in chunks (`_iter_chunks`)
+    supports_streaming: bool = False
+
+    # Block sampling: rows per block (fewer for small samples, see _sample_blocks) and the seed
+    SAMPLE_BLOCK_ROWS = 1000
+    SAMPLE_SEED = 0
+
     CFG_FILE = Path.home() / ".statamcp" / "config.toml"
     DEFAULT_METRICS = ['obs', 'mean', 'stderr', 'min', 'max']
     ALLOWED_METRICS = ['obs', 'mean', 'stderr', 'min', 'max',
@@ -155,6 +114,12 @@ class DataInfoBase(ABC):
                  string_keep_number: int = None,
                  decimal_places: int = None,
                  hash_length: int = None,
+                 fingerprint_mode: str = None,
+                 streaming: bool | str = None,
+                 chunksize: int = None,
+                 sample: int | float = None,
+                 workers: int = None,
+                 metadata_only: bool = False,
                  **kwargs):
         if isinstance(data_path, str):
             self.is_url = self._is_url(data_path)
@@ -176,17 +141,85 @@ class DataInfoBase(ABC):
         self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".statamcp" / ".cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        self._data_info_config: Dict[str, Any] | None = None
         self.string_keep_number = string_keep_number or int(os.getenv("STATA_MCP_DATA_INFO_STRING_KEEP_NUMBER", 10))
         self.decimal_places = decimal_places or int(os.getenv("STATA_MCP_DATA_INFO_DECIMAL_PLACES", 3))
         self.HASH_LENGTH = hash_length or os.getenv("HASH_LENGTH", 12)
+        self.fingerprint_mode = (
+            fingerprint_mode
+            or os.getenv("STATA_MCP_DATA_INFO_FINGERPRINT")
+            or self.data_info_config.get("fingerprint", "stat")
+        )
+
+        # True, False or "auto" (files larger than `streaming_threshold_mb`)
+        if streaming is None:
+            streaming = os.getenv("STATA_MCP_DATA_INFO_STREAMING") or self.data_info_config.get("streaming", "auto")
+        self.streaming = streaming if isinstance(streaming, bool) else {
+            "true": True, "1": True, "false": False, "0": False
+        }.get(str(streaming).lower(), "auto")
+        self.streaming_threshold_mb = int(self.data_info_config.get("streaming_threshold_mb", 512))
+        self.chunksize = chunksize or int(
+            os.getenv("STATA_MCP_DATA_INFO_CHUNKSIZE") or self.data_info_config.get("chunksize", 100_000)
+        )
+        self.cache_max_mb = int(
+            os.getenv("STATA_MCP_DATA_INFO_CACHE_MAX_MB") or self.data_info_config.get("cache_max_mb", 64)
+        )
+        self.download_cache_max_mb = int(
+            os.getenv("STATA_MCP_DATA_INFO_DOWNLOAD_CACHE_MAX_MB")
+            or self.data_info_config.get("download_cache_max_mb", 1024)
+        )
+        # Processes summarizing the numeric variables, 1 (the default) stays in this process, 0 uses every CPU
+        if workers is None:
+            workers = int(os.getenv("STATA_MCP_DATA_INFO_WORKERS") or self.data_info_config.get("workers", 1))
+        self.workers = workers or os.cpu_count() or 1
+
+        # A number of rows (int) or a fraction of them (float), None summarizes all the data
+        if isinstance(sample, float) and sample > 1 and sample.is_integer():
+            sample = int(sample)  # e.g. a number of rows sent as a JSON float
+        if sample is not None and (isinstance(sample, bool) or not (
+                (isinstance(sample, int) and sample >= 1) or (isinstance(sample, float) and 0 < sample <= 1))):
+            raise ValueError(f"sample must be a number of rows (>= 1) or a fraction in (0, 1], got: {sample}")
+        self.sample = sample
+        self.sample_max_rows = int(self.data_info_config.get("sample_max_rows", 1_000_000))
+
+        # Summarize from the statistics stored in the file (Parquet) where possible: obs, min and max only
+        self.metadata_only = metadata_only
 
         self.kwargs = kwargs  # Store additional keyword arguments for subclasses to use
 
+        # Memoized per instance, so one summary reads the data (and hashes it) only once
+        self._df: pd.DataFrame | None = None
+        self._columns: List[str] | None = None
+        self._vars_list: List[str] | None = None
+        self._hash: str | None = None
+        self._local_path: Path | None = None
+        self._read_vars: List[str] | None = None  # Set when only some variables need to be read
+        self._sample_info: Dict[str, Any] | None = None  # Set once a sample is summarized
+
     # Properties
     @property
     def hash(self) -> str:
-        # TODO: URL inputs cannot directly use read_bytes, low priority
-        return hashlib.md5(self.data_path.read_bytes()).hexdigest()
+        """Get the fingerprint of the data, for a URL the one of its downloaded copy."""
+        if self._hash is None:
+            self._hash = FileFingerprint(self.cache_dir, mode=self.fingerprint_mode).fingerprint(self.local_path)
+        return self._hash
+
+    @property
+    def local_path(self) -> Path:
+        """
+        Get the local file the readers work on.
+
+        A URL is downloaded once into the download cache (`downloads/` in the cache
+        directory), and only revalidated with a conditional request afterwards.
+        """
+        if self._local_path is None:
+            if self.is_url:
+                self._local_path = RemoteFileCache(
+                    self.cache_dir / "downloads", self.download_cache_max_mb * 1024 * 1024
+                ).fetch(self.data_path)
+            else:
+                self._local_path = Path(self.data_path)
+        return self._local_path
 
     @property
     def name(self) -> str:
@@ -203,16 +236,34 @@ class DataInfoBase(ABC):
             return self.data_path.suffix.strip(".")
 
     @property
-    def cached_file(self) -> Path:
-        return self.cache_dir / f"data_info__{self.name}_{self.suffix.strip('.')}__hash_{self.hash[:self.HASH_LENGTH]}.json"
+    def cache_db(self) -> Path:
+        return self.cache_dir / "data_info.sqlite3"
+
+    @property
+    def cache_config(self) -> str:
+        """Identify how a variable summary is computed, cached summaries are only reused for the same."""
+        config = f"{','.join(self.metrics)}|{self.string_keep_number}|{self.decimal_places}|{DISTINCT_SKETCH_SIZE}"
+        if self.metadata_only:
+            config += "|metadata"
+        if self.is_streaming:
+            config += "|streaming"  # Quartiles come from a sketch
+        return config
+
+    @property
+    def data_info_config(self) -> Dict[str, Any]:
+        """Get the `[data_info]` table of the config file, empty if there is none."""
+        if self._data_info_config is None:
+            try:
+                with open(self.CFG_FILE, "rb") as f:
+                    self._data_info_config = tomllib.load(f).get("data_info", {}) or {}
+            except (OSError, tomllib.TOMLDecodeError):
+                self._data_info_config = {}
+        return self._data_info_config
 
     @property
     def metrics(self) -> List[str]:
         try:
-            with open(self.CFG_FILE, "rb") as f:
-                config = tomllib.load(f)
-
-            additional = config.get("data_info", {}).get("metrics", []) or []
+            additional = self.data_info_config.get("metrics", []) or []
             if not isinstance(additional, list):
                 additional = [additional]
 
@@ -227,13 +278,56 @@ class DataInfoBase(ABC):
 
     @property
     def df(self) -> pd.DataFrame:
-        """Get the data as a pandas DataFrame."""
-        return self._read_data()
+        """Get the data as a pandas DataFrame, it is read on first access only."""
+        if self._df is None:
+            self._df = self._read_data()
+        return self._df
+
+    @property
+    def columns(self) -> List[str]:
+        """Get all the variable names, without reading the data when it is not loaded yet."""
+        if self._columns is None:
+            loaded = self._df is not None and self.usecols is None
+            self._columns = list(self._df.columns) if loaded else self._read_columns()
+        return self._columns
+
+    @property
+    def usecols(self) -> List[str] | None:
+        """
+        Get the variables the readers should load, None means all of them.
+
+        The requested variables are validated against the header first, so the data
+        is only read for the columns a summary needs.
+        """
+        if self._read_vars is not None:
+            return self._read_vars
+        if self._pre_vars_list is None:
+            return None
+        return self.vars_list
 
     @property
     def vars_list(self) -> List[str]:
         """Get the list of selected variables."""
-        return self._get_selected_vars(self._pre_vars_list)
+        if self._vars_list is None:
+            self._vars_list = self._get_selected_vars(self._pre_vars_list)
+        return self._vars_list
+
+    @property
+    def is_sampling(self) -> bool:
+        """Whether the summary is computed on a sample of the rows, such summaries are not cached."""
+        return self.sample is not None
+
+    @property
+    def is_streaming(self) -> bool:
+        """Whether the summary is computed chunk by chunk instead of on the whole DataFrame."""
+        if self.streaming != "auto":
+            return bool(self.streaming)
+        if not self.supports_streaming:
+            return False
+        try:
+            return self._data_bytes() > self.streaming_threshold_mb * 1024 * 1024
+        except OSError:
+            return False
 
     @property
     def info(self) -> Dict[str, Any]:
@@ -254,6 +348,39 @@ class DataInfoBase(ABC):
         """Read data from the source file. Must be implemented by subclasses."""
         ...
 
+    def _iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Read the variables to summarize (`self.usecols`) chunk by chunk, about `self.chunksize` rows each.
+
+        Subclasses with `supports_streaming` override it, the default yields the whole data.
+        """
+        yield self.df
+
+    def _read_columns(self) -> List[str]:
+        """
+        Read the variable names only.
+
+        Subclasses override it with a header-only read, the default falls back to the full data.
+        """
+        return list(self.df.columns)
+
+    def _count_rows(self) -> int | None:
+        """
+        Count the rows without reading the data, None when the format cannot.
+
+        Subclasses which can also read rows at any position (`_read_blocks`) override it,
+        so a sample is read in bounded time.
+        """
+        return None
+
+    def _data_bytes(self) -> int:
+        """Size of the data compared with the streaming threshold, the size of the file by default."""
+        return self.local_path.stat().st_size
+
+    def _read_blocks(self, blocks: List[Tuple[int, int]]) -> pd.DataFrame:
+        """Read the variables in `self.usecols` of the (start row, number of rows) blocks, in file order."""
+        raise NotImplementedError(f"{type(self).__name__} cannot read rows at a given position")
+
     # Public methods
     def summary(self) -> Dict[str, Any]:
         """
@@ -289,7 +416,9 @@ class DataInfoBase(ABC):
                             "obs": 74,
                             "value_list": ["AMC Pacer", "Chev. Chevette", "Chev. Nova",
                                           "Honda Accord", "Merc. Monarch", "Olds Cutl Supr",
-                                          "Olds Delta 88", "Pont. Catalina", "Renault Le Car", "Volvo 260"]
+                                          "Olds Delta 88", "Pont. Catalina", "Renault Le Car", "Volvo 260"],
+                            "distinct": 74,
+                            "distinct_estimated": false
                         }
                     },
                     "price": {
@@ -341,98 +470,228 @@ class DataInfoBase(ABC):
                         }
                     }
                 },
-                "saved_path": "~/.statamcp/.cache/data_info__auto_dta__hash_c557a2db346b.json"
+                "saved_path": "~/.statamcp/.cache/data_info.sqlite3"
             }
         """
-        if self.is_cache:
-            cached_summary = self.load_cached_summary()
-            if cached_summary:
-                return self._filter(cached_summary)
-        df = self.df
         selected_vars = self.vars_list
+        is_cache = self.is_cache and not self.is_sampling
+        obs, vars_detail = None, {}
+        if is_cache:
+            obs, vars_detail = self._load_cached_vars(selected_vars)
+
+        # Only the variables which are not cached yet are read and summarized
+        missing_vars = [var_name for var_name in selected_vars if var_name not in vars_detail]
+        if missing_vars:
+            if len(missing_vars) < len(self.columns):
+                self._read_vars = missing_vars
+            obs, computed = self._summarize(missing_vars)
+            vars_detail.update(computed)
+            if is_cache:
+                self._save_cached_vars(obs, computed)
+
+        return self._build_summary(obs, {var_name: vars_detail[var_name] for var_name in selected_vars})
+
+    def _build_summary(self, obs: int, vars_detail: Dict[str, Any]) -> Dict[str, Any]:
+        selected_vars = list(vars_detail)
 
         # Basic information
         overview = {
             "source": self.data_source,
-            "obs": len(df),
+            "obs": obs,
             "var_numbers": len(selected_vars),
             "var_list": selected_vars,
             "hash": self.hash,
         }
+        if self._sample_info is not None:
+            overview["sample"] = self._sample_info
         info_config = {
             "metrics": self.metrics,
             "max_display": self.string_keep_number,
             "decimal_places": self.decimal_places
         }
-        vars_detail = {}
 
-        for var_name in selected_vars:
-            var_series = df[var_name]
-            series_obj = self._get_variable_info(var_series)
+        return {
+            "overview": overview,
+            "info_config": info_config,
+            "vars_detail": vars_detail,
+            "saved_path": (self.cache_db.as_posix() if self.is_cache and not self.is_sampling
+                           else "Result is not saved.")
+        }
+
+    def _summarize(self, selected_vars: List[str]) -> tuple[int, Dict[str, Any]]:
+        """
+        Compute the obs and the details of the selected variables.
+
+        Handlers may override it to answer from file metadata, the default reads the data,
+        only a sample of it when sampling, chunk by chunk in streaming mode.
+        """
+        if self.is_sampling:
+            return self._summarize_sample(selected_vars)
+        if self.is_streaming:
+            return self._summarize_chunks(selected_vars)
+        df = self.df
+        return len(df), self._summarize_frame(df, selected_vars)
+
+    def _summarize_frame(self, df: pd.DataFrame, selected_vars: List[str]) -> Dict[str, Any]:
+        """
+        Summarize the selected variables of a DataFrame held in memory.
 
-            # Determine variable type for the info dict
-            var_type = "str" if isinstance(series_obj, StringSeries) else "float"
+        Numeric variables are summarized together in one vectorized pass, computing only
+        the metrics kept by self.metrics, split across a process pool when `workers` > 1 and
+        the data is large; string variables go through StringSeries.
+        """
+        var_types = {var_name: self._determine_variable_type(df[var_name]) for var_name in selected_vars}
+        numeric_vars = [var_name for var_name in selected_vars if var_types[var_name] == "float"]
+        if self.workers > 1 and len(numeric_vars) > 1 and len(df) * len(numeric_vars) >= MIN_CELLS:
+            numeric_summary = summarize_numeric_parallel(
+                df[numeric_vars], self.metrics, self.decimal_places, self.workers
+            )
+        else:
+            numeric_summary = summarize_numeric_frame(
+                df[numeric_vars], self.metrics, self.decimal_places
+            ) if numeric_vars else {}
 
-            # Build variable info dictionary
-            var_info = {
-                "type": var_type,
+        vars_detail = {}
+        for var_name in selected_vars:
+            if var_types[var_name] == "str":
+                series_obj = StringSeries(data=df[var_name].dropna(), max_display=self.string_keep_number)
+                var_summary = series_obj.get_summary()
+            else:
+                var_summary = numeric_summary[var_name]
+
+            vars_detail[var_name] = {
+                "type": var_types[var_name],
                 "var": var_name,
-                "summary": series_obj.get_summary()
+                "summary": var_summary
             }
 
-            vars_detail[var_name] = var_info
+        return vars_detail
 
-        summary_result = {
-            "overview": overview,
-            "info_config": info_config,
-            "vars_detail": vars_detail,
-            "saved_path": self.cached_file.as_posix() if self.is_cache else "Result is not saved."
-        }
+    def _summarize_chunks(self, selected_vars: List[str]) -> tuple[int, Dict[str, Any]]:
+        """
+        Summarize the selected variables in one pass over the chunks, in constant memory.
 
-        if self.is_cache:
-            self.save_to_json(summary_result)
+        Quartiles come from a quantile sketch and are approximate once a variable has more
+        values than the sketch holds, the other metrics are exact.
+        """
+        streaming_summary = StreamingSummary(
+            selected_vars,
+            type_of=self._determine_variable_type,
+            max_display=self.string_keep_number,
+            decimal_places=self.decimal_places,
+            metrics=self.metrics,
+        )
+        for chunk in self._iter_chunks():
+            streaming_summary.update(chunk)
+        return streaming_summary.obs, streaming_summary.vars_detail()
 
-        return summary_result
+    def _summarize_sample(self, selected_vars: List[str]) -> tuple[int, Dict[str, Any]]:
+        """
+        Summarize a sample of the rows, with 95% confidence intervals ("ci") of the mean and quartiles.
 
-    def save_to_json(self, summary: Dict[str, Any]) -> bool:
-        saved_path = self.cached_file
-        try:
-            with open(saved_path, "w", encoding="utf-8") as f:
-                f.write(json.dumps(summary, ensure_ascii=False, indent=4))
-            return True
-        except Exception as e:
-            logging.error(f"Error saving summary to JSON: {str(e)}")
-            return False
+        The overview gets a "sample" entry: the sampling method and the number of rows of
+        the whole data (the population), estimated for formats which cannot count them.
+        """
+        frame, sample_info = self._read_sample()
+        vars_detail = self._summarize_frame(frame, selected_vars)
+
+        numeric_vars = [var_name for var_name in selected_vars if vars_detail[var_name]["type"] == "float"]
+        intervals = sample_intervals(frame[numeric_vars], self.metrics, self.decimal_places) if numeric_vars else {}
+        for var_name, var_intervals in intervals.items():
+            if var_intervals:
+                vars_detail[var_name]["summary"]["ci"] = var_intervals
+
+        population = sample_info["population"]
+        self._sample_info = {
+            **sample_info,
+            "fraction": round(len(frame) / population, 6) if population else 1.0,
+            "confidence": 0.95,
+        }
+        return len(frame), vars_detail
 
-    def load_cached_summary(self) -> Dict[str, Any] | None:
+    def _read_sample(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """
-        Load summary from cache if available and matching the requested variables.
+        Read a sample of the rows of the variables in `self.usecols`.
+
+        Formats which count their rows and read them at any position are sampled by blocks of
+        consecutive rows at random positions, reading only those; the others go through a
+        reservoir over all the chunks.
 
         Returns:
-            Dict[str, Any] | None: Filtered summary from cache or None when unavailable.
+            Tuple[pd.DataFrame, Dict[str, Any]]: the sample, and the sampling method and population
         """
-        if not self.cached_file.exists():
-            return None
-
-        try:
-            with open(self.cached_file, "r", encoding="utf-8") as f:
-                cached_summary = json.load(f)
-        except (OSError, json.JSONDecodeError) as e:
-            logging.error(f"Error loading cached summary: {str(e)}")
-            return None
+        population = self._count_rows()
+        if population is None:
+            return self._reservoir_sample()
+        blocks = self._sample_blocks(population, self._sample_size(population))
+        return self._read_blocks(blocks), {"method": "block", "population": population, "population_estimated": False}
+
+    def _sample_size(self, population: int) -> int:
+        """Rows to sample out of `population`, at most `sample_max_rows`."""
+        size = self.sample if isinstance(self.sample, int) else math.ceil(self.sample * population)
+        return min(size, population, self.sample_max_rows)
+
+    def _sample_blocks(self, population: int, size: int) -> List[Tuple[int, int]]:
+        """
+        Choose non-overlapping blocks of rows at random positions, sorted, about `size` rows in total.
 
-        cached_hash = cached_summary.get("overview", {}).get("hash")
-        if cached_hash != self.hash:
-            return None
+        Blocks have SAMPLE_BLOCK_ROWS rows, fewer for small samples so there are about 100
+        of them: short blocks keep the sample close to a simple random sample.
+        """
+        if size >= population:
+            return [(0, population)]
+        length = min(max(size // 100, 1), self.SAMPLE_BLOCK_ROWS)
+        slots = population // length
+        rng = np.random.default_rng(self.SAMPLE_SEED)
+        starts = np.sort(rng.choice(slots, min(math.ceil(size / length), slots), replace=False)) * length
+        return [(int(start), length) for start in starts]
+
+    def _reservoir_sample(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Sample the chunks in one pass: every row gets a random key, the rows with the smallest keys are kept.
 
-        cached_var_list = cached_summary.get("overview", {}).get("var_list")
-        if not cached_var_list:
-            return None
+        A fraction keeps the keys below it (Bernoulli sampling), a number of rows the smallest
+        ones; both are bounded by `sample_max_rows`.
+        """
+        threshold = self.sample if isinstance(self.sample, float) else 1.0
+        limit = min(self.sample if isinstance(self.sample, int) else self.sample_max_rows, self.sample_max_rows)
+        rng = np.random.default_rng(self.SAMPLE_SEED)
+
+        population, sample, keys = 0, None, np.empty(0)
+        for chunk in self._iter_chunks():
+            population += len(chunk)
+            chunk_keys = rng.random(len(chunk))
+            chosen = chunk_keys < threshold
+            sample = chunk[chosen] if sample is None else pd.concat([sample, chunk[chosen]])
+            keys = np.concatenate([keys, chunk_keys[chosen]])
+            if len(keys) > limit:
+                kept = np.sort(np.argpartition(keys, limit)[:limit])  # Keep the file order
+                sample, keys = sample.iloc[kept], keys[kept]
+
+        if sample is None:  # No chunk at all
+            sample = pd.DataFrame(columns=self.usecols or self.columns)
+        return sample.reset_index(drop=True), {
+            "method": "reservoir", "population": population, "population_estimated": False
+        }
 
-        if not set(self.vars_list).issubset(set(cached_var_list)):
-            return None
+    def _load_cached_vars(self, vars_list: List[str]) -> tuple[int | None, Dict[str, Any]]:
+        try:
+            return SummaryCache(self.cache_db, self.cache_max_mb * 1024 * 1024).get(
+                self.hash, self.cache_config, vars_list
+            )
+        except Exception as e:
+            logging.error(f"Error loading cached summary: {str(e)}")
+            return None, {}
 
-        return self._filter_var(cached_summary)
+    def _save_cached_vars(self, obs: int, vars_detail: Dict[str, Any]) -> bool:
+        try:
+            SummaryCache(self.cache_db, self.cache_max_mb * 1024 * 1024).put(
+                self.hash, self.cache_config, self.data_source, obs, vars_detail
+            )
+            return True
+        except Exception as e:
+            logging.error(f"Error saving summary to cache: {str(e)}")
+            return False
 
     # Private helper methods
     def _filter(self, summary: Dict[str, Any]) -> Dict[str, Any]:
@@ -456,23 +715,12 @@ class DataInfoBase(ABC):
                 # Filter numerical vars based on self.metrics
                 var_summary = var_detail["summary"]
                 filtered_summary = {k: var_summary[k] for k in self.metrics if k in var_summary}
+                if "ci" in var_summary:  # Confidence intervals of a sampled summary
+                    filtered_summary["ci"] = var_summary["ci"]
                 summary["vars_detail"][var_name]["summary"] = filtered_summary
 
         return summary
 
-    def _filter_var(self, summary: Dict[str, Any]) -> Dict[str, Any]:
-        """Filter cached summary to keep only variables in self.vars_list."""
-        target_vars = self.vars_list or []
-        cached_vars = summary.get("vars_detail", {})
-        filtered_vars_detail = {var: cached_vars[var] for var in target_vars if var in cached_vars}
-
-        summary["vars_detail"] = filtered_vars_detail
-        if "overview" in summary:
-            summary["overview"]["var_list"] = list(target_vars)
-            summary["overview"]["var_numbers"] = len(summary["overview"]["var_list"])
-
-        return summary
-
     def _get_selected_vars(self, vars: List[str] | str = None) -> List[str]:
         """
         Get the list of selected variables.
@@ -490,8 +738,8 @@ class DataInfoBase(ABC):
         Raises:
             ValueError: If specified variables don't exist in the dataset.
         """
-        # Get all available variables from the data
-        all_vars = list(self.df.columns)
+        # Get all available variables, the header is enough to validate the names
+        all_vars = self.columns
 
         if vars is None:
             return all_vars
@@ -510,50 +758,52 @@ class DataInfoBase(ABC):
         return vars
 
     # Helper methods for summary
-    def _get_variable_info(self, var_series: pd.Series) -> Series:
-        """
-        Create a Series object (StringSeries or NumericSeries) for a variable.
-
-        Args:
-            var_series: pandas Series containing the variable data
-
-        Returns:
-            Series: StringSeries or NumericSeries object
-        """
-        # Remove NA values for analysis
-        non_na_series = var_series.dropna()
-
-        # Determine variable type
-        var_type = DataInfoBase._determine_variable_type(non_na_series)
-
-        # Create appropriate Series object
-        if var_type == "str":
-            return StringSeries(data=non_na_series, max_display=self.string_keep_number)
-        else:  # float type
-            return NumericSeries(data=non_na_series, max_decimal_places=self.decimal_places)
-
     @staticmethod
-    def _determine_variable_type(series: pd.Series) -> str:
+    def _determine_variable_type(series: pd.Series,
+                                 sample_size: int = 1000,
+                                 block_size: int = 100_000) -> str:
         """
         Determine the type of variable.
 
+        The dtype decides first: numeric and boolean columns are "float", datetimes,
+        timedeltas and periods are "str". Only object (and string) columns look at the
+        values: an evenly spaced sample rejects most text columns at once, then the column
+        is checked block by block, stopping at the first block with a non-numeric value.
+
         Args:
-            series: pandas Series with NA values removed
+            series: pandas Series, NA values are ignored
+            sample_size: number of values checked before the whole column
+            block_size: number of values converted at a time by the full check
 
         Returns:
             str: "str" for string variables, "float" for numeric variables
         """
-        if len(series) == 0:
-            return "float"  # Default to float for empty series
-
-        # Check if all non-null values are numeric
-        try:
-            # Try to convert to numeric
-            pd.to_numeric(series, errors='raise')
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtype = dtype.categories.dtype
+        if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype):
             return "float"
-        except (ValueError, TypeError):
+        if (pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype)
+                or isinstance(dtype, pd.PeriodDtype)):
             return "str"
 
+        def is_numeric(values: pd.Series) -> bool:
+            # Coercion turns anything which is not a number into NaN, no exception is raised
+            values = values.dropna()
+            return bool(pd.to_numeric(values, errors="coerce").notna().all())
+
+        # Evenly spaced values, a few of them first as text usually fails on any value
+        sample = series.iloc[::max(1, len(series) // sample_size)].dropna()
+        if sample.empty and series.isna().all():
+            return "float"  # Default to float for empty series
+        for probe in (sample.iloc[:16], sample):
+            if not is_numeric(probe):
+                return "str"
+        for start in range(0, len(series), block_size):
+            if not is_numeric(series.iloc[start:start + block_size]):
+                return "str"
+        return "float"
+
     @staticmethod
     def _is_url(data_path) -> bool:
         try:
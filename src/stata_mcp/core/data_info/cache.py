@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : cache.py
+
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+class SummaryCache:
+    """
+    SQLite cache of variable summaries, one row per (dataset fingerprint, variable, config).
+
+    `config` identifies how a summary was computed (metrics, max_display, decimal places),
+    so a request only reuses rows made the same way. Because variables are stored one by
+    one, a request for more variables reuses the cached ones and only computes the others.
+    Rows are evicted least recently used first once the cache grows over `max_bytes`.
+
+    Example:
+        >>> cache = SummaryCache("~/.statamcp/.cache/data_info.sqlite3")
+        >>> cache.put("c557a2db", "obs,mean|10|3", "auto.dta", 74, {"price": {...}})
+        >>> cache.get("c557a2db", "obs,mean|10|3", ["price", "mpg"])
+        (74, {'price': {...}})
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS datasets (
+            fingerprint TEXT PRIMARY KEY,
+            source TEXT,
+            obs INTEGER,
+            last_used REAL
+        );
+        CREATE TABLE IF NOT EXISTS variables (
+            fingerprint TEXT,
+            var TEXT,
+            config TEXT,
+            detail TEXT,
+            size INTEGER,
+            last_used REAL,
+            PRIMARY KEY (fingerprint, var, config)
+        );
+        CREATE INDEX IF NOT EXISTS variables_last_used ON variables (last_used);
+    """
+
+    def __init__(self, db_path: str | Path, max_bytes: int = 64 * 1024 * 1024):
+        self.db_path = Path(db_path).expanduser()
+        self.max_bytes = max_bytes
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(self.SCHEMA)
+
+    def get(self, fingerprint: str, config: str, vars_list: List[str]) -> Tuple[int | None, Dict[str, Any]]:
+        """
+        Look up the cached summaries of `vars_list`.
+
+        Returns:
+            Tuple[int | None, Dict[str, Any]]: the obs of the dataset (None if unknown) and
+                the details of the cached variables, missing variables are left out
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT obs FROM datasets WHERE fingerprint = ?", (fingerprint,)).fetchone()
+            if row is None:
+                return None, {}
+
+            found = {}
+            for start in range(0, len(vars_list), 500):  # Stay under the SQLite variable limit
+                batch = vars_list[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT var, detail FROM variables WHERE fingerprint = ? AND config = ? AND var IN ({placeholders})",
+                    (fingerprint, config, *batch)
+                ).fetchall()
+                found.update((var, json.loads(detail)) for var, detail in rows)
+
+            if found:
+                conn.executemany(
+                    "UPDATE variables SET last_used = ? WHERE fingerprint = ? AND var = ? AND config = ?",
+                    [(now, fingerprint, var, config) for var in found]
+                )
+                conn.execute("UPDATE datasets SET last_used = ? WHERE fingerprint = ?", (now, fingerprint))
+            return row[0], found
+
+    def put(self, fingerprint: str, config: str, source: str, obs: int, vars_detail: Dict[str, Any]):
+        """Store the summaries of some variables of a dataset, then evict if over budget."""
+        now = time.time()
+        rows = []
+        for var, detail in vars_detail.items():
+            payload = json.dumps(detail, ensure_ascii=False)
+            rows.append((fingerprint, var, config, payload, len(payload), now))
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO datasets (fingerprint, source, obs, last_used) VALUES (?, ?, ?, ?)",
+                (fingerprint, source, obs, now)
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO variables (fingerprint, var, config, detail, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM variables").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        removed, evicted = 0, []
+        for rowid, size in conn.execute("SELECT rowid, size FROM variables ORDER BY last_used"):
+            if removed >= excess:
+                break
+            evicted.append((rowid,))
+            removed += size
+        conn.executemany("DELETE FROM variables WHERE rowid = ?", evicted)
+        conn.execute("DELETE FROM datasets WHERE fingerprint NOT IN (SELECT DISTINCT fingerprint FROM variables)")
+        logging.debug(f"Evicted {len(evicted)} cached variable summaries ({removed} bytes)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")  # Readers are not blocked by a writer
+        return conn
@@ -7,7 +7,12 @@
 # @Email  : sepinetam@gmail.com
 # @File   : csv.py
 
+import codecs
+import csv
+from io import BytesIO, StringIO
+from itertools import islice
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
 
 import pandas as pd
 
@@ -18,6 +23,18 @@ class CsvDataInfo(DataInfoBase):
     """Data info handler for CSV and related delimited files."""
 
     supported_extensions = ['csv', 'tsv', 'psv']
+    supports_streaming = True
+
+    _is_prepared = False  # The dialect arguments are settled once per instance
+    _head_text = ""  # The first lines, decoded
+    _n_columns: int | None = None
+    _header_row: List[str] | None = None  # The variable names, when the first row is the header
+
+    SNIFF_BYTES = 64 * 1024  # Read once to settle the dialect
+    DELIMITERS = ",\t;|"
+    EXTENSION_DELIMITERS = {'.tsv': "\t", '.psv': "|"}
+    BOMS = [(codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16")]
+    SAMPLE_PROBE_BYTES = 1024 * 1024  # Read to estimate the length of a line
 
     def _read_data(self) -> pd.DataFrame:
         """
@@ -32,10 +49,104 @@ class CsvDataInfo(DataInfoBase):
             FileNotFoundError: If the file does not exist
             ValueError: If the file is not a valid CSV file
         """
-        self._before_read()
+        file_path = self._prepare_read()
+
+        # Only parse the requested columns
+        usecols = self.usecols
+
+        # Read the CSV file with error handling for invalid parameters
+        try:
+            df = pd.read_csv(file_path, usecols=usecols, **self.kwargs)
+        except TypeError as e:
+            if "unexpected keyword argument" in str(e):
+                # Filter out problematic parameters and retry with basic ones
+                basic_kwargs = {k: v for k, v in self.kwargs.items()
+                                if k in {'sep', 'header', 'encoding', 'names'}}
+                print(f"Warning: Retrying CSV read with filtered parameters due to: {e}")
+                df = pd.read_csv(file_path, usecols=usecols, **basic_kwargs)
+            else:
+                raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
+
+        return df
 
-        # Convert to Path object if it's a string
-        file_path = Path(self.data_path)
+    def _iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Read the selected columns `self.chunksize` rows at a time."""
+        file_path = self._prepare_read()
+        try:
+            with pd.read_csv(file_path, usecols=self.usecols, chunksize=self.chunksize, **self.kwargs) as reader:
+                yield from reader
+        except Exception as e:
+            raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
+
+    def _read_sample(self) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Sample blocks of lines at random byte offsets, the rest of the file is not read.
+
+        The number of rows is estimated from the mean length of the first lines. A block
+        starts at the line after its offset, so quoted values spanning several lines are
+        not supported; files no larger than the probe are sampled from all their rows.
+        """
+        file_path = self._prepare_read()
+        if self.kwargs['encoding'] == "utf-16":
+            return super()._read_sample()  # Lines are not split on single bytes
+        file_size = file_path.stat().st_size
+        read_kwargs = {k: v for k, v in self.kwargs.items() if k not in ('header', 'names')}
+
+        with open(file_path, "rb") as f:
+            if self.kwargs.get('header') is not None:
+                f.readline()
+            data_start = f.tell()
+            probe = f.read(self.SAMPLE_PROBE_BYTES)
+            if data_start + len(probe) >= file_size or not probe.count(b"\n"):
+                return super()._read_sample()
+
+            line_bytes = len(probe) / probe.count(b"\n")
+            population = max(round((file_size - data_start) / line_bytes), 1)
+            lines = []
+            for start, length in self._sample_blocks(population, self._sample_size(population)):
+                f.seek(data_start + int(start * line_bytes))
+                if start:
+                    f.readline()  # Skip to the next full line
+                for line in islice(f, length):
+                    lines.append(line if line.endswith(b"\n") else line + b"\n")
+
+        try:
+            frame = pd.read_csv(BytesIO(b"".join(lines)), header=None, names=self.columns,
+                                usecols=self.usecols, **read_kwargs)
+        except Exception as e:
+            raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
+        return frame, {"method": "block", "population": population, "population_estimated": True}
+
+    def _read_columns(self) -> List[str]:
+        """Read the variable names from the header line, parsed from the sniffed block."""
+        file_path = self._prepare_read()
+        if self.kwargs.get('names') is not None:
+            return list(self.kwargs['names'])
+
+        header_row = self._header_row
+        if header_row and all(header_row) and len(set(header_row)) == len(header_row):
+            return header_row  # pandas keeps such names as they are
+
+        kwargs = {k: v for k, v in self.kwargs.items() if k != 'encoding'}
+        try:
+            return list(pd.read_csv(StringIO(self._head_text), nrows=0, **kwargs).columns)
+        except Exception as e:
+            raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
+
+    def _prepare_read(self) -> Path:
+        """
+        Validate the file and settle the dialect arguments of `pd.read_csv`.
+
+        Only the first block of the file is read (see `_sniff`), the result is kept in
+        self.kwargs for the following reads.
+
+        Returns:
+            Path: The path of the CSV file
+        """
+        # The local file, a URL is downloaded first
+        file_path = self.local_path
 
         # Check if file exists
         if not file_path.exists():
@@ -43,78 +154,94 @@ class CsvDataInfo(DataInfoBase):
 
         # Check if it's a CSV file
         valid_extensions = {'.csv', '.txt', '.tsv', '.psv'}
-        if self.suffix.lower() not in valid_extensions:
-            raise ValueError(f"File must have extension in {valid_extensions}, got: {self.suffix}")
+        if file_path.suffix.lower() not in valid_extensions:
+            raise ValueError(f"File must have extension in {valid_extensions}, got: {file_path.suffix}")
+
+        if self._is_prepared:
+            return file_path
 
         try:
-            # Auto-detect header if not explicitly specified
-            if 'header' not in self.kwargs:
-                # Read first few lines to detect header
-                sample_kwargs = {k: v for k, v in self.kwargs.items() if k not in ['header', 'names']}
+            self._sniff(file_path)
+        except Exception as e:
+            raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
 
-                # Try reading with header=0 (assume first row is header)
-                try:
-                    df_with_header = pd.read_csv(file_path, nrows=10, header=0, **sample_kwargs)
-
-                    # Simple heuristic: check if column names look like data values
-                    # If column names are all numeric or look like data, probably no header
-                    column_names = df_with_header.columns.tolist()
-
-                    # Check if any column name looks like a data value (numeric)
-                    looks_like_data = False
-                    for col_name in column_names:
-                        # Try to convert column name to float
-                        try:
-                            float(str(col_name))
-                            looks_like_data = True
-                            break
-                        except (ValueError, TypeError):
-                            continue
-
-                    if looks_like_data:
-                        # Column names look like data values, so no header
-                        self.kwargs['header'] = None
-                    else:
-                        # Column names don't look like data, assume header exists
-                        self.kwargs['header'] = 0
-
-                except Exception:
-                    # If detection fails, default to header=0
-                    self.kwargs['header'] = 0
-
-            # Handle no-header case by providing default column names
-            if self.kwargs.get('header') is None:
-                # First, read a sample to determine number of columns
-                sample_kwargs = {k: v for k, v in self.kwargs.items() if k not in ['header', 'names']}
-                sample_df = pd.read_csv(file_path, nrows=1, header=None, **sample_kwargs)
-                num_cols = len(sample_df.columns)
-
-                # Generate default column names
-                self.kwargs['names'] = [f'V{i+1}' for i in range(num_cols)]
-
-            # Read the CSV file with error handling for invalid parameters
-            try:
-                df = pd.read_csv(file_path, **self.kwargs)
-            except TypeError as e:
-                if "unexpected keyword argument" in str(e):
-                    # Filter out problematic parameters and retry with basic ones
-                    basic_kwargs = {k: v for k, v in self.kwargs.items()
-                                    if k in {'sep', 'header', 'encoding', 'names'}}
-                    print(f"Warning: Retrying CSV read with filtered parameters due to: {e}")
-                    df = pd.read_csv(file_path, **basic_kwargs)
-                else:
-                    raise
-            except Exception as e:
-                raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
+        self._is_prepared = True
+        return file_path
 
-            return df
+    def _sniff(self, file_path: Path):
+        """
+        Work out the encoding, delimiter, quoting, header and column count from one read of the first block.
 
-        except Exception as e:
-            raise ValueError(f"Error reading CSV file {file_path}: {str(e)}")
+        - encoding: from the byte order mark, else the first of `self.encoding`, UTF-8,
+          cp1252 and latin-1 which decodes the block
+        - delimiter: `.tsv` and `.psv` by extension, else sniffed among , tab ; |
+        - header: none if a field of the first row is a number (then named V1, V2, ...)
 
-    def _before_read(self):
-        if "sep" in self.kwargs and self.kwargs.get("sep") is None:
-            if self.suffix.lower() == ".tsv":
-                self.kwargs["sep"] = "\t"
-            elif self.suffix.lower() == ".psv":
-                self.kwargs["sep"] = "|"
+        Arguments given by the caller (encoding, sep, quotechar, header, names) are kept.
+        """
+        with open(file_path, "rb") as f:
+            head = f.read(self.SNIFF_BYTES)
+            while b"\n" not in head and (more := f.read(self.SNIFF_BYTES)):
+                head += more  # At least the whole first line
+            is_whole = not f.read(1)
+
+        encoding = self.kwargs.get('encoding') or self._detect_encoding(head)
+        text = head.decode(encoding, errors="ignore")
+        if not is_whole and "\n" in text:
+            text = text[:text.rindex("\n") + 1]  # Complete lines only
+        self._head_text = text
+        self.kwargs['encoding'] = encoding
+
+        if self.kwargs.get('sep') is None:
+            self.kwargs.pop('sep', None)
+            suffix = file_path.suffix.lower()
+            if suffix in self.EXTENSION_DELIMITERS:
+                self.kwargs['sep'] = self.EXTENSION_DELIMITERS[suffix]
+            else:
+                try:
+                    lines = "".join(islice(StringIO(text), 20))  # The sniffer is slow on long texts
+                    dialect = csv.Sniffer().sniff(lines, delimiters=self.DELIMITERS)
+                    self.kwargs['sep'] = dialect.delimiter
+                    if dialect.quotechar != '"':
+                        self.kwargs.setdefault('quotechar', dialect.quotechar)
+                except csv.Error:
+                    self.kwargs['sep'] = ","
+
+        sep = self.kwargs['sep']
+        if not isinstance(sep, str) or len(sep) != 1:
+            return  # A regular expression, pandas settles the rest
+
+        first_row = next(csv.reader(StringIO(text), delimiter=sep, quotechar=self.kwargs.get('quotechar', '"')), [])
+        self._n_columns = len(first_row)
+
+        if 'header' not in self.kwargs:
+            # Column names which look like data values (numbers) mean there is no header
+            self.kwargs['header'] = None if any(self._is_number(value) for value in first_row) else 0
+
+        if self.kwargs.get('header') == 0 and not self.kwargs.keys() & {'names', 'skiprows', 'comment'}:
+            self._header_row = first_row
+
+        if self.kwargs.get('header') is None and self.kwargs.get('names') is None:
+            self.kwargs['names'] = [f'V{i+1}' for i in range(self._n_columns)]
+
+    def _detect_encoding(self, head: bytes) -> str:
+        for bom, encoding in self.BOMS:
+            if head.startswith(bom):
+                return encoding
+
+        complete = head[:head.rfind(b"\n") + 1] or head  # A character may be cut at the end
+        for encoding in dict.fromkeys([self.encoding, "utf-8", "cp1252", "latin-1"]):
+            try:
+                complete.decode(encoding)
+                return encoding
+            except (UnicodeDecodeError, LookupError):
+                continue
+        return "latin-1"
+
+    @staticmethod
+    def _is_number(value: str) -> bool:
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
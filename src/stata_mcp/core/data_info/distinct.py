@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : distinct.py
+
+"""
+Seeded bottom-k sketch of the distinct values of a variable.
+
+Every value is hashed with a fixed key and the sketch keeps the k distinct values with the
+smallest hashes: a uniform random sample of the distinct values which depends neither on
+the run nor on the order of the rows, so a summary is reproducible (and cacheable). The
+k-th smallest hash estimates the number of distinct values, with a relative standard
+error of about 1 / sqrt(k - 2).
+"""
+
+from typing import Any, List
+
+import numpy as np
+import pandas as pd
+
+HASH_SPACE = 2.0 ** 64
+DISTINCT_SKETCH_SIZE = 1024  # Values kept per variable, the cardinality is then within about 3%
+
+
+class DistinctSketch:
+    """
+    The k distinct values with the smallest hashes, in bounded memory whatever the cardinality.
+
+    Example:
+        >>> sketch = DistinctSketch(k=1024)
+        >>> sketch.update(pd.Series(["a", "b", "a"]))
+        >>> sketch.cardinality, sketch.sample(10)
+        (2, ['a', 'b'])
+    """
+
+    def __init__(self, k: int = DISTINCT_SKETCH_SIZE, seed: int = 0):
+        self.k = k
+        self.hash_key = f"stata-mcp{seed:07d}"  # pandas takes a key of 16 characters
+        self.hashes = np.empty(0, dtype="uint64")  # Sorted, distinct
+        self.values: List[Any] = []  # The value of each hash
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether every distinct value is kept, the cardinality is then a count."""
+        return len(self.hashes) < self.k
+
+    @property
+    def cardinality(self) -> int:
+        if self.is_exact:
+            return len(self.hashes)
+        return int(round((self.k - 1) * HASH_SPACE / (float(self.hashes[-1]) + 1)))
+
+    def update(self, values: pd.Series):
+        if not len(values):
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False, hash_key=self.hash_key).to_numpy()
+        if not self.is_exact:
+            below = hashes < self.hashes[-1]  # Most values of a long variable are dropped here
+            hashes, values = hashes[below], values[below]
+
+        first = ~pd.Series(hashes).duplicated().to_numpy()
+        hashes, positions = hashes[first], np.flatnonzero(first)
+        if len(hashes) > self.k:
+            smallest = np.argpartition(hashes, self.k)[:self.k]
+            hashes, positions = hashes[smallest], positions[smallest]
+        self._merge(hashes, values.iloc[positions].tolist())
+
+    def merge(self, other: "DistinctSketch"):
+        self._merge(other.hashes, other.values)
+
+    def sample(self, n: int) -> List[str]:
+        """Get `n` distinct values as text, sorted: the same ones on every run."""
+        return sorted(pd.Series(self.values[:n]).astype(str).tolist())
+
+    def _merge(self, hashes: np.ndarray, values: List[Any]):
+        hashes = np.concatenate([self.hashes, hashes])
+        values = self.values + values
+        hashes, first = np.unique(hashes, return_index=True)
+        self.hashes = hashes[:self.k]
+        self.values = [values[i] for i in first[:self.k]]
@@ -7,19 +7,80 @@
 # @Email  : sepinetam@gmail.com
 # @File   : dta.py
 
-from io import BytesIO
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
 
 import pandas as pd
-import requests
 
 from .base import DataInfoBase
+from .dta_header import DtaHeader, DtaRows, read_dta_header
 
 
 class DtaDataInfo(DataInfoBase):
-    """Data info handler for Stata .dta files."""
+    """
+    Data info handler for Stata .dta files.
+
+    The variable names, the number of observations and the storage types come from the
+    header only (see `describe`). The data section is decoded in chunks of about
+    CHUNK_BYTES, keeping only the needed variables, and fed to the streaming
+    accumulators for files above the streaming threshold.
+    """
 
     supported_extensions = ['dta']
+    supports_streaming = True
+
+    READ_OPTIONS = {
+        "convert_categoricals": False,  # disable change data to mapped str.
+        "convert_dates": True,
+        "convert_missing": False,
+        "preserve_dtypes": True,
+    }
+    CHUNK_BYTES = 32 * 1024 * 1024  # Raw records decoded at once by a chunked read
+
+    _header: DtaHeader | None = None  # Memoized per instance
+
+    @property
+    def header(self) -> DtaHeader:
+        """Get the header of the .dta file, it is read on first access only."""
+        if self._header is None:
+            file_path = self._check_file()
+            try:
+                self._header = read_dta_header(file_path)
+            except Exception as e:
+                raise ValueError(f"Error reading Stata file {self.data_path}: {str(e)}")
+        return self._header
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the selected variables from the header, without reading any data.
+
+        Returns:
+            Dict[str, Any]: the obs, the data label and, per variable, the type it has in a
+                summary, the Stata storage type, format, value label and variable label
+
+        Examples:
+            >>> DtaDataInfo("/Applications/Stata/auto.dta", ["make", "price"]).describe()
+            {
+                "source": "/Applications/Stata/auto.dta",
+                "obs": 74,
+                "data_label": "1978 automobile data",
+                "var_numbers": 2,
+                "vars_detail": {
+                    "make": {"type": "str", "storage": "str18", "format": "%-18s",
+                             "value_label": "", "label": "Make and model"},
+                    "price": {"type": "float", "storage": "int", "format": "%8.0gc",
+                              "value_label": "", "label": "Price"}
+                }
+            }
+        """
+        variables = self.header.describe()
+        return {
+            "source": self.data_source,
+            "obs": self.header.obs,
+            "data_label": self.header.data_label,
+            "var_numbers": len(self.vars_list),
+            "vars_detail": {var_name: variables[var_name] for var_name in self.vars_list},
+        }
 
     def _read_data(self) -> pd.DataFrame:
         """
@@ -32,45 +93,69 @@ class DtaDataInfo(DataInfoBase):
             FileNotFoundError: If the file does not exist
             ValueError: If the file is not a valid Stata file
         """
-        # Check if it's a URL first
-        if self.is_url:
-            # For URLs, validate the file extension from the URL string
-            from urllib.parse import urlparse
-            parsed_url = urlparse(str(self.data_path))
-            url_path = parsed_url.path
-            if not url_path.lower().endswith('.dta'):
-                raise ValueError(f"URL must point to a .dta file, got: {url_path}")
-            file_path = None  # Not used for URLs
-        else:
-            # For local files, convert to Path object and validate
-            file_path = Path(self.data_path)
-
-            # Check if file exists
-            if not file_path.exists():
-                raise FileNotFoundError(f"Stata file not found: {file_path}")
-
-            # Check if it's a .dta file
-            if file_path.suffix.lower() != '.dta':
-                raise ValueError(f"File must have .dta extension, got: {file_path.suffix}")
+        file_path = self._check_file()
 
         try:
             # Read the Stata file
             # Using read_stata with convert_categoricals=False to avoid converting labels to categories
-            # This preserves the original data structure without converting value labels
-            buffer = None
-            if self.is_url:
-                resp = requests.get(self.data_path)
-                resp.raise_for_status()
-                buffer = BytesIO(resp.content)
+            # This preserves the original data structure without converting value labels (READ_OPTIONS)
+            usecols = self.usecols
+            if usecols is not None:
+                return self._read_projected(file_path, usecols)
 
             df = pd.read_stata(
-                buffer or file_path,
-                convert_categoricals=False,  # disable change data to mapped str.
-                convert_dates=True,
-                convert_missing=False,
-                preserve_dtypes=True
+                file_path,
+                **self.READ_OPTIONS
             )
             return df
 
         except Exception as e:
             raise ValueError(f"Error reading Stata file {self.data_path}: {str(e)}")
+
+    def _read_projected(self, file_path: Path, usecols: List[str]) -> pd.DataFrame:
+        """
+        Read only `usecols` from the .dta file.
+
+        `pd.read_stata(columns=...)` decodes every record before selecting the columns, so the
+        records are decoded in chunks of about CHUNK_BYTES and only the projection is kept.
+        """
+        chunks = list(self._read_chunks(file_path, usecols, self.CHUNK_BYTES // max(self.header.row_width, 1)))
+        if not chunks:
+            return pd.DataFrame(columns=usecols)
+        return pd.concat(chunks, ignore_index=True)
+
+    def _iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Read the variables in `self.usecols` chunk by chunk, at most CHUNK_BYTES of records each."""
+        rows = min(self.chunksize, self.CHUNK_BYTES // max(self.header.row_width, 1))
+        try:
+            yield from self._read_chunks(self._check_file(), self.usecols, rows)
+        except Exception as e:
+            raise ValueError(f"Error reading Stata file {self.data_path}: {str(e)}")
+
+    def _read_chunks(self, file_path: Path, usecols: List[str] | None, chunksize: int) -> Iterator[pd.DataFrame]:
+        with pd.read_stata(file_path, columns=usecols, chunksize=max(1, chunksize), **self.READ_OPTIONS) as reader:
+            yield from reader
+
+    def _count_rows(self) -> int | None:
+        return self.header.obs
+
+    def _read_blocks(self, blocks: List[Tuple[int, int]]) -> pd.DataFrame:
+        """Read the blocks of rows of the variables in `self.usecols`, the records in between are not read."""
+        try:
+            with DtaRows(self._check_file(), self.header, blocks) as rows:
+                return pd.read_stata(rows, columns=self.usecols, **self.READ_OPTIONS).reset_index(drop=True)
+        except Exception as e:
+            raise ValueError(f"Error reading Stata file {self.data_path}: {str(e)}")
+
+    def _read_columns(self) -> List[str]:
+        """Read the variable names from the header of the .dta file, the data section is not touched."""
+        return self.header.varlist
+
+    def _check_file(self) -> Path:
+        """Get the local .dta file (a URL is downloaded first) after checking it."""
+        file_path = self.local_path
+        if not file_path.exists():
+            raise FileNotFoundError(f"Stata file not found: {file_path}")
+        if file_path.suffix.lower() != '.dta':
+            raise ValueError(f"File must have .dta extension, got: {file_path.suffix}")
+        return file_path
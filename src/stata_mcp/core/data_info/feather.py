@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : feather.py
+
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import pandas as pd
+
+from .base import DataInfoBase
+from .parquet import require_pyarrow, split_blocks
+
+
+class FeatherDataInfo(DataInfoBase):
+    """
+    Data info handler for Feather (Arrow IPC) files.
+
+    The file is memory-mapped: the schema and the number of rows come from the file
+    metadata, and only the needed columns of each record batch are converted to pandas.
+    """
+
+    supported_extensions = ['feather', 'arrow', 'ipc']
+    supports_streaming = True
+
+    _batch_rows: List[int] | None = None  # Memoized per instance
+
+    def _read_data(self) -> pd.DataFrame:
+        """
+        Read the Feather file (the columns in `self.usecols`) into pandas DataFrame.
+
+        Returns:
+            pd.DataFrame: The data from the Feather file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a valid Feather file
+        """
+        require_pyarrow("Feather")
+        import pyarrow.feather as feather
+
+        file_path = self._check_file()
+        try:
+            return feather.read_table(file_path, columns=self.usecols, memory_map=True).to_pandas()
+        except Exception as e:
+            raise ValueError(f"Error reading Feather file {file_path}: {str(e)}")
+
+    def _read_columns(self) -> List[str]:
+        """Read the variable names from the schema, no record batch is read."""
+        with self._open() as reader:
+            return list(reader.schema.names)
+
+    def _iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Read the columns in `self.usecols` one record batch at a time."""
+        with self._open() as reader:
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                if self.usecols is not None:
+                    batch = batch.select(self.usecols)
+                yield batch.to_pandas()
+
+    @property
+    def batch_rows(self) -> List[int]:
+        """Get the rows of every record batch, without any copy unless the file is compressed."""
+        if self._batch_rows is None:
+            with self._open() as reader:
+                self._batch_rows = [reader.get_batch(i).num_rows for i in range(reader.num_record_batches)]
+        return self._batch_rows
+
+    def _count_rows(self) -> int | None:
+        return sum(self.batch_rows)
+
+    def _read_blocks(self, blocks: List[Tuple[int, int]]) -> pd.DataFrame:
+        """Read the record batches holding the blocks of rows, each once, and slice the blocks out."""
+        import pyarrow as pa
+
+        slices_of = split_blocks(blocks, self.batch_rows)
+        with self._open() as reader:
+            batches = []
+            for i, slices in slices_of.items():
+                batch = reader.get_batch(i)
+                if self.usecols is not None:
+                    batch = batch.select(self.usecols)
+                batches.extend(batch.slice(start, length) for start, length in slices)
+            if not batches:
+                schema = reader.schema if self.usecols is None else pa.schema([reader.schema.field(n) for n in self.usecols])
+                return schema.empty_table().to_pandas()
+            return pa.Table.from_batches(batches).to_pandas()
+
+    def _open(self):
+        require_pyarrow("Feather")
+        import pyarrow as pa
+
+        file_path = self._check_file()
+        try:
+            return pa.ipc.open_file(pa.memory_map(str(file_path), "r"))
+        except Exception as e:
+            raise ValueError(f"Error reading Feather file {file_path} (only Feather V2 is supported): {str(e)}")
+
+    def _check_file(self) -> Path:
+        file_path = self.local_path
+        if not file_path.exists():
+            raise FileNotFoundError(f"Feather file not found: {file_path}")
+        if file_path.suffix.lower().strip(".") not in self.supported_extensions:
+            raise ValueError(f"File must have extension in {self.supported_extensions}, got: {file_path.suffix}")
+        return file_path
@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : fingerprint.py
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict
+
+FINGERPRINT_MODES = ("stat", "sample", "full")
+
+
+class FileFingerprint:
+    """
+    Cheap, memoized fingerprints of data files, used as data-info cache keys.
+
+    Three tiers, from cheap to exact:
+        - stat: (size, mtime_ns, inode), no byte of the file is read; the default, any
+          write to the file changes it
+        - sample: size plus `sample_blocks` blocks spread over the file, so a copied or
+          touched but unchanged file keeps its fingerprint; an in-place edit of the same
+          size outside the sampled blocks is missed
+        - full: every byte, streamed through a `buffer_size` buffer
+
+    Digests are BLAKE2b (128 bits). They are memoized in a sidecar index next to the cache,
+    together with the stat of the file, so an unchanged file costs one `stat()` call.
+
+    Example:
+        >>> fingerprint = FileFingerprint("~/.statamcp/.cache", mode="stat")
+        >>> fingerprint.fingerprint("/Applications/Stata/auto.dta")
+        '3f1c0a2e9b7d4c5a8e6f1b2d3c4a5e6f'
+    """
+
+    INDEX_FILE = "fingerprints.json"
+    MAX_ENTRIES = 512
+
+    # Indexes loaded in this process, keyed by the path of their sidecar file
+    _indexes: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self,
+                 index_dir: str | Path,
+                 mode: str = "stat",
+                 sample_blocks: int = 16,
+                 block_size: int = 64 * 1024,
+                 buffer_size: int = 1024 * 1024):
+        """
+        Initialize the fingerprinter.
+
+        Args:
+            index_dir: Directory of the sidecar index
+            mode: One of FINGERPRINT_MODES
+            sample_blocks: Number of blocks hashed in "sample" mode
+            block_size: Size of each sampled block (in bytes)
+            buffer_size: Size of the read buffer in "full" mode (in bytes)
+        """
+        if mode not in FINGERPRINT_MODES:
+            raise ValueError(f"Fingerprint mode must be one of {FINGERPRINT_MODES}, got: {mode}")
+
+        self.index_file = Path(index_dir).expanduser() / self.INDEX_FILE
+        self.mode = mode
+        self.sample_blocks = max(2, sample_blocks)
+        self.block_size = block_size
+        self.buffer_size = buffer_size
+
+    def fingerprint(self, path: str | Path) -> str:
+        """
+        Get the fingerprint of a file, computed only if the file changed since the last call.
+
+        Returns:
+            str: hex digest of the file in the current mode
+        """
+        path = Path(path).resolve()
+        st = os.stat(path)
+        key = str(path)
+
+        with self._lock:
+            index = self._load_index()
+            entry = index.get(key)
+            if (entry is not None and entry.get("mode") == self.mode
+                    and entry.get("size") == st.st_size
+                    and entry.get("mtime_ns") == st.st_mtime_ns
+                    and entry.get("inode") == st.st_ino):
+                index.move_to_end(key)
+                return entry["digest"]
+
+        digest = self._compute(path, st)
+
+        with self._lock:
+            index = self._load_index()
+            index[key] = {
+                "mode": self.mode,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "inode": st.st_ino,
+                "digest": digest,
+            }
+            index.move_to_end(key)
+            while len(index) > self.MAX_ENTRIES:
+                index.popitem(last=False)
+            self._save_index(index)
+        return digest
+
+    def _compute(self, path: Path, st: os.stat_result) -> str:
+        hasher = hashlib.blake2b(digest_size=16)
+
+        if self.mode == "stat":
+            hasher.update(f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}".encode())
+            return hasher.hexdigest()
+
+        size = st.st_size
+        if self.mode == "sample" and size > self.sample_blocks * self.block_size:
+            # First and last block always, the others evenly spaced in between
+            hasher.update(str(size).encode())
+            step = (size - self.block_size) / (self.sample_blocks - 1)
+            with open(path, "rb") as f:
+                for i in range(self.sample_blocks):
+                    f.seek(int(i * step))
+                    hasher.update(f.read(self.block_size))
+            return hasher.hexdigest()
+
+        # Full mode, or a file small enough to be hashed as a whole
+        buffer = bytearray(self.buffer_size)
+        view = memoryview(buffer)
+        with open(path, "rb", buffering=0) as f:
+            while n := f.readinto(buffer):
+                hasher.update(view[:n])
+        return hasher.hexdigest()
+
+    def _load_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        key = str(self.index_file)
+        index = self._indexes.get(key)
+        if index is None:
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    index = OrderedDict(json.load(f))
+            except FileNotFoundError:
+                index = OrderedDict()
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable fingerprint index {self.index_file}: {str(e)}")
+                index = OrderedDict()
+            self._indexes[key] = index
+        return index
+
+    def _save_index(self, index: "OrderedDict[str, Dict[str, Any]]"):
+        tmp_file = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            logging.warning(f"Failed to save fingerprint index {self.index_file}: {str(e)}")
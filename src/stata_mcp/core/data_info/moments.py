@@ -0,0 +1,220 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : moments.py
+
+import warnings
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Order of the keys in a numeric summary
+NUMERIC_METRICS = ["obs", "mean", "stderr", "min", "max", "q1", "med", "q3", "skewness", "kurtosis"]
+QUANTILE_METRICS = {"q1": 0.25, "med": 0.5, "q3": 0.75}
+
+
+def moment_stats(n, m2, m3=None, m4=None) -> Dict[str, np.ndarray]:
+    """
+    Standard error, skewness and kurtosis from the count and the sums of centered powers.
+
+    Works on scalars or arrays (one item per variable). Skewness and kurtosis follow
+    pandas: the adjusted Fisher-Pearson skewness and the unbiased excess kurtosis, 0 for
+    a constant variable, NaN when there are too few values.
+
+    Args:
+        n: number of values
+        m2, m3, m4: sums of the 2nd, 3rd and 4th powers of the deviations from the mean
+
+    Returns:
+        Dict[str, np.ndarray]: "stderr", and "skewness" / "kurtosis" if m3 / m4 are given
+    """
+    n = np.asarray(n, dtype="float64")
+    m2 = np.asarray(m2, dtype="float64")
+    stats = {}
+    with np.errstate(all="ignore"):
+        stats["stderr"] = np.where(n > 1, np.sqrt(m2 / (n - 1)) / np.sqrt(n), np.nan)
+        if m3 is not None:
+            m3 = np.asarray(m3, dtype="float64")
+            skewness = np.sqrt(n * (n - 1)) / (n - 2) * (m3 / n) / (m2 / n) ** 1.5
+            stats["skewness"] = np.where(n < 3, np.nan, np.where(m2 == 0, 0.0, skewness))
+        if m4 is not None:
+            m4 = np.asarray(m4, dtype="float64")
+            kurtosis = (n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 ** 2)
+                        - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)))
+            stats["kurtosis"] = np.where(n < 4, np.nan, np.where(m2 == 0, 0.0, kurtosis))
+    return stats
+
+
+def _column_quantiles(values: np.ndarray, count: np.ndarray, qs: List[float]) -> np.ndarray:
+    """
+    Quantiles of every column with linear interpolation (as pandas), ignoring NaN.
+
+    `np.nanquantile` falls back to one call per column when there is an axis, so the
+    columns are sorted at once (NaN last) and the quantiles are read at their positions.
+    """
+    if not values.size:
+        return np.full((len(qs), values.shape[1]), np.nan)
+
+    ordered = np.sort(values, axis=0)
+    position = np.outer(qs, np.maximum(count - 1, 0))
+    lower = np.floor(position).astype(np.intp)
+    upper = np.ceil(position).astype(np.intp)
+    low_values = np.take_along_axis(ordered, lower, axis=0)
+    high_values = np.take_along_axis(ordered, upper, axis=0)
+    quantiles = low_values + (high_values - low_values) * (position - lower)
+    return np.where(count > 0, quantiles, np.nan)
+
+
+def float_matrix(frame: pd.DataFrame, values: np.ndarray | None = None) -> np.ndarray:
+    """
+    Stack the columns in one float matrix, NaN for missing (object columns are coerced with pd.to_numeric).
+
+    The matrix is column-major, so every column is contiguous for the fill and the reductions;
+    `values` is an array of that shape to fill (e.g. in shared memory), a new one by default.
+    """
+    if values is None:
+        values = np.empty((len(frame), len(frame.columns)), dtype="float64", order="F")
+    for i in range(len(frame.columns)):
+        series = frame.iloc[:, i]
+        if not pd.api.types.is_numeric_dtype(series):
+            series = pd.to_numeric(series, errors="coerce")
+        values[:, i] = series.to_numpy(dtype="float64", na_value=np.nan)
+    return values
+
+
+def summarize_numeric_frame(frame: pd.DataFrame,
+                            metrics: List[str],
+                            decimal_places: int = 3) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute the numeric metrics of every column of `frame` at once.
+
+    The columns are stacked in one float matrix and each statistic is a single
+    column-wise NumPy reduction: one quantile call for all the quartiles, and the
+    standard error, skewness and kurtosis from shared sums of centered powers.
+    Only the metrics listed in `metrics` are computed ("obs" is always kept).
+
+    Args:
+        frame: the numeric variables (object columns are coerced with pd.to_numeric)
+        metrics: metrics to compute, from NUMERIC_METRICS
+        decimal_places: rounding of the results
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {column: {"obs": ..., "mean": ..., ...}}
+    """
+    return summarize_numeric_matrix(float_matrix(frame), list(frame.columns), metrics, decimal_places)
+
+
+def summarize_numeric_matrix(values: np.ndarray,
+                             columns: List[Any],
+                             metrics: List[str],
+                             decimal_places: int = 3) -> Dict[Any, Dict[str, Any]]:
+    """Compute the numeric metrics of every column of a float matrix (NaN for missing), see summarize_numeric_frame."""
+    wanted = set(metrics) | {"obs"}
+
+    mask = ~np.isnan(values)
+    count = mask.sum(axis=0)
+    results: Dict[str, np.ndarray] = {"obs": count}
+
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # Columns without any value
+
+        if wanted & {"mean", "stderr", "skewness", "kurtosis"}:
+            mean = np.nansum(values, axis=0) / count
+            results["mean"] = mean
+
+            deviations = values - mean
+            deviations[~mask] = 0.0
+            squares = deviations * deviations
+            moments = moment_stats(
+                count,
+                squares.sum(axis=0),
+                (squares * deviations).sum(axis=0) if "skewness" in wanted else None,
+                (squares * squares).sum(axis=0) if "kurtosis" in wanted else None,
+            )
+            results.update(moments)
+
+        if "min" in wanted:
+            results["min"] = np.nanmin(values, axis=0) if len(values) else np.full(len(columns), np.nan)
+        if "max" in wanted:
+            results["max"] = np.nanmax(values, axis=0) if len(values) else np.full(len(columns), np.nan)
+
+        quantile_metrics = [m for m in QUANTILE_METRICS if m in wanted]
+        if quantile_metrics:
+            qs = [QUANTILE_METRICS[m] for m in quantile_metrics]
+            results.update(zip(quantile_metrics, _column_quantiles(values, count, qs)))
+
+    keys = [m for m in NUMERIC_METRICS if m in wanted and m in results]
+    summaries = {}
+    for i, column in enumerate(columns):
+        summaries[column] = {
+            key: int(results[key][i]) if key == "obs" else round(float(results[key][i]), decimal_places)
+            for key in keys
+        }
+    return summaries
+
+
+def sample_intervals(frame: pd.DataFrame,
+                     metrics: List[str],
+                     decimal_places: int = 3,
+                     z: float = 1.96) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Approximate confidence intervals of the mean and the quartiles, from a sample of the data.
+
+    The mean uses the normal approximation (mean +/- z * stderr). The quartiles use the
+    distribution-free interval between the order statistics of ranks n*p +/- z*sqrt(n*p*(1-p)).
+    Both assume a simple random sample, so they are a little narrow for a block sample
+    of a file sorted on the variable.
+
+    Args:
+        frame: the numeric variables of the sample
+        metrics: metrics of the summary, intervals are given for mean, q1, med and q3 among them
+        decimal_places: rounding of the results
+        z: quantile of the normal distribution, 1.96 for 95% intervals
+
+    Returns:
+        Dict[str, Dict[str, List[float]]]: {column: {"mean": [low, high], "q1": [low, high], ...}}
+    """
+    wanted = [m for m in ["mean", *QUANTILE_METRICS] if m in metrics]
+    columns = list(frame.columns)
+    intervals: Dict[str, Dict[str, List[float]]] = {column: {} for column in columns}
+    if not wanted or not len(frame):
+        return intervals
+
+    values = float_matrix(frame)
+    mask = ~np.isnan(values)
+    count = mask.sum(axis=0)
+    bounds: Dict[str, tuple] = {}
+
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # Columns without any value
+
+        if "mean" in wanted:
+            mean = np.nansum(values, axis=0) / count
+            deviations = np.where(mask, values - mean, 0.0)
+            half_width = z * moment_stats(count, (deviations * deviations).sum(axis=0))["stderr"]
+            bounds["mean"] = (mean - half_width, mean + half_width)
+
+        quantile_metrics = [m for m in wanted if m in QUANTILE_METRICS]
+        if quantile_metrics:
+            ordered = np.sort(values, axis=0)  # NaN last
+            last = np.maximum(count - 1, 0)
+            for m in quantile_metrics:
+                p = QUANTILE_METRICS[m]
+                spread = z * np.sqrt(count * p * (1 - p))
+                low = np.clip(np.floor(count * p - spread) - 1, 0, last).astype(np.intp)
+                high = np.clip(np.ceil(count * p + spread) - 1, 0, last).astype(np.intp)
+                bounds[m] = tuple(
+                    np.where(count > 0, np.take_along_axis(ordered, rank[None, :], axis=0)[0], np.nan)
+                    for rank in (low, high)
+                )
+
+    for i, column in enumerate(columns):
+        for m, (low, high) in bounds.items():
+            if np.isfinite(low[i]) and np.isfinite(high[i]):
+                intervals[column][m] = [round(float(low[i]), decimal_places), round(float(high[i]), decimal_places)]
+    return intervals
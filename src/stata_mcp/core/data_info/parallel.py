@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : parallel.py
+
+"""
+Process pool for the numeric summaries of wide datasets.
+
+The float matrix of the numeric variables is built once in shared memory, column-major,
+so the columns of a worker are one contiguous slice: workers attach to the block by its
+name, and only the column range and the (small) results are pickled.
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .moments import float_matrix, summarize_numeric_matrix
+
+# Below this number of values the pool costs more than it saves
+MIN_CELLS = 1_000_000
+
+# Workers are never forked from the server, whose threads (Stata pool, scheduler) could hold
+# locks at fork time: they start from a clean forkserver process, or are spawned on Windows
+START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# The pool is kept between summaries, the workers import NumPy only once
+_executor: ProcessPoolExecutor | None = None
+_executor_workers = 0
+
+
+def _reset_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """Get the shared process pool, created again when the number of workers changes."""
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != workers:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(START_METHOD))
+        _executor_workers = workers
+    return _executor
+
+
+def summarize_numeric_parallel(frame: pd.DataFrame,
+                               metrics: List[str],
+                               decimal_places: int = 3,
+                               workers: int = 2) -> Dict[str, Dict[str, Any]]:
+    """
+    Same as summarize_numeric_frame, with the columns split across `workers` processes.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {column: {"obs": ..., "mean": ..., ...}}, in the column order
+    """
+    columns = list(frame.columns)
+    shape = (len(frame), len(columns))
+    bounds = np.linspace(0, len(columns), min(workers, len(columns)) + 1).astype(int)
+    ranges = [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    shm = SharedMemory(create=True, size=max(shape[0] * shape[1] * 8, 1))
+    try:
+        values = float_matrix(frame, np.ndarray(shape, dtype="float64", buffer=shm.buf, order="F"))
+        try:
+            executor = get_executor(workers)
+            futures = [
+                executor.submit(_summarize_columns, shm.name, shape, column_range, metrics, decimal_places)
+                for column_range in ranges
+            ]
+            results = [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            logging.warning(f"Process pool failed ({e}), summarizing the columns in this process")
+            _reset_executor()
+            results = [list(summarize_numeric_matrix(values, columns, metrics, decimal_places).values())]
+            ranges = [(0, len(columns))]
+    finally:
+        values = None  # Release the buffer before closing
+        shm.close()
+        shm.unlink()
+
+    summaries = {}
+    for (start, stop), result in zip(ranges, results):
+        summaries.update(zip(columns[start:stop], result))
+    return summaries
+
+
+def _summarize_columns(name: str,
+                       shape: Tuple[int, int],
+                       column_range: Tuple[int, int],
+                       metrics: List[str],
+                       decimal_places: int) -> List[Dict[str, Any]]:
+    """Worker: summarize the columns start ... stop - 1 of the shared matrix."""
+    start, stop = column_range
+    shm = SharedMemory(name=name)
+    try:
+        values = np.ndarray(shape, dtype="float64", buffer=shm.buf, order="F")[:, start:stop]
+        summaries = summarize_numeric_matrix(values, list(range(stop - start)), metrics, decimal_places)
+        return list(summaries.values())
+    finally:
+        values = None  # Release the buffer before closing
+        shm.close()
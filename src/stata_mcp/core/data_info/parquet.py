@@ -0,0 +1,203 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : parquet.py
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pandas as pd
+
+from .base import DataInfoBase
+
+
+def require_pyarrow(file_format: str):
+    """Import pyarrow, which is an optional dependency (`pip install stata-mcp[arrow]`)."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(f"Reading {file_format} files requires pyarrow, "
+                          f"install it with `pip install stata-mcp[arrow]`")
+
+
+def split_blocks(blocks: List[Tuple[int, int]], part_rows: List[int]) -> Dict[int, List[Tuple[int, int]]]:
+    """
+    Split blocks of rows over the parts of a file (row groups, record batches).
+
+    Returns:
+        Dict[int, List[Tuple[int, int]]]: {part: [(start row in the part, number of rows), ...]},
+            the parts in file order, so each part is read once
+    """
+    part_starts = [0]
+    for rows in part_rows:
+        part_starts.append(part_starts[-1] + rows)
+
+    slices: Dict[int, List[Tuple[int, int]]] = {}
+    part = 0
+    for start, length in blocks:
+        end = min(start + length, part_starts[-1])
+        while start < end:
+            while part_starts[part + 1] <= start:
+                part += 1
+            take = min(end, part_starts[part + 1]) - start
+            slices.setdefault(part, []).append((start - part_starts[part], take))
+            start += take
+    return slices
+
+
+class ParquetDataInfo(DataInfoBase):
+    """
+    Data info handler for Parquet files.
+
+    The variable names and the number of rows come from the file footer. With `metadata_only`,
+    integer and boolean variables are summarized (obs, min and max) from the row-group
+    statistics without reading any data; otherwise only the needed columns are read,
+    memory-mapped, and in record batches in streaming mode.
+    """
+
+    supported_extensions = ['parquet', 'pq']
+    supports_streaming = True
+
+    @property
+    def parquet_file(self):
+        """Get the pyarrow ParquetFile, only the footer is read."""
+        require_pyarrow("Parquet")
+        import pyarrow.parquet as pq
+
+        file_path = self._check_file()
+        try:
+            return pq.ParquetFile(file_path, memory_map=True)
+        except Exception as e:
+            raise ValueError(f"Error reading Parquet file {file_path}: {str(e)}")
+
+    def _read_data(self) -> pd.DataFrame:
+        """
+        Read the Parquet file (the columns in `self.usecols`) into pandas DataFrame.
+
+        Returns:
+            pd.DataFrame: The data from the Parquet file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a valid Parquet file
+        """
+        require_pyarrow("Parquet")
+        import pyarrow.parquet as pq
+
+        file_path = self._check_file()
+        try:
+            return pq.read_table(file_path, columns=self.usecols, memory_map=True, **self.kwargs).to_pandas()
+        except Exception as e:
+            raise ValueError(f"Error reading Parquet file {file_path}: {str(e)}")
+
+    def _read_columns(self) -> List[str]:
+        """Read the variable names from the footer."""
+        return list(self.parquet_file.schema_arrow.names)
+
+    def _iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Read the columns in `self.usecols` one record batch (`self.chunksize` rows) at a time."""
+        for batch in self.parquet_file.iter_batches(batch_size=self.chunksize, columns=self.usecols):
+            yield batch.to_pandas()
+
+    def _count_rows(self) -> int | None:
+        return self.parquet_file.metadata.num_rows
+
+    def _read_blocks(self, blocks: List[Tuple[int, int]]) -> pd.DataFrame:
+        """Read the row groups holding the blocks of rows, each once, and slice the blocks out."""
+        import pyarrow as pa
+
+        parquet_file = self.parquet_file
+        metadata = parquet_file.metadata
+        part_rows = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        tables = []
+        for group, slices in split_blocks(blocks, part_rows).items():
+            table = parquet_file.read_row_group(group, columns=self.usecols)
+            tables.extend(table.slice(start, length) for start, length in slices)
+        if not tables:
+            return parquet_file.schema_arrow.empty_table().select(self.usecols or self.columns).to_pandas()
+        return pa.concat_tables(tables).to_pandas()
+
+    def _summarize(self, selected_vars: List[str]) -> tuple[int, Dict[str, Any]]:
+        parquet_file = self.parquet_file
+        obs = parquet_file.metadata.num_rows
+
+        metadata_stats = {}
+        if self.metadata_only and not self.is_sampling:
+            metadata_stats = self._metadata_stats(parquet_file, selected_vars)
+
+        vars_detail = {}
+        remaining_vars = [var_name for var_name in selected_vars if var_name not in metadata_stats]
+        if remaining_vars:
+            self._read_vars = remaining_vars
+            obs, vars_detail = super()._summarize(remaining_vars)
+
+        for var_name, stats in metadata_stats.items():
+            vars_detail[var_name] = {
+                "type": "float",
+                "var": var_name,
+                "summary": {
+                    "obs": stats["obs"],
+                    "min": round(float(stats["min"]), self.decimal_places),
+                    "max": round(float(stats["max"]), self.decimal_places),
+                },
+            }
+        return obs, {var_name: vars_detail[var_name] for var_name in selected_vars}
+
+    @staticmethod
+    def _metadata_stats(parquet_file, selected_vars: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get obs, min and max of the numeric variables from the row-group statistics.
+
+        A variable is left out if any row group has no statistics for it, or no value.
+        """
+        import pyarrow as pa
+
+        schema = parquet_file.schema_arrow
+        metadata = parquet_file.metadata
+        numeric_vars = {
+            field.name for field in schema
+            if field.name in selected_vars
+            # NaN is not counted as null in the statistics, so floating columns are read instead
+            and (pa.types.is_integer(field.type) or pa.types.is_boolean(field.type))
+        }
+        if not numeric_vars or metadata.num_row_groups == 0:
+            return {}
+
+        first_group = metadata.row_group(0)
+        positions = {
+            first_group.column(i).path_in_schema: i
+            for i in range(first_group.num_columns)
+            if first_group.column(i).path_in_schema in numeric_vars
+        }
+
+        stats: Dict[str, Dict[str, Any]] = {}
+        for var_name, position in positions.items():
+            obs, minimum, maximum = 0, None, None
+            for group in range(metadata.num_row_groups):
+                row_group = metadata.row_group(group)
+                statistics = row_group.column(position).statistics
+                if statistics is None or not statistics.has_null_count:
+                    break
+                values = row_group.num_rows - statistics.null_count
+                if values and not statistics.has_min_max:
+                    break
+                if values:
+                    minimum = statistics.min if minimum is None else min(minimum, statistics.min)
+                    maximum = statistics.max if maximum is None else max(maximum, statistics.max)
+                obs += values
+            else:
+                if obs:
+                    stats[var_name] = {"obs": obs, "min": minimum, "max": maximum}
+        return stats
+
+    def _check_file(self) -> Path:
+        file_path = self.local_path
+        if not file_path.exists():
+            raise FileNotFoundError(f"Parquet file not found: {file_path}")
+        if file_path.suffix.lower().strip(".") not in self.supported_extensions:
+            raise ValueError(f"File must have extension in {self.supported_extensions}, got: {file_path.suffix}")
+        return file_path
@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : remote.py
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict
+from urllib.parse import urlparse
+
+
+class RemoteFileCache:
+    """
+    Disk cache of remote data files, so every reader works on a local file.
+
+    A download is streamed to disk in `chunk_size` chunks, never held in memory. The ETag
+    and Last-Modified headers are kept in a sidecar index, and a cached file is revalidated
+    with a conditional request: an unchanged file costs one request answered "304 Not
+    Modified". If the server cannot be reached, the cached copy is used. Files are evicted
+    least recently used first once the cache grows over `max_bytes`.
+
+    Example:
+        >>> cache = RemoteFileCache("~/.statamcp/.cache/downloads")
+        >>> cache.fetch("https://www.stata-press.com/data/r18/auto.dta")
+        PosixPath('/home/user/.statamcp/.cache/downloads/5b1d3c2a9e8f7a6b4c3d2e1f0a9b8c7d.dta')
+    """
+
+    INDEX_FILE = "downloads.json"
+
+    _lock = threading.Lock()
+
+    def __init__(self,
+                 cache_dir: str | Path,
+                 max_bytes: int = 1024 * 1024 * 1024,
+                 chunk_size: int = 1024 * 1024,
+                 timeout: float = 60):
+        """
+        Initialize the download cache.
+
+        Args:
+            cache_dir: Directory of the downloaded files and of the sidecar index
+            max_bytes: Size budget of the downloaded files (in bytes)
+            chunk_size: Size of the chunks written to disk (in bytes)
+            timeout: Timeout of the connection and of each read (in seconds)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.index_file = self.cache_dir / self.INDEX_FILE
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.timeout = timeout
+
+    def fetch(self, url: str) -> Path:
+        """
+        Get a local copy of `url`, downloaded only if it is not cached or changed on the server.
+
+        Returns:
+            Path: the cached file, with the extension of the URL so readers can check it
+
+        Raises:
+            ValueError: If the file cannot be downloaded and there is no cached copy
+        """
+        suffix = Path(urlparse(url).path).suffix.lower()
+        file_path = self.cache_dir / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}{suffix}"
+
+        with self._lock:
+            entry = self._load_index().get(url)
+        if entry is not None and not file_path.exists():
+            entry = None
+
+        request = urllib.request.Request(url)
+        if entry is not None:
+            if entry.get("etag"):
+                request.add_header("If-None-Match", entry["etag"])
+            if entry.get("last_modified"):
+                request.add_header("If-Modified-Since", entry["last_modified"])
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                entry = self._download(response, file_path)
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or entry is None:
+                raise ValueError(f"Error downloading {url}: HTTP {e.code} {e.reason}")
+            # 304 Not Modified, the cached copy is up to date
+        except (urllib.error.URLError, OSError) as e:
+            if entry is None:
+                raise ValueError(f"Error downloading {url}: {str(e)}")
+            logging.warning(f"Cannot revalidate {url} ({str(e)}), using the cached copy")
+
+        entry["last_used"] = time.time()
+        with self._lock:
+            index = self._load_index()
+            index[url] = entry
+            index.move_to_end(url)
+            self._evict(index, keep=url)
+            self._save_index(index)
+        return file_path
+
+    def _download(self, response, file_path: Path) -> Dict[str, Any]:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = file_path.with_suffix(f"{file_path.suffix}.{os.getpid()}.{threading.get_ident()}.part")
+        try:
+            with open(tmp_file, "wb") as f:
+                shutil.copyfileobj(response, f, self.chunk_size)
+            os.replace(tmp_file, file_path)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+
+        return {
+            "file": file_path.name,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": file_path.stat().st_size,
+        }
+
+    def _evict(self, index: "OrderedDict[str, Dict[str, Any]]", keep: str):
+        """Remove the least recently used files (the index is in use order) while over budget."""
+        total = sum(entry.get("size", 0) for entry in index.values())
+        for url in list(index):
+            if total <= self.max_bytes:
+                break
+            if url == keep:
+                continue
+            entry = index.pop(url)
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            total -= entry.get("size", 0)
+            logging.debug(f"Evicted the download of {url} ({entry.get('size', 0)} bytes)")
+
+    def _load_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                return OrderedDict(json.load(f))
+        except FileNotFoundError:
+            return OrderedDict()
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable download index {self.index_file}: {str(e)}")
+            return OrderedDict()
+
+    def _save_index(self, index: "OrderedDict[str, Dict[str, Any]]"):
+        tmp_file = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_file, self.index_file)
+        except OSError as e:
+            logging.warning(f"Failed to save download index {self.index_file}: {str(e)}")
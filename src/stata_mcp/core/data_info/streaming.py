@@ -0,0 +1,293 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : streaming.py
+
+"""
+One-pass accumulators for summarizing data chunk by chunk.
+
+Every accumulator keeps a bounded state whatever the number of rows, so a file is
+summarized in constant memory, and two accumulators of the same variable can be
+merged (e.g. the results of two workers).
+"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from .distinct import DISTINCT_SKETCH_SIZE, DistinctSketch
+from .moments import NUMERIC_METRICS, moment_stats
+
+
+class QuantileSketch:
+    """
+    KLL-style quantile sketch with compactors of `k` items per level.
+
+    Items of level h stand for 2**h values. A full level is sorted and every other item
+    (starting at a random offset) is promoted to the next level, so the memory is about
+    k * log2(n / k) items. As long as nothing was compacted the quantiles are exact.
+    """
+
+    def __init__(self, k: int = 2048, seed: int = 0):
+        self.k = k
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self) -> bool:
+        return len(self.levels) == 1
+
+    def update(self, values: np.ndarray):
+        if values.size:
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+
+    def merge(self, other: "QuantileSketch"):
+        for h, items in enumerate(other.levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self._compress()
+
+    def quantile(self, qs: Iterable[float]) -> np.ndarray:
+        qs = np.asarray(list(qs), dtype="float64")
+        if self.is_exact:
+            if not self.levels[0].size:
+                return np.full(qs.shape, np.nan)
+            return np.quantile(self.levels[0], qs)  # Linear interpolation, as pandas does
+
+        weights = np.concatenate([np.full(items.size, 2.0 ** h) for h, items in enumerate(self.levels)])
+        values = np.concatenate(self.levels)
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        cum = np.cumsum(weights)
+        # An item of weight w covers the ranks cum - w ... cum - 1, it sits at their center
+        centers = cum - (weights + 1) / 2
+        return np.interp(qs * (cum[-1] - 1), centers, values)
+
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            items = self.levels[h]
+            if items.size > self.k:
+                items = np.sort(items)
+                # An odd item out stays on its level, so the total weight is unchanged
+                rest, items = (items[-1:], items[:-1]) if items.size % 2 else (items[:0], items)
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[h] = rest
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate([self.levels[h + 1], promoted])
+            h += 1
+
+
+class NumericAccumulator:
+    """
+    Count, mean, central moments (up to the 4th), min, max and quantiles of a numeric variable.
+
+    Each chunk is reduced with NumPy and merged with the running state using the pairwise
+    update formulas of Chan et al. and Pébay, which are numerically stable (Welford).
+    """
+
+    def __init__(self, sketch_size: int = 2048, seed: int = 0):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch_size = sketch_size
+        self.sketch = QuantileSketch(sketch_size, seed)
+
+    def update(self, values: np.ndarray):
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+        mean = float(values.mean())
+        d = values - mean
+        d2 = d * d
+        other = NumericAccumulator.__new__(NumericAccumulator)
+        other.n = int(values.size)
+        other.mean = mean
+        other.m2 = float(d2.sum())
+        other.m3 = float((d2 * d).sum())
+        other.m4 = float((d2 * d2).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+        self._merge_moments(other)
+        self.sketch.update(values)
+
+    def merge(self, other: "NumericAccumulator"):
+        self._merge_moments(other)
+        self.sketch.merge(other.sketch)
+
+    def _merge_moments(self, other: "NumericAccumulator"):
+        na, nb = self.n, other.n
+        if nb == 0:
+            return
+        if na == 0:
+            self.n, self.mean, self.m2, self.m3, self.m4 = nb, other.mean, other.m2, other.m3, other.m4
+            self.min, self.max = other.min, other.max
+            return
+
+        n = na + nb
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta ** 2 * na * nb / n
+        m3 = (self.m3 + other.m3
+              + delta ** 3 * na * nb * (na - nb) / n ** 2
+              + 3 * delta * (na * other.m2 - nb * self.m2) / n)
+        m4 = (self.m4 + other.m4
+              + delta ** 4 * na * nb * (na ** 2 - na * nb + nb ** 2) / n ** 3
+              + 6 * delta ** 2 * (na ** 2 * other.m2 + nb ** 2 * self.m2) / n ** 2
+              + 4 * delta * (na * other.m3 - nb * self.m3) / n)
+
+        self.n = n
+        self.mean += delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def get_summary(self, decimal_places: int = 3, metrics: List[str] = None) -> Dict[str, Any]:
+        """Same keys and definitions as `summarize_numeric_frame` (pandas' unbiased skewness and excess kurtosis)."""
+        n = self.n
+        nan = float("nan")
+        q1, med, q3 = self.sketch.quantile([0.25, 0.5, 0.75])
+
+        moments = moment_stats(n, self.m2, self.m3, self.m4)
+
+        stats = {
+            "mean": self.mean if n else nan,
+            "stderr": moments["stderr"],
+            "min": self.min if n else nan,
+            "max": self.max if n else nan,
+            "q1": q1,
+            "med": med,
+            "q3": q3,
+            "skewness": moments["skewness"],
+            "kurtosis": moments["kurtosis"],
+        }
+        keys = [m for m in NUMERIC_METRICS if m in stats and (metrics is None or m in metrics)]
+        return {"obs": n, **{k: round(float(stats[k]), decimal_places) for k in keys}}
+
+
+class StringAccumulator:
+    """Count of a string variable and a seeded bottom-k sketch of its distinct values (see DistinctSketch)."""
+
+    def __init__(self, max_display: int = 10, sketch_size: int = DISTINCT_SKETCH_SIZE):
+        self.max_display = max_display
+        self.n = 0
+        self.sketch = DistinctSketch(sketch_size)
+        self.is_partial = False  # Some values seen before the variable turned out to be text are missing
+
+    @classmethod
+    def from_numeric(cls, numeric: NumericAccumulator, max_display: int = 10) -> "StringAccumulator":
+        """
+        Continue a variable whose first chunks were numeric and a later one holds text.
+
+        The count is kept; the distinct values seen so far are those the quantile sketch
+        holds, which are all of them as long as it is exact.
+        """
+        accumulator = cls(max_display, numeric.sketch_size)
+        accumulator.n = numeric.n
+        values = np.concatenate(numeric.sketch.levels)
+        # Numbers as they were written, 3 rather than 3.0
+        accumulator.sketch.update(pd.Series([str(int(v)) if v.is_integer() else str(v) for v in values.tolist()],
+                                            dtype=object))
+        accumulator.is_partial = not numeric.sketch.is_exact
+        return accumulator
+
+    def update(self, values: pd.Series):
+        self.n += int(values.size)
+        self.sketch.update(values)
+
+    def merge(self, other: "StringAccumulator"):
+        self.n += other.n
+        self.sketch.merge(other.sketch)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Same keys as StringSeries, and the same values: the sketch does not depend on the chunks."""
+        return {
+            "obs": self.n,
+            "value_list": self.sketch.sample(self.max_display),
+            "distinct": self.sketch.cardinality,
+            "distinct_estimated": not self.sketch.is_exact or self.is_partial,
+        }
+
+
+class StreamingSummary:
+    """
+    Summarize the chunks of a dataset in one pass.
+
+    The type of a variable is decided on the first chunk where it has a value. A numeric
+    variable becomes a string one as soon as a later chunk holds text, as it would be when
+    summarized in memory (see StringAccumulator.from_numeric).
+
+    Example:
+        >>> summary = StreamingSummary(["price", "make"], type_of=DataInfoBase._determine_variable_type)
+        >>> for chunk in pd.read_csv("auto.csv", chunksize=100_000):
+        ...     summary.update(chunk)
+        >>> summary.obs, summary.vars_detail()["price"]["summary"]["mean"]
+        (74, 6165.257)
+    """
+
+    def __init__(self,
+                 vars_list: List[str],
+                 type_of: Callable[[pd.Series], str],
+                 max_display: int = 10,
+                 decimal_places: int = 3,
+                 sketch_size: int = 2048,
+                 metrics: List[str] = None):
+        self.vars_list = list(vars_list)
+        self.type_of = type_of
+        self.metrics = metrics  # None keeps every numeric metric
+        self.max_display = max_display
+        self.decimal_places = decimal_places
+        self.sketch_size = sketch_size
+
+        self.obs = 0
+        self.accumulators: Dict[str, NumericAccumulator | StringAccumulator | None] = dict.fromkeys(self.vars_list)
+
+    def update(self, chunk: pd.DataFrame):
+        self.obs += len(chunk)
+        for var in self.vars_list:
+            series = chunk[var].dropna()
+            accumulator = self.accumulators[var]
+            if accumulator is None:
+                if series.empty:
+                    continue
+                if self.type_of(series) == "str":
+                    accumulator = StringAccumulator(self.max_display)
+                else:
+                    accumulator = NumericAccumulator(self.sketch_size)
+                self.accumulators[var] = accumulator
+            elif isinstance(accumulator, NumericAccumulator) and self.type_of(series) == "str":
+                accumulator = StringAccumulator.from_numeric(accumulator, self.max_display)
+                self.accumulators[var] = accumulator
+
+            if isinstance(accumulator, StringAccumulator):
+                accumulator.update(series)
+            else:
+                values = pd.to_numeric(series, errors="coerce")
+                accumulator.update(np.asarray(values, dtype="float64"))
+
+    def vars_detail(self) -> Dict[str, Dict[str, Any]]:
+        vars_detail = {}
+        for var in self.vars_list:
+            accumulator = self.accumulators[var] or NumericAccumulator(self.sketch_size)  # No value at all
+            if isinstance(accumulator, StringAccumulator):
+                var_type, summary = "str", accumulator.get_summary()
+            else:
+                var_type, summary = "float", accumulator.get_summary(self.decimal_places, self.metrics)
+            vars_detail[var] = {
+                "type": var_type,
+                "var": var,
+                "summary": summary,
+            }
+        return vars_detail
@@ -7,19 +7,87 @@
 # @Email  : sepinetam@gmail.com
 # @File   : xlsx.py
 
+import importlib.util
+import zipfile
+from datetime import date, datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any, Dict, Iterator, List
 
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 from .base import DataInfoBase
 
 
+# Cells which pandas' calamine reader converts, by type
+CALAMINE_CONVERTERS = {date: pd.Timestamp, datetime: pd.Timestamp, timedelta: pd.Timedelta}
+
+
+def has_calamine() -> bool:
+    """Whether python-calamine, the fast Excel engine, is installed (`pip install stata-mcp[excel]`)."""
+    return importlib.util.find_spec("python_calamine") is not None
+
+
 class ExcelDataInfo(DataInfoBase):
-    """Data info handler for Excel files."""
+    """
+    Data info handler for Excel files.
+
+    Workbooks are parsed by calamine when python-calamine is installed, otherwise by openpyxl
+    in read-only mode (.xlsx) or xlrd (.xls). The sheet names and the header row are read
+    without the data rows; in streaming mode the rows of the sheet are parsed one chunk at a
+    time, keeping only the selected columns, so a workbook is summarized in one sequential scan.
+    """
 
     supported_extensions = ['xlsx', 'xls']
 
+    # Reader arguments the streaming reader understands, any other one reads the sheet with pandas
+    STREAMING_KWARGS = {"sheet_name", "header", "names", "engine"}
+
+    _sheet_names: List[str] | None = None  # Memoized per instance
+
+    @property
+    def engine(self) -> str:
+        """Get the engine parsing the workbook, an `engine` keyword argument takes precedence."""
+        if "engine" in self.kwargs:
+            return self.kwargs["engine"]
+        if has_calamine():
+            return "calamine"
+        return "openpyxl" if self.local_path.suffix.lower() == ".xlsx" else "xlrd"
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether the sheet can be read chunk by chunk: a single sheet, a single header row, a row-wise engine."""
+        return (
+            self.engine in {"calamine", "openpyxl"}
+            and self.kwargs.keys() <= self.STREAMING_KWARGS
+            and isinstance(self.kwargs.get("sheet_name", 0), (int, str))
+            and isinstance(self.kwargs.get("header", 0), (int, type(None)))
+        )
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Get the names of the sheets, from the workbook part only, no sheet is read."""
+        if self._sheet_names is None:
+            file_path = self._check_file()
+            try:
+                with pd.ExcelFile(file_path, engine=self.engine) as excel_file:
+                    self._sheet_names = excel_file.sheet_names
+            except Exception as e:
+                raise ValueError(f"Error reading Excel file {file_path}: {str(e)}")
+        return self._sheet_names
+
+    @property
+    def cache_config(self) -> str:
+        """Summaries of different sheets of a workbook are cached apart."""
+        return f"{super().cache_config}|sheet={self._sheet_name()}"
+
+    def _build_summary(self, obs: int, vars_detail: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the summarized sheet and the names of all the sheets to the overview."""
+        summary = super()._build_summary(obs, vars_detail)
+        summary["overview"].update(sheet=self._sheet_name(), sheet_names=self.sheet_names)
+        return summary
+
     def _read_data(self) -> pd.DataFrame:
         """
         Read Excel file into pandas DataFrame.
@@ -33,32 +101,131 @@ class ExcelDataInfo(DataInfoBase):
             FileNotFoundError: If the local file does not exist
             ValueError: If the file is not a valid Excel file
         """
-        valid_extensions = {".xlsx", ".xls"}
-
-        if self.is_url:
-            parsed_url = urlparse(str(self.data_path))
-            if Path(parsed_url.path).suffix.lower() not in valid_extensions:
-                raise ValueError(f"URL must point to an Excel file with extensions {valid_extensions}")
-            source = str(self.data_path)
-        else:
-            file_path = Path(self.data_path)
+        source = self._check_file()
 
-            if not file_path.exists():
-                raise FileNotFoundError(f"Excel file not found: {file_path}")
-
-            if file_path.suffix.lower() not in valid_extensions:
-                raise ValueError(f"File must have extension in {valid_extensions}, got: {file_path.suffix}")
-
-            source = file_path
+        # Only parse the requested columns
+        usecols = self.usecols
+        kwargs = {"engine": self.engine, **self.kwargs}
 
         try:
-            df = pd.read_excel(source, **self.kwargs)
+            df = pd.read_excel(source, usecols=usecols, **kwargs)
             return df
         except TypeError as e:
             if "unexpected keyword argument" in str(e):
-                filtered_kwargs = {k: v for k, v in self.kwargs.items() if k in {"sheet_name", "header", "names"}}
-                df = pd.read_excel(source, **filtered_kwargs)
+                filtered_kwargs = {k: v for k, v in kwargs.items() if k in self.STREAMING_KWARGS}
+                df = pd.read_excel(source, usecols=usecols, **filtered_kwargs)
                 return df
             raise ValueError(f"Error reading Excel file {source}: {str(e)}")
         except Exception as e:
             raise ValueError(f"Error reading Excel file {source}: {str(e)}")
+
+    def _read_columns(self) -> List[str]:
+        """
+        Read the variable names from the header row, no data row is parsed.
+
+        calamine parses a whole sheet to return any of its rows, so the header of an .xlsx
+        file is read with openpyxl in read-only mode, which stops after the header row.
+        """
+        kwargs = {k: v for k, v in self.kwargs.items() if k in self.STREAMING_KWARGS}
+        if (self.engine == "calamine" and self.local_path.suffix.lower() == ".xlsx"
+                and isinstance(kwargs.get("sheet_name", 0), (int, str))):
+            kwargs.update(engine="openpyxl", sheet_name=self._sheet_name())
+        else:
+            kwargs["engine"] = self.engine
+        try:
+            return list(pd.read_excel(self.local_path, nrows=0, **kwargs).columns)
+        except Exception:
+            return super()._read_columns()
+
+    def _iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """
+        Parse the rows of the sheet and yield the columns in `self.usecols`, `self.chunksize` rows at a time.
+
+        Cells are converted by pandas' TextParser as in `pd.read_excel`; empty rows are
+        kept, except those at the end of the sheet.
+        """
+        names = self.columns
+        usecols = self.usecols or names
+        pick = itemgetter(*[names.index(var_name) for var_name in usecols])
+        header = self.kwargs.get("header", 0)
+        first_row = 0 if header is None else header + 1
+
+        rows, empty_rows = [], 0
+        for i, row in enumerate(self._iter_rows(len(names))):
+            if i < first_row:
+                continue
+            if row.count(None) + row.count("") == len(row):
+                empty_rows += 1  # Only kept if a row with data follows
+                continue
+            if empty_rows:
+                rows.extend([(None,) * len(names)] * empty_rows)
+                empty_rows = 0
+            rows.append(row)
+            if len(rows) >= self.chunksize:
+                yield self._parse_rows(rows, pick, usecols)
+                rows = []
+        if rows:
+            yield self._parse_rows(rows, pick, usecols)
+
+    def _iter_rows(self, width: int) -> Iterator[tuple]:
+        """Iterate over the rows of the selected sheet, `width` cells each, without loading the sheet as Python objects."""
+        file_path = self._check_file()
+        try:
+            excel_file = pd.ExcelFile(file_path, engine=self.engine)
+        except Exception as e:
+            raise ValueError(f"Error reading Excel file {file_path}: {str(e)}")
+
+        with excel_file:
+            sheet_name = self._sheet_name(excel_file.sheet_names)
+            if self.engine == "calamine":
+                padding = ("",) * width
+                for row in excel_file.book.get_sheet_by_name(sheet_name).iter_rows():
+                    row = tuple(row[:width])
+                    yield row + padding[len(row):]
+            else:
+                worksheet = excel_file.book[sheet_name]
+                worksheet.reset_dimensions()  # The stored dimensions may be wrong, as pandas does
+                yield from worksheet.iter_rows(max_col=width, values_only=True)
+
+    def _sheet_name(self, sheet_names: List[str] | None = None) -> str:
+        """Get the name of the sheet selected by `sheet_name` (a name or a position, the first sheet by default)."""
+        sheet_names = self.sheet_names if sheet_names is None else sheet_names
+        sheet_name = self.kwargs.get("sheet_name", 0)
+        if isinstance(sheet_name, int):
+            if not -len(sheet_names) <= sheet_name < len(sheet_names):
+                raise ValueError(f"Worksheet index {sheet_name} is invalid, {len(sheet_names)} worksheets found: {sheet_names}")
+            return sheet_names[sheet_name]
+        if sheet_name not in sheet_names:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found, worksheets: {sheet_names}")
+        return sheet_name
+
+    def _parse_rows(self, rows: List[tuple], pick: itemgetter, usecols: List[str]) -> pd.DataFrame:
+        """Parse the selected cells of the rows with pandas' TextParser, as `pd.read_excel` does."""
+        values = [(value,) for value in map(pick, rows)] if len(usecols) == 1 else list(map(pick, rows))
+        if self.engine == "calamine":
+            # calamine returns dates and durations, pandas converts them to Timestamp and Timedelta
+            columns = list(zip(*values))
+            for i, column in enumerate(columns):
+                if set(map(type, column)) & CALAMINE_CONVERTERS.keys():
+                    columns[i] = [CALAMINE_CONVERTERS[type(cell)](cell) if type(cell) in CALAMINE_CONVERTERS else cell
+                                  for cell in column]
+            values = list(zip(*columns))
+        with TextParser(values, header=None, names=usecols) as parser:
+            return parser.read()
+
+    def _data_bytes(self) -> int:
+        """Uncompressed size of the workbook parts, an .xlsx file is a zip archive."""
+        file_path = self.local_path
+        if zipfile.is_zipfile(file_path):
+            with zipfile.ZipFile(file_path) as archive:
+                return sum(info.file_size for info in archive.infolist())
+        return super()._data_bytes()
+
+    def _check_file(self) -> Path:
+        # The local file, a URL is downloaded first
+        file_path = self.local_path
+        if not file_path.exists():
+            raise FileNotFoundError(f"Excel file not found: {file_path}")
+        if file_path.suffix.lower().strip(".") not in self.supported_extensions:
+            raise ValueError(f"File must have extension in {self.supported_extensions}, got: {file_path.suffix}")
+        return file_path
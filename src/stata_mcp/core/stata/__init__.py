@@ -1,9 +1,25 @@
-from .stata_controller import StataController
-from .stata_do import StataDo
-from .stata_finder import StataFinder
+from typing import TYPE_CHECKING
+
+from ...utils.lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .stata_controller import StataController
+    from .stata_do import StataDo, StataPool
+    from .stata_finder import StataFinder
+    from .stata_log import StataLogParser
+
+__getattr__, __dir__ = lazy_module(__name__, {
+    "StataController": ".stata_controller",
+    "StataDo": ".stata_do",
+    "StataLogParser": ".stata_log",
+    "StataFinder": ".stata_finder",
+    "StataPool": ".stata_do",
+})
 
 __all__ = [
     "StataFinder",
     "StataController",
-    "StataDo"
+    "StataDo",
+    "StataLogParser",
+    "StataPool"
 ]
@@ -9,7 +9,7 @@
 
 from abc import ABC, abstractmethod
 
-from ...stata_controller import StataController
+from ...stata_controller import StataControllerPool
 
 
 class AdoInstallBase(ABC):
@@ -39,8 +39,9 @@ class AdoInstallBase(ABC):
         pass
 
     @property
-    def controller(self) -> StataController:
-        return StataController(self.stata_cli)
+    def controller(self) -> StataControllerPool:
+        # Installers share the warm Stata sessions of the process instead of booting Stata per command
+        return StataControllerPool.shared(self.stata_cli)
 
     @property
     def REPLACE_MESSAGE(self) -> str:
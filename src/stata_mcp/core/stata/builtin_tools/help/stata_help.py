@@ -10,7 +10,7 @@
 import os
 from pathlib import Path
 
-from ...stata_controller import StataController
+from ...stata_controller import StataControllerPool
 
 
 class StataHelp:
@@ -18,7 +18,7 @@ class StataHelp:
         self.help_cache_dir = cache_dir or Path.home() / ".statamcp" / "help"
         self.help_cache_dir.mkdir(parents=True, exist_ok=True)
         self.project_tmp_dir = project_tmp_dir
-        self.controller = StataController(stata_cli)
+        self.controller = StataControllerPool.shared(stata_cli)
 
     @property
     def IS_SAVE(self) -> bool:
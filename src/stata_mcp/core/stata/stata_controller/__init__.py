@@ -1,5 +1,7 @@
 from .controller import StataController
+from .pool import StataControllerPool
 
 __all__ = [
     "StataController",
+    "StataControllerPool",
 ]
@@ -31,6 +31,11 @@ class StataController:
     def STATA_CLI(self):
         return self.stata_cli_path
 
+    @property
+    def is_alive(self) -> bool:
+        """Whether the Stata session is still running."""
+        return self.child is not None and not self.child.closed and self.child.isalive()
+
     def _expect_prompt(self, timeout=None):
         """
         Wait for the Stata prompt, indicating command completion.
@@ -95,6 +100,9 @@ class StataController:
         if timeout is None:
             timeout = self.timeout
 
+        # Drop output left over by a previous command, the session may be shared
+        self._drain()
+
         # Send the command
         self.child.sendline(command)
 
@@ -118,6 +126,13 @@ class StataController:
 
         return output
 
+    def _drain(self):
+        try:
+            while True:
+                self.child.read_nonblocking(size=4096, timeout=0)
+        except (pexpect.TIMEOUT, pexpect.EOF):
+            pass
+
     def run_with_retry(self, command, max_retries=3, timeout=None):
         """
         Execute a command with a retry mechanism.
@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : pool.py
+
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from .controller import StataController
+
+
+class StataControllerPool:
+    """
+    Thread-safe pool of persistent `StataController` sessions.
+
+    Sessions are started on first use and kept open, so a help lookup or a package
+    install costs one command round-trip instead of one Stata boot. A session is
+    checked before it is handed out and restarted if its process is gone, a command
+    hitting EOF is retried once on a fresh session, and sessions idle for longer than
+    `idle_timeout` are closed in the background.
+
+    Example:
+        >>> pool = StataControllerPool.shared("/usr/local/bin/stata-mp")
+        >>> pool.run("help regress")
+        'help regress\\r\\n...'
+        >>> with pool.acquire() as controller:
+        ...     controller.run("sysuse auto, clear")
+        ...     controller.run("describe")
+    """
+
+    _shared: Dict[str, "StataControllerPool"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self,
+                 stata_cli: str,
+                 size: int = 1,
+                 idle_timeout: float = 300,
+                 timeout: int = 30):
+        """
+        Initialize the pool.
+
+        Args:
+            stata_cli: Path to the Stata command-line executable
+            size: Maximum number of sessions running at once
+            idle_timeout: Seconds after which an unused session is closed, None keeps it forever
+            timeout: Default timeout of a command (in seconds)
+        """
+        self.stata_cli = stata_cli
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+
+        self._idle: List[Tuple[float, StataController]] = []  # (last used, session)
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+        if idle_timeout:
+            threading.Thread(target=self._reap_loop, name="stata-controller-reaper", daemon=True).start()
+
+    @classmethod
+    def shared(cls, stata_cli: str) -> "StataControllerPool":
+        """Return the pool of `stata_cli` shared across the process, creating it on first use."""
+        with cls._shared_lock:
+            pool = cls._shared.get(stata_cli)
+            if pool is None or pool._closed:
+                pool = cls._shared[stata_cli] = cls(stata_cli)
+                atexit.register(pool.close)
+            return pool
+
+    @contextmanager
+    def acquire(self) -> Iterator[StataController]:
+        """
+        Borrow a healthy session for exclusive use, it goes back to the pool afterwards.
+
+        A session used by a block which raised (e.g. a timeout in the middle of a command) may
+        still have output in flight, so it is closed instead of being returned to the pool.
+        """
+        if self._closed:
+            raise RuntimeError("StataControllerPool is closed")
+
+        self._slots.acquire()
+        controller = None
+        is_clean = False
+        try:
+            controller = self._checkout()
+            yield controller
+            is_clean = True
+        finally:
+            if controller is not None:
+                if is_clean:
+                    self._checkin(controller)
+                else:
+                    controller.close()
+            self._slots.release()
+
+    def run(self, command: str, timeout: int = None) -> str:
+        """
+        Execute a Stata command on a pooled session.
+
+        A session which died during the command is restarted and the command is sent once more.
+
+        Returns:
+            str: The output of the command execution.
+
+        Raises:
+            RuntimeError: If the command fails or times out.
+        """
+        with self.acquire() as controller:
+            try:
+                return controller.run(command, timeout or self.timeout)
+            except RuntimeError:
+                if controller.is_alive:
+                    raise
+                logging.warning(f"Stata session terminated while running `{command}`, restarting")
+                controller.restart()
+                return controller.run(command, timeout or self.timeout)
+
+    def close(self):
+        """Close every idle session, sessions in use are closed when they are returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for _, controller in idle:
+            controller.close()
+
+    def _checkout(self) -> StataController:
+        with self._lock:
+            controller = self._idle.pop()[1] if self._idle else None
+
+        if controller is None:
+            return StataController(self.stata_cli, timeout=self.timeout)
+        if not controller.is_alive:
+            logging.info("Pooled Stata session is not alive, restarting")
+            controller.restart()
+        return controller
+
+    def _checkin(self, controller: StataController):
+        with self._lock:
+            if not self._closed:
+                self._idle.append((time.monotonic(), controller))
+                return
+        controller.close()
+
+    def _reap_loop(self):
+        interval = max(1.0, self.idle_timeout / 2)
+        while not self._closed:
+            time.sleep(interval)
+            deadline = time.monotonic() - self.idle_timeout
+            with self._lock:
+                expired = [controller for last_used, controller in self._idle if last_used < deadline]
+                self._idle = [(last_used, c) for last_used, c in self._idle if last_used >= deadline]
+            for controller in expired:
+                logging.debug("Closing idle Stata session")
+                controller.close()
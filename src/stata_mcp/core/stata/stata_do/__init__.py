@@ -1,5 +1,19 @@
+from .cache import DoResultCache
 from .do import StataDo
+from .jobs import StataJob, StataJobManager
+from .log_reader import LogIndex
+from .log_tail import LogTailer
+from .pool import StataPool, StataWorker
+from .scheduler import StataScheduler
 
 __all__ = [
-    "StataDo"
+    "DoResultCache",
+    "LogIndex",
+    "LogTailer",
+    "StataDo",
+    "StataJob",
+    "StataJobManager",
+    "StataPool",
+    "StataScheduler",
+    "StataWorker"
 ]
@@ -0,0 +1,260 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : cache.py
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Commands known to have no effect outside the log and the data in memory, with their
+# abbreviations. A do-file using any other command (a file write, a `python:` or `mata:`
+# block, a shell escape, a user-written command, ...) is always executed.
+CACHEABLE_COMMANDS = re.compile(
+    r"^(?:use|sysuse|merge|append|joinby|cross|insheet|infile|import\s+(?:delimited|excel)|"
+    r"clear|version|set\s+(?:more|linesize|type|varabbrev|seed|sortseed)|"
+    r"d|de|des|desc|describe|codebook|inspect|count|isid|misstable|duplicates\s+(?:report|list|tag|drop)|"
+    r"su|sum|summ|summarize|tab|tabulate|tab1|tab2|tabstat|table|l|li|list|di|dis|display|"
+    r"cor|corr|correlate|pwcorr|ttest|ranksum|signrank|prtest|ci|centile|mean|proportion|ratio|total|"
+    r"g|ge|gen|generate|replace|egen|drop|keep|ren|rename|order|move|sort|gsort|"
+    r"la|lab|label|notes|format|recode|encode|decode|destring|tostring|compress|"
+    r"collapse|reshape|expand|fillin|xpose|stack|contract|"
+    r"tsset|xtset|svyset|stset|xtdescribe|xtsum|xttab|"
+    r"reg|regress|areg|xtreg|reghdfe|ivreg|ivregress|ivreg2|xtivreg|logit|logistic|probit|"
+    r"ologit|oprobit|mlogit|mprobit|poisson|nbreg|tobit|heckman|qreg|sqreg|newey|prais|glm|"
+    r"xtlogit|xtprobit|xtpoisson|xtabond|xtdpdsys|xtgls|arima|var|vec|stcox|streg|"
+    r"test|testparm|lincom|nlcom|margins|predict|estat|hausman|"
+    r"est|estimates\s+(?:store|restore|table|stats|replay|drop|clear)|"
+    r"matrix|mat|scalar|local|global|tempvar|tempname|preserve|restore|"
+    r"foreach|forvalues|forv|while|if|else|}|"
+    r"sample|splitsample)\b|^}",
+    re.IGNORECASE
+)
+
+# A `using` clause (outside the data inputs) or a `saving()` option writes or reads a file
+FILE_OPTIONS = re.compile(r"\busing\b|\bsaving\s*\(", re.IGNORECASE)
+
+# Random draws, the same do-file only gives the same log after a `set seed`
+RANDOM_COMMANDS = re.compile(
+    r"\br(?:uniform|uniformint|normal|beta|binomial|cauchy|chi2|exponential|gamma|hypergeometric|"
+    r"igaussian|laplace|logistic|nbinomial|poisson|t|weibull)\s*\(|^(?:sample|splitsample)\b",
+    re.IGNORECASE
+)
+SET_SEED = re.compile(r"^set\s+seed\b", re.IGNORECASE)
+
+# Commands reading a data file, the file is either after `using` or the first argument.
+DATA_INPUT_COMMANDS = re.compile(
+    r"^(?:use|merge|append|joinby|cross|insheet|infile|import\s+\w+)\b(.*)$",
+    re.IGNORECASE
+)
+
+PREFIX_COMMANDS = re.compile(
+    r"^(?:(?:quietly|qui|noisily|noi|capture|cap)\s*:?\s+|(?:by|bys|bysort|xi)\b[^:]*:\s*)+",
+    re.IGNORECASE
+)
+
+ERROR_CODE = re.compile(r"^r\(\d+\);$", re.MULTILINE)
+
+
+class DoResultCache:
+    """
+    Content-addressed cache of do-file logs.
+
+    A run is keyed on the do-file commands (comments and blank lines dropped)
+    plus the fingerprint (mtime, size, hash) of every data file it reads, so an
+    identical run returns a copy of the cached log without starting Stata. Only do-files
+    made of the commands in CACHEABLE_COMMANDS, without a `using` or `saving()` output or an
+    unseeded random draw, have a key. Only runs which finish without a Stata error are
+    stored, and the cache is bounded by `max_bytes` with LRU eviction.
+
+    Example:
+        >>> cache = DoResultCache(Path("stata-mcp-tmp/stata-do-cache"))
+        >>> key = cache.key(Path("analysis.do"))
+        >>> if key is None or not cache.get(key, log_file):
+        ...     run_stata(...)
+        ...     cache.put(key, log_file)
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 256 * 1024 * 1024, cwd: Path = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.cwd = cwd or Path.cwd()
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._data_hashes: Dict[Tuple[str, int, int], str] = {}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def key(self, dofile_path: Path) -> str | None:
+        """
+        Compute the cache key of a do-file run.
+
+        Returns:
+            str | None: the key, or None if the do-file must always be executed
+        """
+        try:
+            content = Path(dofile_path).read_bytes()
+        except OSError:
+            return None
+
+        lines = self._command_lines(content.decode("utf-8", errors="replace"))
+        if not self._is_cacheable(lines):
+            return None
+
+        inputs = []
+        for data_file in self._data_inputs(lines):
+            fingerprint = None if data_file is None else self._fingerprint(data_file)
+            if fingerprint is None:  # remote, unresolvable or missing input
+                return None
+            inputs.append(fingerprint)
+
+        # Hash the normalized commands, so whitespace and comment edits keep the same key
+        payload = {
+            "dofile": hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest(),
+            "inputs": inputs,
+            "cwd": str(self.cwd),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _is_cacheable(lines: List[str]) -> bool:
+        """Whether the log of the commands depends on their data inputs only."""
+        is_seeded = False
+        for line in lines:
+            if not CACHEABLE_COMMANDS.match(line):
+                return False
+            if FILE_OPTIONS.search(line) and not DATA_INPUT_COMMANDS.match(line):
+                return False
+            if RANDOM_COMMANDS.search(line) and not is_seeded:
+                return False
+            is_seeded = is_seeded or bool(SET_SEED.match(line))
+        return True
+
+    def get(self, key: str, log_file: Path) -> bool:
+        """Copy the cached log of `key` to `log_file`, return whether it was a hit."""
+        entry = self.cache_dir / f"{key}.log"
+        with self._lock:
+            try:
+                shutil.copyfile(entry, log_file)
+                os.utime(entry)  # Mark as recently used
+            except OSError:
+                self.misses += 1
+                return False
+            self.hits += 1
+        return True
+
+    def put(self, key: str, log_file: Path) -> bool:
+        """Store the log of a finished run, skipping runs that ended with a Stata error."""
+        try:
+            log_content = Path(log_file).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return False
+        if ERROR_CODE.search(log_content):
+            return False
+
+        with self._lock:
+            try:
+                shutil.copyfile(log_file, self.cache_dir / f"{key}.log")
+            except OSError as e:
+                logging.warning(f"Failed to cache log {log_file}: {e}")
+                return False
+            self._evict()
+        return True
+
+    def _evict(self):
+        entries = []
+        for entry in self.cache_dir.glob("*.log"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda x: x[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    @staticmethod
+    def _command_lines(code: str) -> List[str]:
+        code = re.sub(r"/\*.*?\*/", " ", code, flags=re.DOTALL)
+        code = re.sub(r"\s*///[^\n]*\n", " ", code)
+
+        lines = []
+        for line in code.split("\n"):
+            line = re.split(r"\s//", line, maxsplit=1)[0].strip()
+            if not line or line.startswith("*") or line.startswith("//"):
+                continue
+            lines.append(PREFIX_COMMANDS.sub("", line))
+        return lines
+
+    def _data_inputs(self, lines: List[str]) -> List[Path | None]:
+        inputs = []
+        for line in lines:
+            match = DATA_INPUT_COMMANDS.match(line)
+            if not match:
+                continue
+
+            args = match.group(1)
+            using = re.search(r"\busing\b(.*)$", args)
+            target = self._first_argument(using.group(1) if using else args)
+            if not target:
+                continue
+            if re.match(r"^\w+://", target) or "$" in target or "`" in target:
+                # Remote, or built from globals and locals which only Stata resolves
+                inputs.append(None)
+                continue
+
+            path = Path(target).expanduser()
+            if not path.is_absolute():
+                path = self.cwd / path
+            if not path.suffix and line.lower().startswith(("use", "merge", "append", "joinby", "cross")):
+                path = path.with_suffix(".dta")
+            inputs.append(path)
+        return inputs
+
+    @staticmethod
+    def _first_argument(args: str) -> str | None:
+        args = args.strip()
+        if args.startswith('`"'):
+            end = args.find("\"'")
+            return args[2:end] if end > 0 else None
+        if args.startswith('"'):
+            end = args.find('"', 1)
+            return args[1:end] if end > 0 else None
+        token = re.split(r"[\s,]", args, maxsplit=1)[0]
+        return token or None
+
+    def _fingerprint(self, data_file: Path) -> List | None:
+        try:
+            stat = data_file.stat()
+        except OSError:
+            return None
+
+        memo_key = (str(data_file), stat.st_mtime_ns, stat.st_size)
+        digest = self._data_hashes.get(memo_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with open(data_file, "rb") as f:
+                while chunk := f.read(1024 * 1024):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._data_hashes[memo_key] = digest
+        return [str(data_file), stat.st_mtime_ns, stat.st_size, digest]
@@ -7,14 +7,43 @@
 # @Email  : sepinetam@gmail.com
 # @File   : do.py
 
+import asyncio
 import logging
 import os
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from ....utils import get_nowtime
+from .log_reader import LogIndex
+from .log_tail import LogTailer
+
+
+class _MonitoredProcess:
+    """
+    The `subprocess.Popen` interface the monitors use (`pid`, `poll`, `kill`) over an asyncio process.
+
+    Monitors run in their own thread, so the kill is scheduled on the event loop owning the process.
+    """
+
+    def __init__(self, proc: asyncio.subprocess.Process, loop: asyncio.AbstractEventLoop):
+        self.proc = proc
+        self.loop = loop
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    def poll(self) -> Optional[int]:
+        return self.proc.returncode
+
+    def kill(self):
+        self.loop.call_soon_threadsafe(self._kill)
+
+    def _kill(self):
+        if self.proc.returncode is None:
+            self.proc.kill()
 
 
 class StataDo:
@@ -23,7 +52,9 @@ class StataDo:
                  log_file_path: Path,
                  is_unix: bool = None,
                  cwd: Path = None,
-                 monitors: Optional[List] = None):
+                 monitors: Optional[List] = None,
+                 pool=None,
+                 cache=None):
         """
         Initialize Stata executor
 
@@ -33,6 +64,8 @@ class StataDo:
             is_unix: Whether the OS is Unix-like (macOS/Linux)
             cwd (Path): current working directory
             monitors: List of monitor instances (e.g., RAMMonitor, TimeoutMonitor)
+            pool (StataPool): Warm pool of Stata workers, if None a new Stata process is started per do-file
+            cache (DoResultCache): Cache of do-file logs, if None every do-file is executed
         """
         self.stata_cli = stata_cli
         self.log_file_path = log_file_path
@@ -44,6 +77,8 @@ class StataDo:
         self.cwd = cwd or Path.cwd()
         self.monitors = monitors or []
         self.IS_MONITOR = len(self.monitors) > 0
+        self.pool = pool
+        self.cache = cache
 
     def set_cli(self, cli_path):
         self.stata_cli = cli_path
@@ -55,7 +90,8 @@ class StataDo:
     def execute_dofile(self,
                        dofile_path: Path,
                        log_file_name: str = None,
-                       is_replace: bool = True) -> Path:
+                       is_replace: bool = True,
+                       use_cache: bool = False) -> Path:
         """
         Execute Stata do file and return log file path
 
@@ -63,6 +99,7 @@ class StataDo:
             dofile_path (Path): Path to do file
             log_file_name (str, optional): File name of log
             is_replace (bool): Whether replace the log file if exists before. Default is True
+            use_cache (bool): Whether return the cached log of an identical run. Default is False
 
         Returns:
             Path: Path to generated log file
@@ -75,7 +112,15 @@ class StataDo:
         log_name = log_file_name or nowtime
         log_file = self.log_file_path / f"{log_name}.log"
 
-        if self.is_unix:
+        # Same do-file on the same data, return the cached log instead of starting Stata
+        cache_key = self.cache.key(dofile_path) if (self.cache is not None and use_cache) else None
+        if cache_key and (is_replace or not log_file.exists()) and self.cache.get(cache_key, log_file):
+            logging.info(f"Cache hit for {dofile_path}, stats: {self.cache.stats}")
+            return log_file
+
+        if self.pool is not None:
+            self.pool.execute(dofile_path, log_file, is_replace, monitors=self.monitors)
+        elif self.is_unix:
             if self.IS_MONITOR:
                 self._execute_unix_like_with_monitors(dofile_path, log_file, is_replace)
             else:
@@ -86,6 +131,75 @@ class StataDo:
             else:
                 self._execute_windows(dofile_path, log_file, is_replace)
 
+        if cache_key:
+            self.cache.put(cache_key, log_file)
+            logging.info(f"Cache miss for {dofile_path}, stats: {self.cache.stats}")
+
+        return log_file
+
+    async def execute_dofile_async(self,
+                                   dofile_path: Path,
+                                   log_file_name: str = None,
+                                   is_replace: bool = True,
+                                   use_cache: bool = False,
+                                   on_log_lines: Callable[[List[str]], Awaitable[None]] = None) -> Path:
+        """
+        Execute Stata do file without blocking the event loop and return log file path
+
+        Cancelling the awaiting task kills the Stata process running the do-file, monitors
+        enabled or not.
+
+        Args:
+            dofile_path (Path): Path to do file
+            log_file_name (str, optional): File name of log
+            is_replace (bool): Whether replace the log file if exists before. Default is True
+            use_cache (bool): Whether return the cached log of an identical run. Default is False
+            on_log_lines (Callable, optional): Awaited with each batch of new log lines while Stata is running
+
+        Returns:
+            Path: Path to generated log file
+
+        Raises:
+            RuntimeError: Stata execution error
+        """
+        nowtime = get_nowtime()
+        log_name = log_file_name or nowtime
+        log_file = self.log_file_path / f"{log_name}.log"
+
+        # Same do-file on the same data, return the cached log instead of starting Stata.
+        # The key hashes the data files read by the do-file, off the event loop
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = await asyncio.to_thread(self.cache.key, dofile_path)
+        if cache_key and (is_replace or not log_file.exists()) and self.cache.get(cache_key, log_file):
+            logging.info(f"Cache hit for {dofile_path}, stats: {self.cache.stats}")
+            return log_file
+
+        if on_log_lines is None:
+            await self._dispatch_async(dofile_path, log_file, is_replace)
+        else:
+            # Follow the log while Stata writes it
+            done = asyncio.Event()
+
+            async def follow_log():
+                async for lines in LogTailer(log_file).follow(done):
+                    try:
+                        await on_log_lines(lines)
+                    except Exception as e:
+                        # A closed client must not stop the Stata run
+                        logging.debug(f"Failed to forward log lines of {dofile_path}: {e}")
+
+            follower = asyncio.create_task(follow_log())
+            try:
+                await self._dispatch_async(dofile_path, log_file, is_replace)
+            finally:
+                done.set()
+                await follower
+
+        if cache_key:
+            self.cache.put(cache_key, log_file)
+            logging.info(f"Cache miss for {dofile_path}, stats: {self.cache.stats}")
+
         return log_file
 
     @staticmethod
@@ -323,6 +437,98 @@ class StataDo:
                 except Exception as e:
                     logging.warning(f"Failed to remove temporary batch file {batch_file}: {str(e)}")
 
+    async def _dispatch_async(self, dofile_path: Path, log_file: Path, is_replace: bool = True):
+        if self.pool is not None:
+            future = self.pool.submit(dofile_path, log_file, is_replace, monitors=self.monitors)
+            try:
+                await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                self.pool.cancel(future)
+                raise
+        else:
+            await self._execute_async(dofile_path, log_file, is_replace)
+
+    async def _execute_async(self, dofile_path: Path, log_file: Path, is_replace: bool = True):
+        """
+        Execute Stata with asyncio subprocesses, the same commands as the blocking executors.
+
+        The monitors watch the process as they watch a `subprocess.Popen`, and a cancelled
+        run kills it.
+
+        Args:
+            dofile_path: Path to do file
+            log_file: Path to log file
+            is_replace: Whether replace the log file if exists.
+
+        Raises:
+            RuntimeError: Stata execution error
+        """
+        replace_clause = ", replace" if is_replace else ""
+        commands = (
+            "capture log close\n"
+            f'log using "{log_file}"{replace_clause}\n'
+            f'do "{dofile_path}"\n'
+            "log close\n"
+            "exit, STATA\n"
+        )
+
+        batch_file = None
+        if self.is_unix:
+            proc = await asyncio.create_subprocess_exec(
+                self.STATA_CLI,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self.set_fake_terminal_size_env(),
+                cwd=self.cwd
+            )
+            stdin = commands.encode("utf-8")
+        else:
+            # Windows approach - use the /e flag to run a temporary batch do-file
+            batch_file = Path(tempfile.gettempdir()) / f"stata_batch__{dofile_path.stem}.do"
+            with open(batch_file, "w", encoding="utf-8") as f:
+                f.write(commands)
+            proc = await asyncio.create_subprocess_exec(
+                self.STATA_CLI, "/e", "do", str(batch_file),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.cwd
+            )
+            stdin = None
+
+        if self.monitors:
+            logging.info(f"Starting {len(self.monitors)} monitor(s)")
+        for monitor in self.monitors:
+            monitor.start(_MonitoredProcess(proc, asyncio.get_running_loop()))
+
+        try:
+            _, stderr = await proc.communicate(input=stdin)
+        except asyncio.CancelledError:
+            logging.info(f"Cancelled Stata execution (PID: {proc.pid}) of {dofile_path}")
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+            for monitor in self.monitors:
+                try:
+                    monitor.stop()
+                except Exception as e:
+                    logging.debug(f"Monitor stopped after cancellation: {e}")
+            raise
+        finally:
+            if batch_file is not None:
+                batch_file.unlink(missing_ok=True)
+
+        # Stop all monitors (this will raise exceptions if limits were exceeded)
+        for monitor in self.monitors:
+            monitor.stop()
+
+        if proc.returncode != 0:
+            stderr = stderr.decode("utf-8", errors="replace")
+            logging.error(f"Stata execution failed: {stderr}")
+            raise RuntimeError(f"Something went wrong: {stderr}")
+        else:
+            logging.info(f"Stata execution completed successfully. Log file: {log_file}")
+
     @staticmethod
     def read_log(log_file_path, mode="r", encoding="utf-8") -> str:
         try:
@@ -331,3 +537,21 @@ class StataDo:
             return log_content
         except Exception as e:
             return f"Failed to read logfile-{log_file_path}: {e}"
+
+    @staticmethod
+    def read_log_window(log_file_path,
+                        offset: int = 0,
+                        limit: int = None,
+                        tail: int = None,
+                        unit: str = "line",
+                        encoding: str = "utf-8") -> Dict[str, Any]:
+        """
+        Read a window of the log without loading the whole file, see `LogIndex.window`.
+
+        Returns:
+            Dict[str, Any]: the window info, or {"error": ...} if the log cannot be read
+        """
+        try:
+            return LogIndex.for_file(log_file_path).window(offset, limit, tail, unit, encoding)
+        except Exception as e:
+            return {"error": f"Failed to read logfile-{log_file_path}: {e}"}
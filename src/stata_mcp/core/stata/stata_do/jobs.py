@@ -0,0 +1,141 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : jobs.py
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Coroutine, Deque, Dict, Optional
+
+
+@dataclass
+class StataJob:
+    """
+    A do-file execution running in the background.
+
+    Attributes:
+        job_id: Unique id returned to the client
+        dofile_path: The do-file being executed
+        status: One of "running", "finished", "failed" or "cancelled"
+        log_file_path: Path to the log file once the job is finished
+        error: Error message if the job failed
+        log_tail: The latest log lines, filled while the job is running
+    """
+
+    job_id: str
+    dofile_path: str
+    status: str = "running"
+    log_file_path: Optional[str] = None
+    error: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+    log_tail: Deque[str] = field(default_factory=lambda: deque(maxlen=20), repr=False)
+
+    @property
+    def is_done(self) -> bool:
+        return self.status != "running"
+
+    def to_dict(self) -> Dict[str, Any]:
+        end = self.finished_at or time.time()
+        info = {
+            "job_id": self.job_id,
+            "dofile_path": self.dofile_path,
+            "status": self.status,
+            "elapsed_seconds": round(end - self.submitted_at, 3),
+        }
+        if not self.is_done and self.log_tail:
+            info["log_tail"] = "\n".join(self.log_tail)
+        if self.log_file_path:
+            info["log_file_path"] = self.log_file_path
+        if self.error:
+            info["error"] = self.error
+        return info
+
+
+class StataJobManager:
+    """
+    Keep track of do-files submitted as asyncio tasks.
+
+    Only the latest `max_history` finished jobs are kept, running jobs are never dropped.
+
+    Example:
+        >>> manager = StataJobManager()
+        >>> job = manager.submit(executor.execute_dofile_async(dofile_path), dofile_path)
+        >>> manager.get(job.job_id).status
+        'running'
+        >>> manager.cancel(job.job_id)
+        True
+    """
+
+    def __init__(self, max_history: int = 100):
+        self.max_history = max_history
+        self._jobs: "OrderedDict[str, StataJob]" = OrderedDict()
+
+    def submit(self, coro: Coroutine, dofile_path: str | Path, log_tail: Deque[str] = None) -> StataJob:
+        """
+        Start a do-file execution coroutine in the background.
+
+        Args:
+            coro: Coroutine which returns the log file path, e.g. StataDo.execute_dofile_async(...)
+            dofile_path: The do-file being executed
+            log_tail: Buffer the coroutine appends its log lines to, shown while the job is running
+
+        Returns:
+            StataJob: the job handle
+        """
+        job = StataJob(job_id=uuid.uuid4().hex[:12], dofile_path=str(dofile_path))
+        if log_tail is not None:
+            job.log_tail = log_tail
+        job.task = asyncio.create_task(self._run(job, coro))
+        job.task.add_done_callback(lambda task: self._on_done(job, coro))
+        self._jobs[job.job_id] = job
+        self._prune()
+        return job
+
+    def get(self, job_id: str) -> StataJob | None:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a running job, return False if it does not exist or is already done."""
+        job = self._jobs.get(job_id)
+        if job is None or job.is_done:
+            return False
+        return job.task.cancel()
+
+    @staticmethod
+    async def _run(job: StataJob, coro: Coroutine):
+        try:
+            log_file_path = await coro
+            job.log_file_path = str(log_file_path)
+            job.status = "finished"
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            logging.error(f"Job {job.job_id} ({job.dofile_path}) failed: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+
+    @staticmethod
+    def _on_done(job: StataJob, coro: Coroutine):
+        # A task cancelled before its first step never enters _run
+        if job.status == "running":
+            coro.close()
+            job.status = "cancelled"
+            job.finished_at = time.time()
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_done]
+        for job_id in finished[:max(0, len(finished) - self.max_history)]:
+            del self._jobs[job_id]
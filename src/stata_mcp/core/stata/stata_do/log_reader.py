@@ -0,0 +1,157 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : log_reader.py
+
+import mmap
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict
+
+# Bytes compared to tell an appended log from a rewritten one
+_HEAD_SIZE = 256
+
+_NEWLINE = re.compile(b"\n")
+
+
+class LogIndex:
+    """
+    Line-offset index of a (log) file for windowed reads.
+
+    The index stores the byte offset where each line starts and is built once per
+    file; when the file grows only the appended part is scanned, and a rewritten
+    file is indexed again. Every window is read with an mmap slice, so a request for
+    a few lines of a large log never reads the whole file.
+
+    Example:
+        >>> index = LogIndex.for_file("stata-mcp-log/panel.log")
+        >>> index.window(tail=50)["content"]
+        '. xtreg y x, fe ...'
+        >>> index.window(offset=1000, limit=200)
+        {'content': '...', 'unit': 'line', 'start': 1000, 'end': 1200, 'total': 48213, 'has_more': True}
+    """
+
+    UNITS = ("line", "byte")
+
+    _indexes: "OrderedDict[str, LogIndex]" = OrderedDict()
+    _indexes_lock = threading.Lock()
+    max_indexes: int = 32
+
+    def __init__(self, file_path: str | Path):
+        self.file_path = Path(file_path)
+        self._starts = array("Q", [0])
+        self._indexed = 0
+        self._head = b""
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_file(cls, file_path: str | Path) -> "LogIndex":
+        """Return the shared index of `file_path`, creating it on first use."""
+        key = str(Path(file_path).resolve())
+        with cls._indexes_lock:
+            index = cls._indexes.get(key)
+            if index is None:
+                index = cls._indexes[key] = cls(key)
+                while len(cls._indexes) > cls.max_indexes:
+                    cls._indexes.popitem(last=False)
+            else:
+                cls._indexes.move_to_end(key)
+        return index
+
+    @property
+    def size(self) -> int:
+        return self._indexed
+
+    @property
+    def total_lines(self) -> int:
+        # The last start equals the size if the file ends with a newline
+        return len(self._starts) - (1 if self._starts[-1] == self._indexed else 0)
+
+    def refresh(self):
+        """Bring the index up to date with the file on disk."""
+        with self._lock:
+            size = self.file_path.stat().st_size
+            if size == 0:
+                self._reset()
+                return
+
+            with open(self.file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)  # The log may have grown since stat
+                head = mm[:_HEAD_SIZE]
+                if size < self._indexed or head[:len(self._head)] != self._head:
+                    self._reset()
+                if size == self._indexed:
+                    return
+
+                self._starts.extend(match.end() for match in _NEWLINE.finditer(mm, self._indexed))
+                self._indexed = size
+                self._head = head
+
+    def window(self,
+               offset: int = 0,
+               limit: int = None,
+               tail: int = None,
+               unit: str = "line",
+               encoding: str = "utf-8") -> Dict[str, Any]:
+        """
+        Read a window of the file.
+
+        Args:
+            offset: First line (or byte) of the window, 0-based
+            limit: Number of lines (or bytes) to return, None reads to the end
+            tail: Return the last `tail` lines (or bytes) instead, overrides `offset`
+            unit: "line" or "byte"
+            encoding: Encoding used to decode the window
+
+        Returns:
+            Dict[str, Any]: "content" of the window, its "start" and "end" (exclusive) in `unit`,
+                the "total" lines (or bytes) of the file and whether "has_more" follows the window
+        """
+        if unit not in self.UNITS:
+            raise ValueError(f"unit must be one of {self.UNITS}, got {unit!r}")
+        if offset < 0 or (limit is not None and limit < 0) or (tail is not None and tail < 0):
+            raise ValueError("offset, limit and tail must not be negative")
+
+        self.refresh()
+        with self._lock:
+            total = self.total_lines if unit == "line" else self._indexed
+            start = max(0, total - tail) if tail is not None else min(offset, total)
+            end = total if limit is None or tail is not None else min(start + limit, total)
+
+            if unit == "line":
+                begin_byte = self._starts[start]
+                end_byte = self._starts[end] if end < len(self._starts) else self._indexed
+            else:
+                begin_byte, end_byte = start, end
+
+            content = self._read_bytes(begin_byte, end_byte).decode(encoding, errors="replace")
+
+        if unit == "line":
+            content = content.replace("\r\n", "\n").removesuffix("\n")
+
+        return {
+            "content": content,
+            "unit": unit,
+            "start": start,
+            "end": end,
+            "total": total,
+            "has_more": end < total,
+        }
+
+    def _read_bytes(self, begin: int, end: int) -> bytes:
+        if end <= begin:
+            return b""
+        with open(self.file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[begin:end]
+
+    def _reset(self):
+        self._starts = array("Q", [0])
+        self._indexed = 0
+        self._head = b""
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : log_tail.py
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, List, Tuple
+
+
+class LogTailer:
+    """
+    Follow a log file while Stata is still writing it.
+
+    The tailer keeps its byte offset, so every poll only reads what was appended
+    since the last one, and a trailing partial line is held back until it is
+    complete. Polling is adaptive: it starts at `min_interval` and doubles up to
+    `max_interval` while the file does not grow, then drops back as soon as new
+    output arrives.
+
+    A log left by a previous run under the same name is skipped until it is replaced: the
+    file is read from its start as soon as its inode or modification time changes, even if
+    the new log has already grown past the old size.
+
+    Example:
+        >>> done = asyncio.Event()
+        >>> async for lines in LogTailer(log_file).follow(done):
+        ...     print("\\n".join(lines))
+    """
+
+    def __init__(self,
+                 log_file: Path,
+                 encoding: str = "utf-8",
+                 min_interval: float = 0.05,
+                 max_interval: float = 1.0):
+        self.log_file = Path(log_file)
+        self.encoding = encoding
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        # A previous log with the same name is not streamed, `log using ..., replace` rewrites it
+        self.offset = 0
+        self._partial = b""
+        self._previous = self._identity()
+
+    def read_new_lines(self, flush: bool = False) -> List[str]:
+        """
+        Read the complete lines appended since the last call.
+
+        Args:
+            flush: Also return the trailing partial line, used once the writer is done
+
+        Returns:
+            List[str]: new lines without line endings
+        """
+        if self._previous is not None:
+            if self._identity() == self._previous:
+                return []
+            self._previous = None  # Replaced, its content is the new log
+
+        size = self._size()
+        if size < self.offset:
+            # The file was truncated or replaced, start over
+            self.offset = 0
+            self._partial = b""
+
+        chunk = b""
+        if size > self.offset:
+            with open(self.log_file, "rb") as f:
+                f.seek(self.offset)
+                chunk = f.read(size - self.offset)
+            self.offset += len(chunk)
+
+        data = self._partial + chunk
+        *lines, self._partial = data.split(b"\n")
+        if flush and self._partial:
+            lines.append(self._partial)
+            self._partial = b""
+
+        return [line.rstrip(b"\r").decode(self.encoding, errors="replace") for line in lines]
+
+    async def follow(self, done: asyncio.Event) -> AsyncIterator[List[str]]:
+        """
+        Yield batches of new lines until `done` is set and the file is drained.
+
+        Args:
+            done: Set by the caller once the writer has finished
+        """
+        interval = self.min_interval
+        while True:
+            is_done = done.is_set()
+            lines = self.read_new_lines(flush=is_done)
+            if lines:
+                yield lines
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+
+            if is_done:
+                return
+            try:
+                await asyncio.wait_for(done.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _identity(self) -> Tuple[int, int, int] | None:
+        """Get the inode, modification time and size of the log, None if it does not exist."""
+        try:
+            stat = self.log_file.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _size(self) -> int:
+        try:
+            return self.log_file.stat().st_size
+        except OSError:
+            return 0
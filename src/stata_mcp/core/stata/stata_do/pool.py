@@ -0,0 +1,269 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : pool.py
+
+import logging
+import os
+import queue
+import subprocess
+import threading
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .do import StataDo
+
+
+class StataWorker:
+    """
+    A long-lived Stata process which runs do-files fed through its stdin.
+
+    The worker pays Stata's startup and license check once, then every job is
+    only a few commands written to the same process. Completion of a job is
+    detected with a unique sentinel printed by `display` after the do-file.
+    """
+
+    def __init__(self, stata_cli: str, cwd: Path = None, env: dict = None):
+        self.stata_cli = stata_cli
+        self.cwd = cwd or Path.cwd()
+        self.env = env or os.environ.copy()
+        self.proc: Optional[subprocess.Popen] = None
+        self.jobs_done = 0
+
+    @property
+    def is_alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self):
+        """
+        Start the Stata process and wait until it answers a command.
+
+        Raises:
+            RuntimeError: Stata exits before it is ready
+        """
+        self.proc = subprocess.Popen(
+            [self.stata_cli],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # Merge stderr, one pipe to drain is enough
+            text=True,
+            bufsize=1,
+            shell=False,
+            env=self.env,
+            cwd=self.cwd
+        )
+        self.jobs_done = 0
+        self._send("set more off")
+        self._sync()
+        logging.info(f"Stata worker (PID: {self.proc.pid}) is ready")
+
+    def run(self,
+            dofile_path: Path,
+            log_file: Path,
+            is_replace: bool = True,
+            monitors: Optional[List] = None) -> Path:
+        """
+        Run a do-file in this worker and reset the session afterward.
+
+        Args:
+            dofile_path: Path to do file
+            log_file: Path to log file
+            is_replace: Whether replace the log file if exists.
+            monitors: Monitor instances started against the worker process
+
+        Returns:
+            Path: Path to generated log file
+
+        Raises:
+            RuntimeError: The worker exits while running the job
+        """
+        monitors = monitors or []
+        replace_clause = ", replace" if is_replace else ""
+
+        for monitor in monitors:
+            monitor.start(self.proc)
+        try:
+            self._send(
+                "capture log close",
+                f'log using "{log_file}"{replace_clause}',
+                f'do "{dofile_path}"',
+                "capture log close",
+                # Reset the session so the next job starts from a clean Stata
+                "clear all",
+                "macro drop _all",
+                f'capture cd "{self.cwd}"',
+            )
+            self._sync()
+        finally:
+            # Stop all monitors (this will raise exceptions if limits were exceeded)
+            for monitor in monitors:
+                monitor.stop()
+
+        self.jobs_done += 1
+        return log_file
+
+    def close(self):
+        """Exit Stata, killing it if it does not leave in time."""
+        if self.proc is None:
+            return
+        try:
+            if self.is_alive:
+                self._send("exit, clear")
+                self.proc.wait(timeout=5)
+        except Exception as e:
+            logging.warning(f"Could not close Stata worker (PID: {self.proc.pid}) with error: {e}")
+            self.proc.kill()
+        finally:
+            self.proc = None
+
+    def _send(self, *commands: str):
+        self.proc.stdin.write("\n".join(commands) + "\n")
+        self.proc.stdin.flush()
+
+    def _sync(self):
+        token = f"__stata_mcp_done_{uuid.uuid4().hex}__"
+        self._send(f'display "{token}"')
+
+        # The echoed command line also contains the token, only the bare output line matches
+        for line in self.proc.stdout:
+            if line.strip() == token:
+                return
+        raise RuntimeError(f"Stata worker exited unexpectedly with return code {self.proc.wait()}")
+
+
+class StataPool:
+    """
+    A pool of pre-started Stata workers which take do-files from a queue.
+
+    Each pool thread owns one `StataWorker`. A worker is recycled after
+    `max_jobs_per_worker` jobs, or as soon as its process dies (a crash, a
+    do-file calling `exit`, or a monitor killing it), and a fresh one is
+    started before the next job arrives.
+
+    Only Unix-like systems are supported, as the workers are driven through stdin.
+
+    Example:
+        >>> pool = StataPool("/usr/local/bin/stata-mp", size=2)
+        >>> pool.execute(Path("analysis.do"), Path("analysis.log"))
+        PosixPath('analysis.log')
+        >>> pool.close()
+    """
+
+    def __init__(self,
+                 stata_cli: str,
+                 cwd: Path = None,
+                 size: int = 2,
+                 max_jobs_per_worker: int = 50):
+        self.stata_cli = stata_cli
+        self.cwd = cwd or Path.cwd()
+        self.size = max(1, size)
+        self.max_jobs_per_worker = max_jobs_per_worker
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._running: Dict[Future, StataWorker] = {}
+        self._threads = [
+            threading.Thread(target=self._worker_loop, name=f"stata-pool-{i}", daemon=True)
+            for i in range(self.size)
+        ]
+        self._closed = False
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self,
+               dofile_path: Path,
+               log_file: Path,
+               is_replace: bool = True,
+               monitors: Optional[List] = None) -> Future:
+        """
+        Queue a do-file for the next idle worker.
+
+        Returns:
+            Future: resolves to the log file path, or raises the job's error
+        """
+        if self._closed:
+            raise RuntimeError("StataPool is closed")
+
+        future: Future = Future()
+        self._jobs.put((future, (dofile_path, log_file, is_replace, monitors)))
+        return future
+
+    def execute(self,
+                dofile_path: Path,
+                log_file: Path,
+                is_replace: bool = True,
+                monitors: Optional[List] = None) -> Path:
+        """Run a do-file on the pool and wait for it to finish."""
+        return self.submit(dofile_path, log_file, is_replace, monitors).result()
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Cancel a submitted job, killing its worker if the job is already running.
+
+        The killed worker is recycled like after a crash.
+        """
+        if future.cancel():
+            return True
+        worker = self._running.get(future)
+        if worker is not None and worker.is_alive:
+            logging.info(f"Killing Stata worker (PID: {worker.proc.pid}) to cancel its job")
+            worker.proc.kill()
+            return True
+        return False
+
+    def close(self):
+        """Stop all workers after the queued jobs are done."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=10)
+
+    def _spawn(self) -> StataWorker:
+        worker = StataWorker(self.stata_cli, cwd=self.cwd, env=StataDo.set_fake_terminal_size_env())
+        worker.start()
+        return worker
+
+    def _worker_loop(self):
+        worker: Optional[StataWorker] = None
+
+        while True:
+            # Keep the worker warm before waiting for the next job
+            if worker is None:
+                try:
+                    worker = self._spawn()
+                except Exception as e:
+                    logging.error(f"Failed to start Stata worker: {e}")
+
+            job = self._jobs.get()
+            if job is None:
+                break
+
+            future, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                if worker is None:
+                    worker = self._spawn()
+                self._running[future] = worker
+                future.set_result(worker.run(*args))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self._running.pop(future, None)
+
+            if worker is not None and (not worker.is_alive or worker.jobs_done >= self.max_jobs_per_worker):
+                logging.info(f"Recycling Stata worker after {worker.jobs_done} job(s)")
+                worker.close()
+                worker = None
+
+        if worker is not None:
+            worker.close()
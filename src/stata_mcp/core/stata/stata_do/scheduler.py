@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : scheduler.py
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+
+class StataScheduler:
+    """
+    Run independent do-files at the same time with a bounded number of Stata processes.
+
+    Jobs with a higher priority start first, jobs with the same priority start in
+    submission order. A new job is only admitted while the free RAM reported by
+    psutil stays above `min_free_ram_mb`; when nothing is running the next job is
+    always admitted, so a low-memory machine still makes progress one job at a time.
+
+    Example:
+        >>> scheduler = StataScheduler(max_concurrency=8, min_free_ram_mb=2048)
+        >>> futures = [scheduler.submit(partial(executor.execute_dofile, p)) for p in dofiles]
+        >>> [f.result() for f in futures]
+        [PosixPath('.../a.log'), PosixPath('.../b.log')]
+    """
+
+    def __init__(self,
+                 max_concurrency: int = None,
+                 min_free_ram_mb: Optional[int] = None,
+                 admission_interval: float = 0.5):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of do-files running at once, default is half of the CPU cores
+            min_free_ram_mb: Free RAM required to start another job, None disables the admission control
+            admission_interval: Seconds to wait before checking the free RAM again
+        """
+        self.max_concurrency = max_concurrency or max(1, (os.cpu_count() or 1) // 2)
+        self.min_free_ram_mb = min_free_ram_mb
+        self.admission_interval = admission_interval
+
+        self._queue: List[Tuple[int, int, Future, Callable[[], Path]]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._running = 0
+        self._dispatcher: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def submit(self, run: Callable[[], Path], priority: int = 0) -> Future:
+        """
+        Queue a job.
+
+        Args:
+            run: Callable which executes one do-file and returns its log file path
+            priority: Higher runs first, default is 0
+
+        Returns:
+            Future: resolves to the value returned by `run`
+        """
+        future: Future = Future()
+        with self._cond:
+            heapq.heappush(self._queue, (-priority, next(self._seq), future, run))
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch_loop, name="stata-scheduler", daemon=True)
+                self._dispatcher.start()
+            self._cond.notify_all()
+        return future
+
+    def _has_free_ram(self) -> bool:
+        if self.min_free_ram_mb is None or self._running == 0:
+            return True
+
+        import psutil  # Only needed once jobs compete for memory
+
+        free_ram_mb = psutil.virtual_memory().available / 1024 / 1024
+        if free_ram_mb < self.min_free_ram_mb:
+            logging.debug(f"Holding next job, free RAM {free_ram_mb:.0f}MB < {self.min_free_ram_mb}MB")
+            return False
+        return True
+
+    def _dispatch_loop(self):
+        while True:
+            with self._cond:
+                while not self._queue or self._running >= self.max_concurrency:
+                    self._cond.wait()
+
+                if not self._has_free_ram():
+                    # Wake up on a finished job or after the interval, whichever comes first
+                    self._cond.wait(self.admission_interval)
+                    continue
+
+                _, _, future, run = heapq.heappop(self._queue)
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._running += 1
+
+            threading.Thread(target=self._run, args=(future, run), daemon=True).start()
+
+    def _run(self, future: Future, run: Callable[[], Path]):
+        try:
+            future.set_result(run())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._cond.notify_all()
@@ -0,0 +1,15 @@
+from .base import LOG_PARSER_REGISTRY, LogParserBase, get_log_parser
+from .estimation import EstimationParser
+from .parser import StataLogParser
+from .summarize import SummarizeParser
+from .tabulate import TabulateParser
+
+__all__ = [
+    "EstimationParser",
+    "LogParserBase",
+    "StataLogParser",
+    "SummarizeParser",
+    "TabulateParser",
+    "LOG_PARSER_REGISTRY",
+    "get_log_parser",
+]
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : base.py
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+# Registry of log parsers, keyed by the full Stata command name
+LOG_PARSER_REGISTRY: Dict[str, type] = {}
+
+NUMBER = re.compile(r"^-?(?:\d[\d,]*)?(?:\.\d+)?(?:e[-+]?\d+)?$", re.IGNORECASE)
+
+# Key-value statistics in estimation headers, e.g. "Number of obs   =   74" or "Prob > F = 0.0000"
+HEADER_STAT = re.compile(
+    r"(?P<key>[A-Za-z](?:[^=|:\s]|\s(?!\s))*?)\s*=\s*(?P<value>-?[\d.,]+(?:e[-+]?\d+)?)(?=\s|$)",
+    re.IGNORECASE
+)
+
+
+def to_number(token: str) -> int | float | None:
+    """Convert a number printed by Stata, e.g. "1,234", "-.5" or "." (missing)."""
+    token = token.strip().replace(",", "")
+    if token in ("", "."):
+        return None
+    try:
+        value = float(token)
+    except ValueError:
+        return None
+    if value.is_integer() and re.fullmatch(r"-?\d+", token):
+        return int(value)
+    return value
+
+
+def is_number(token: str) -> bool:
+    return token == "." or bool(NUMBER.match(token) and any(c.isdigit() for c in token))
+
+
+def split_row(line: str) -> Tuple[str, List[str]] | None:
+    """
+    Split a table row like "  weight |  1.746559  .6413538  2.72" into its label and cells.
+
+    Returns:
+        Tuple[str, List[str]] | None: the label left of the first "|" and the whitespace separated
+            cells right of it ("|" dropped), or None if the line is not a table row
+    """
+    if "|" not in line:
+        return None
+    label, rest = line.split("|", 1)
+    return label.strip(), rest.replace("|", " ").split()
+
+
+class LogParserBase(ABC):
+    """
+    Base class of the parsers turning the output of one Stata command into JSON.
+
+    Subclasses declare the commands they handle in `commands`, mapping the full command
+    name to its shortest abbreviation length, and are registered automatically.
+    The driver feeds them every output line of one command, then calls `result`.
+
+    Example:
+        >>> class ListParser(LogParserBase):
+        ...     name = "list"
+        ...     commands = {"list": 1}
+        ...     def feed(self, line): ...
+        ...     def result(self): ...
+    """
+
+    name: str = ""
+    commands: Dict[str, int] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Register subclasses in LOG_PARSER_REGISTRY under every command they handle."""
+        super().__init_subclass__(**kwargs)
+        for command in cls.commands:
+            LOG_PARSER_REGISTRY[command.lower()] = cls
+
+    def __init__(self, command: str):
+        """
+        Args:
+            command: The full command line, prefixes like `quietly` or `by x:` removed
+        """
+        self.command = command
+
+    @property
+    def command_name(self) -> str:
+        """The full name of the command, e.g. "regress" for `reg y x`."""
+        typed = self.command.split()[0].split(",")[0].lower() if self.command.strip() else ""
+        for full_name in self.commands:
+            if full_name.startswith(typed):
+                return full_name
+        return typed
+
+    @abstractmethod
+    def feed(self, line: str):
+        """Consume one output line of the command."""
+
+    @abstractmethod
+    def result(self) -> Dict[str, Any] | None:
+        """Return the structured result, or None if the output had nothing to extract."""
+
+
+def get_log_parser(command_name: str) -> type | None:
+    """
+    Get the parser class for a (possibly abbreviated) Stata command name.
+
+    Args:
+        command_name: The command as typed, e.g. "reg", "summ" or "xtreg"
+
+    Returns:
+        LogParserBase subclass or None if no parser handles the command
+    """
+    command_name = command_name.lower()
+    if command_name in LOG_PARSER_REGISTRY:
+        return LOG_PARSER_REGISTRY[command_name]
+    for full_name, parser_cls in LOG_PARSER_REGISTRY.items():
+        min_length = parser_cls.commands.get(full_name, len(full_name))
+        if len(command_name) >= min_length and full_name.startswith(command_name):
+            return parser_cls
+    return None
@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : estimation.py
+
+import re
+from typing import Any, Dict
+
+from .base import HEADER_STAT, LogParserBase, is_number, split_row, to_number
+
+COEF_COLUMNS = ["coef", "se", "stat", "p", "ci_low", "ci_high"]
+
+# Rows of factor variables without an estimate
+NOTES = re.compile(r"\((omitted|base|empty)\)")
+
+
+class EstimationParser(LogParserBase):
+    """
+    Parse the header statistics and the coefficient table of linear regressions.
+
+    Result:
+        {
+            "type": "estimation",
+            "estimator": "regress",
+            "command": "regress price mpg weight",
+            "depvar": "price",
+            "stat_name": "t",
+            "stats": {"Number of obs": 74, "R-squared": 0.2934, ...},
+            "coefficients": {"mpg": {"coef": -49.51, "se": 86.16, "stat": -0.57, "p": 0.567, ...}, ...},
+        }
+
+    Rows with a single value after the table separator (e.g. sigma_u, rho of xtreg) go to "stats".
+    Levels of factor variables are named "<variable>: <level>".
+    """
+
+    name = "estimation"
+    commands = {"regress": 3, "xtreg": 5, "reghdfe": 7, "areg": 4, "ivregress": 5}
+
+    def __init__(self, command: str):
+        super().__init__(command)
+        self.stats: Dict[str, Any] = {}
+        self.coefficients: Dict[str, Dict[str, Any]] = {}
+        self.depvar: str | None = None
+        self.stat_name: str | None = None
+        self._state = "header"  # header -> table -> done
+        self._group: str | None = None
+
+    def feed(self, line: str):
+        if self._state == "done":
+            return
+
+        if self._state == "header":
+            if "|" in line and re.search(r"\bCoef(ficient|\.)", line):
+                self.depvar = line.split("|", 1)[0].strip() or None
+                # "Coefficient  Std. err.  t  P>|t|" -> "t"
+                match = re.search(r"\s(t|z)\s+P>\|", line)
+                self.stat_name = match.group(1) if match else None
+                self._state = "table"
+                return
+            # The ANOVA table of regress shares its lines with the header statistics
+            for match in HEADER_STAT.finditer(line.rsplit("|", 1)[-1]):
+                self.stats[match.group("key")] = to_number(match.group("value"))
+            return
+
+        # Coefficient table
+        stripped = line.strip()
+        if not stripped or set(stripped) <= {"-", "+"}:
+            if stripped and "+" not in stripped and self.coefficients:
+                self._state = "done"
+            return
+
+        row = split_row(line)
+        if row is None:
+            return
+        label, cells = row
+        if not label:
+            # Blank row, closes the levels of a factor variable
+            self._group = None
+            return
+
+        numbers = [to_number(cell) for cell in cells if is_number(cell)]
+        note = NOTES.search(line)
+        if note:
+            self.coefficients[self._name(label)] = {"coef": numbers[0] if numbers else None, "note": note.group(1)}
+        elif len(numbers) >= len(COEF_COLUMNS):
+            self.coefficients[self._name(label)] = dict(zip(COEF_COLUMNS, numbers))
+        elif len(numbers) == 1:
+            self.stats[label] = numbers[0]
+        elif not cells:
+            # Header row of a factor variable, its levels follow; long interactions wrap after "#"
+            if self._group and self._group.endswith("#"):
+                self._group += label
+            else:
+                self._group = label
+
+    def result(self) -> Dict[str, Any] | None:
+        if not self.coefficients:
+            return None
+        return {
+            "type": self.name,
+            "estimator": self.command_name,
+            "command": self.command,
+            "depvar": self.depvar,
+            "stat_name": self.stat_name,
+            "stats": self.stats,
+            "coefficients": self.coefficients,
+        }
+
+    def _name(self, label: str) -> str:
+        return f"{self._group}: {label}" if self._group else label
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : parser.py
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .base import LogParserBase, get_log_parser
+
+COMMAND_LINE = re.compile(r"^\.(?:$| (.*)$)")
+CONTINUATION_LINE = re.compile(r"^> (.*)$")
+ERROR_LINE = re.compile(r"^r\((\d+)\);\s*$")
+
+# Prefixes which do not change the output format, e.g. `quietly`, `capture noisily`, `by foreign:`
+COMMAND_PREFIX = re.compile(
+    r"^(?:(?:qui\w*|noi\w*|cap\w*)\b\s*:?\s*|(?:by\w*|xi|svy)\b[^:]*:\s*)",
+    re.IGNORECASE
+)
+
+
+class StataLogParser:
+    """
+    Single-pass parser turning a Stata log into compact JSON.
+
+    Lines are fed one at a time: a command line (". regress y x") closes the block of
+    the previous command and opens a new one, handled by the parser registered for
+    the command in LOG_PARSER_REGISTRY; an error code line ("r(111);") is recorded
+    together with the command and the message printed before it.
+
+    Example:
+        >>> StataLogParser.parse_file("stata-mcp-log/analysis.log")
+        {
+            "commands": 12,
+            "errors": [{"code": 111, "line": 40, "command": "regress y z", "message": "variable z not found"}],
+            "results": [{"type": "estimation", "estimator": "regress", ...}, {"type": "summarize", ...}],
+        }
+    """
+
+    def __init__(self):
+        self.commands = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.results: List[Dict[str, Any]] = []
+
+        self._line_number = 0
+        self._command: str | None = None
+        self._parser: LogParserBase | None = None
+        self._in_command = False  # Continuation lines ("> ...") still belong to the command
+        self._last_output = ""
+
+    @classmethod
+    def parse_file(cls, log_file_path: str | Path, encoding: str = "utf-8") -> Dict[str, Any]:
+        """Parse a log file line by line, the file is never loaded as a whole."""
+        parser = cls()
+        with open(log_file_path, "r", encoding=encoding, errors="replace") as f:
+            for line in f:
+                parser.feed(line)
+        return parser.result()
+
+    def feed(self, line: str):
+        self._line_number += 1
+        line = line.rstrip("\r\n")
+
+        continuation = CONTINUATION_LINE.match(line)
+        if continuation and self._in_command:
+            self._start(f"{self._command} {continuation.group(1).strip()}")
+            return
+
+        command = COMMAND_LINE.match(line)
+        if command:
+            self._close()
+            if command.group(1) and command.group(1).strip():
+                self.commands += 1
+                self._start(command.group(1).strip())
+            return
+        self._in_command = False
+
+        error = ERROR_LINE.match(line)
+        if error:
+            if self._last_output == "end of do-file" and self.errors and self.errors[-1]["code"] == int(error.group(1)):
+                return  # The error is repeated when the do-file stops
+            self.errors.append({
+                "code": int(error.group(1)),
+                "line": self._line_number,
+                "command": self._command,
+                "message": self._last_output,
+            })
+            return
+
+        if line.strip():
+            self._last_output = line.strip()
+        if self._parser is not None:
+            self._parser.feed(line)
+
+    def result(self) -> Dict[str, Any]:
+        self._close()
+        return {
+            "commands": self.commands,
+            "errors": self.errors,
+            "results": self.results,
+        }
+
+    def _start(self, command: str):
+        self._command = command
+        self._in_command = True
+        self._last_output = ""
+
+        stripped = command
+        while match := COMMAND_PREFIX.match(stripped):
+            if not match.group(0):
+                break
+            stripped = stripped[match.end():]
+        name = re.split(r"[\s,]", stripped, maxsplit=1)[0]
+        parser_cls = get_log_parser(name) if name else None
+        self._parser = parser_cls(stripped) if parser_cls is not None else None
+
+    def _close(self):
+        if self._parser is not None:
+            result = self._parser.result()
+            if result is not None:
+                self.results.append(result)
+        self._parser = None
+        self._command = None
+        self._in_command = False
@@ -0,0 +1,90 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : summarize.py
+
+import re
+from typing import Any, Dict
+
+from .base import LogParserBase, split_row, to_number
+
+SUMMARY_COLUMNS = ["obs", "mean", "sd", "min", "max"]
+
+# Statistics of `summarize, detail`, right of the percentiles
+DETAIL_STATS = {
+    "Obs": "obs",
+    "Sum of wgt.": "sum_wgt",
+    "Mean": "mean",
+    "Std. dev.": "sd",
+    "Std. Dev.": "sd",
+    "Variance": "variance",
+    "Skewness": "skewness",
+    "Kurtosis": "kurtosis",
+}
+DETAIL_STAT = re.compile(r"(%s)\s+(-?[\d.,]+(?:e[-+]?\d+)?)\s*$" % "|".join(re.escape(k) for k in DETAIL_STATS))
+PERCENTILE = re.compile(r"^\s*(\d+)%\s+(-?[\d.,]+(?:e[-+]?\d+)?)")
+
+
+class SummarizeParser(LogParserBase):
+    """
+    Parse the table of `summarize` and the per-variable blocks of `summarize, detail`.
+
+    Result:
+        {
+            "type": "summarize",
+            "command": "summarize price mpg",
+            "variables": {"price": {"obs": 74, "mean": 6165.257, "sd": 2949.496, "min": 3291, "max": 15906}, ...},
+        }
+
+    With `detail` every variable also has "percentiles" ({"1": ..., "50": ...}), "variance",
+    "skewness" and "kurtosis".
+    """
+
+    name = "summarize"
+    commands = {"summarize": 2}
+
+    def __init__(self, command: str):
+        super().__init__(command)
+        self.variables: Dict[str, Dict[str, Any]] = {}
+        self._previous = ""
+        self._current: Dict[str, Any] | None = None
+
+    def feed(self, line: str):
+        stripped = line.strip()
+
+        row = split_row(line)
+        if row is not None:
+            label, cells = row
+            # A variable without observations only shows "0" as Obs
+            if label and label != "Variable" and len(cells) in (1, len(SUMMARY_COLUMNS)):
+                self.variables[label] = dict(zip(SUMMARY_COLUMNS, (to_number(cell) for cell in cells)))
+            return
+
+        # `summarize, detail`: the variable name (or its label) is centered above a line of dashes
+        if stripped and set(stripped) == {"-"}:
+            if self._previous:
+                self._current = self.variables.setdefault(self._previous, {"percentiles": {}})
+            return
+        self._previous = stripped
+
+        if self._current is None:
+            return
+        percentile = PERCENTILE.match(line)
+        if percentile:
+            self._current["percentiles"][percentile.group(1)] = to_number(percentile.group(2))
+        stat = DETAIL_STAT.search(line)
+        if stat:
+            self._current[DETAIL_STATS[stat.group(1)]] = to_number(stat.group(2))
+
+    def result(self) -> Dict[str, Any] | None:
+        if not self.variables:
+            return None
+        return {
+            "type": self.name,
+            "command": self.command,
+            "variables": self.variables,
+        }
@@ -0,0 +1,138 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : tabulate.py
+
+import re
+from typing import Any, Dict, List
+
+from .base import LogParserBase, split_row, to_number
+
+ONEWAY_COLUMNS = ["freq", "percent", "cum"]
+
+# e.g. "Pearson chi2(4) =  27.2640   Pr = 0.000" or "Fisher's exact = 0.012"
+TEST_STAT = re.compile(r"^\s*(?P<name>[A-Za-z][^=|]*?)\s*=\s*(?P<stat>-?[\d.]+)(?:\s+Pr\s*=\s*(?P<p>[\d.]+))?\s*$")
+
+
+class TabulateParser(LogParserBase):
+    """
+    Parse one-way and two-way tables of `tabulate`.
+
+    Result of a one-way table:
+        {
+            "type": "tabulate",
+            "command": "tabulate foreign",
+            "variable": "Car type",
+            "rows": [{"value": "Domestic", "freq": 52, "percent": 70.27, "cum": 70.27}, ...],
+            "total": 74,
+        }
+
+    Result of a two-way table:
+        {
+            "type": "tabulate",
+            "command": "tabulate rep78 foreign, chi2",
+            "row_variable": "rep78",
+            "col_variable": "Car type",
+            "columns": ["Domestic", "Foreign"],
+            "rows": [{"value": "1", "counts": [2, 0], "total": 2}, ...],
+            "total": {"counts": [48, 21], "total": 69},
+            "tests": {"Pearson chi2(4)": {"stat": 27.264, "p": 0.0}},
+        }
+
+    Only the frequencies are kept, the extra lines of the `row`, `column` and `cell` options are skipped.
+    """
+
+    name = "tabulate"
+    commands = {"tabulate": 2}
+
+    def __init__(self, command: str):
+        super().__init__(command)
+        self._header: List[str] = []
+        self._state = "header"  # header -> rows -> tests
+        self._oneway = False
+        self._column_ends: List[int] = []
+        self.rows: List[Dict[str, Any]] = []
+        self.total: Any = None
+        self.tests: Dict[str, Dict[str, Any]] = {}
+
+    def feed(self, line: str):
+        stripped = line.strip()
+
+        if self._state == "header":
+            if stripped.startswith("+") or (stripped.startswith("|") and stripped.endswith("|")):
+                return  # Box with the key of the cell contents
+            if "+" in stripped and set(stripped) <= {"-", "+"}:
+                if self._header:
+                    self._oneway = "Freq." in self._header[-1]
+                    self._state = "rows"
+            elif "|" in line:
+                self._header.append(line)
+            return
+
+        if self._state == "rows":
+            row = split_row(line)
+            if row is None or set(stripped) <= {"-", "+"}:
+                return
+            label, cells = row
+            if not label:
+                return  # Percentages of the previous row
+            numbers = [to_number(cell) for cell in cells]
+            if label == "Total":
+                if self._oneway:
+                    self.total = numbers[0] if numbers else None
+                else:
+                    self.total = {"counts": numbers[:-1], "total": numbers[-1] if numbers else None}
+                self._state = "tests"
+            elif self._oneway:
+                self.rows.append({"value": label, **dict(zip(ONEWAY_COLUMNS, numbers))})
+            else:
+                if not self._column_ends:
+                    self._column_ends = self._find_column_ends(line)
+                self.rows.append({"value": label, "counts": numbers[:-1], "total": numbers[-1] if numbers else None})
+            return
+
+        test = TEST_STAT.match(line)
+        if test:
+            self.tests[test.group("name")] = {
+                "stat": to_number(test.group("stat")),
+                "p": to_number(test.group("p")) if test.group("p") else None,
+            }
+
+    def result(self) -> Dict[str, Any] | None:
+        if not self.rows:
+            return None
+
+        # Long variable labels wrap over several header lines
+        left = " ".join(filter(None, (line.split("|", 1)[0].strip() for line in self._header)))
+        result: Dict[str, Any] = {"type": self.name, "command": self.command}
+        if self._oneway:
+            result["variable"] = left
+        else:
+            right = (line.split("|", 1)[1].strip() for line in self._header[:-1])
+            result["row_variable"] = left
+            result["col_variable"] = " ".join(filter(None, right)) or None
+            result["columns"] = self._column_labels()
+        result["rows"] = self.rows
+        result["total"] = self.total
+        if self.tests:
+            result["tests"] = self.tests
+        return result
+
+    @staticmethod
+    def _find_column_ends(line: str) -> List[int]:
+        # Cells and column labels are right aligned, so the end of each cell marks a column
+        start = line.index("|") + 1
+        end = line.index("|", start) if "|" in line[start:] else len(line)
+        return [match.end() + start for match in re.finditer(r"\S+", line[start:end])]
+
+    def _column_labels(self) -> List[str]:
+        header = self._header[-1]
+        labels, previous = [], header.index("|") + 1
+        for end in self._column_ends:
+            labels.append(header[previous:end].strip())
+            previous = end
+        return labels
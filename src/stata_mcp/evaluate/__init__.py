@@ -1,5 +1,15 @@
-from .agent_runner import AgentRunner
-from .score_it import ScoreModel
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_module
+
+if TYPE_CHECKING:
+    from .agent_runner import AgentRunner
+    from .score_it import ScoreModel
+
+__getattr__, __dir__ = lazy_module(__name__, {
+    "AgentRunner": ".agent_runner",
+    "ScoreModel": ".score_it",
+})
 
 __all__ = [
     "ScoreModel",
@@ -7,22 +7,26 @@
 # @Email  : sepinetam@gmail.com
 # @File   : mcp_servers.py
 
+import asyncio
+import atexit
 import logging
 import logging.handlers
+from collections import deque
 from datetime import datetime
+from functools import cache, partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+from urllib.parse import urlparse
 
-from mcp.server.fastmcp import FastMCP, Icon, Image
+from mcp.server.fastmcp import Context, FastMCP, Icon, Image
 
 from .config import Config
-from .core.data_info import get_data_handler
-from .core.stata import StataDo
-from .core.stata.builtin_tools.ado_install import GITHUB_Install, NET_Install, SSC_Install
-from .core.stata.builtin_tools.help import StataHelp as Help
+from .core.stata import StataDo, StataLogParser, StataPool
+from .core.stata.stata_do import DoResultCache, LogIndex, StataJobManager, StataScheduler
 from .core.types import RAMLimitExceededError
-from .guard import GuardValidator
-from .monitor import RAMMonitor
+
+if TYPE_CHECKING:
+    from .core.stata.builtin_tools.help import StataHelp
 
 # Init project config
 config = Config()
@@ -74,8 +78,6 @@ else:
 SYSTEM_OS = config.SYSTEM_OS
 IS_UNIX = config.IS_UNIX
 
-# Set stata_cli
-STATA_CLI = config.STATA_CLI
 
 # Get working directory from environment variable (fallback: auto-detect writable directory)
 WORKING_DIR = config.WORKING_DIR
@@ -90,6 +92,20 @@ tmp_base_path = WORKING_DIR.get("tmp_base", output_base_path / "stata-mcp-tmp")
 
 logging.info(f"Using {output_base_path.as_posix()} as output base folder")
 
+# Content-addressed cache of do-file logs, shared by all stata_do calls
+do_result_cache = None
+if config.CACHE_ON:
+    do_result_cache = DoResultCache(cache_dir=tmp_base_path / "stata-do-cache",
+                                    max_bytes=config.CACHE_MAX_MB * 1024 * 1024,
+                                    cwd=cwd)
+
+# Background jobs submitted with stata_submit
+stata_jobs = StataJobManager()
+
+# Bounded parallel scheduler for stata_do_batch
+stata_scheduler = StataScheduler(max_concurrency=config.MAX_CONCURRENCY,
+                                 min_free_ram_mb=config.MIN_FREE_RAM_MB)
+
 # Initialize MCP Server, avoiding FastMCP server timeout caused by Icon src fetch
 instructions = ("Stata-MCP provides a set of tools to operate Stata locally. "
                 "Typically, it writes code to do-file and executes them. "
@@ -118,11 +134,6 @@ except Exception:
 # =============================================================================
 
 if IS_UNIX:
-    # Config help class
-    help_cls = Help(stata_cli=STATA_CLI,
-                    project_tmp_dir=tmp_base_path,
-                    cache_dir=STATA_MCP_DIRECTORY / "help")
-
     # As AI-Client does not support Resource at a board yet, we still keep the resource
     @stata_mcp.resource(
         uri="help://stata/{cmd}",
@@ -146,13 +157,20 @@ if IS_UNIX:
             doesn't exist or you believe the cached content is incorrect, and you're certain the command exists,
             set the environment variable STATA_MCP_CACHE_HELP to false. STATA_MCP_SAVE_HELP is same working method.
         """
-        return help_cls.help(cmd)
+        return _get_help().help(cmd)
 
 
 @stata_mcp.tool(name="stata_do", description="Run a stata-code via Stata")
-def stata_do(dofile_path: str,
-             log_file_name: str = None,
-             is_read_log: bool = True) -> Dict[str, Any]:
+async def stata_do(dofile_path: str,
+                   log_file_name: str = None,
+                   is_read_log: bool = True,
+                   use_cache: bool = False,
+                   offset: int = 0,
+                   limit: int = None,
+                   tail: int = None,
+                   unit: str = "line",
+                   is_parse_log: bool = False,
+                   ctx: Context = None) -> Dict[str, Any]:
     """
     Execute a Stata do-file and return the log file path with optional log content.
 
@@ -164,11 +182,26 @@ def stata_do(dofile_path: str,
         log_file_name (str, optional): Set log file name without a time-string. If None, using nowtime as filename
         is_read_log (bool, optional): Whether to read and return the log file content.
                                     Defaults to True.
+        use_cache (bool, optional): Whether to return the cached log if the same do-file already ran
+                                    on unchanged data. Only do-files made of read-only commands
+                                    (no file output, no unseeded random draw) are cached. Defaults to False.
+        offset (int, optional): First line (or byte) of the log to return, 0-based. Defaults to 0.
+        limit (int, optional): Maximum lines (or bytes) of the log to return. Defaults to None, the whole log.
+        tail (int, optional): Return only the last `tail` lines (or bytes) of the log, overrides `offset`.
+        unit (str, optional): Unit of offset/limit/tail, "line" or "byte". Defaults to "line".
+        is_parse_log (bool, optional): Whether to return the results extracted from the log (error codes,
+                                       regression tables, summarize and tabulate output) as JSON under
+                                       "log_parsed" instead of the log content. Defaults to False.
+        ctx (Context, optional): Injected by the MCP server, used to stream the log while Stata is running.
 
     Returns:
         Dict[str, Any]: A dictionary containing:
             - "log_file_path" (str): Path to the generated Stata log file (on success)
             - "log_content" (str): Content of the log file if is_read_log is True (on success)
+            - "log_window" (dict): "start", "end", "total", "unit" and "has_more" of the returned part,
+                                   only if offset, limit or tail is set
+            - "log_parsed" (dict): "commands" count, "errors" and "results" extracted from the log,
+                                   only if is_parse_log is True
             - "action" (str): Action taken when security check fails
             - "warning" (str): Warning message when dangerous commands are detected
             - "suggesting" (str): Suggestions for resolving security issues
@@ -181,18 +214,26 @@ def stata_do(dofile_path: str,
 
     Example:
         >>> do_file_path: str | Path = ...
-        >>> result = stata_do(do_file_path, is_read_log=True)
+        >>> result = await stata_do(do_file_path, is_read_log=True)
         >>> print(result[log_file_path])
         /path/to/logs/analysis.log
         >>> print(result[log_content])
         Stata log content...
 
-        >>> result = stata_do(do_file_path, log_file_name="experience")  # Not suggest to use log_file_name arg.
+        >>> result = await stata_do(do_file_path, log_file_name="experience")  # Not suggest to use log_file_name arg.
         >>> print(result[log_file_path])
         /log/file/base/experience.log
 
+        >>> result = await stata_do(do_file_path, tail=100)  # Only the last 100 lines of a long log
+        >>> print(result["log_window"])
+        {"start": 48113, "end": 48213, "total": 48213, "unit": "line", "has_more": False}
+
+        >>> result = await stata_do(do_file_path, is_parse_log=True)
+        >>> print(result["log_parsed"]["results"][0]["coefficients"]["mpg"])
+        {"coef": -49.51222, "se": 86.15604, "stat": -0.57, "p": 0.567, "ci_low": -221.3025, "ci_high": 122.278}
+
         >>> not_exist_dofile = ...
-        >>> result = stata_do(not_exist_dofile)
+        >>> result = await stata_do(not_exist_dofile)
         >>> print(result)
         {"error": "error content..."}
 
@@ -202,6 +243,10 @@ def stata_do(dofile_path: str,
         - Log file naming follows Stata conventions with .log extension
         - Security guard blocks execution when dangerous commands are detected (blacklist mode)
         - To disable security guard, set environment variable STATA_MCP__IS_GUARD=false
+        - Do-files which write files, install packages or call other do-files are never served from cache
+        - Runs without blocking the server; for very long do-files prefer `stata_submit`
+        - New log lines are sent as log notifications while Stata is running, and as progress
+          notifications (line count and last line) if the client requested progress
     """
     # Convert dofile_path from str to Path
     try:
@@ -210,55 +255,27 @@ def stata_do(dofile_path: str,
         return {"error": f"Could not recognize dofile_path as pathlib.Path object: {e}"}
 
     # Security check: validate dofile before execution
-    if config.IS_GUARD:
-        # Read dofile content
-        try:
-            with open(dofile_path, 'r', encoding='utf-8') as f:
-                dofile_content = f.read()
-        except Exception as e:
-            logging.error(f"Failed to read dofile {dofile_path}: {str(e)}")
-            return {"error": f"Failed to read dofile for security check: {str(e)}"}
-
-        # Config guard validator (platform-independent)
-        guard_validator = GuardValidator()  # TODO: It may be make an error for windows user
-
-        # Perform security validation
-        report = guard_validator.validate(dofile_content)
-
-        if not report.is_safe:
-            warning_msg = "⚠️  Security warning: Dangerous commands detected:\n"
-            for item in report.dangerous_items:
-                warning_msg += f"  - Line {item.line}: {item.type} '{item.content}'\n"
-            logging.warning(warning_msg)
-            return {
-                "action": "Security check, dofile not executed",
-                "warning": warning_msg,
-                "suggesting": ("Modify the dofile to ensure safety\n"
-                               "or set environment variable `STATA_MCP__IS_GUARD` to `false` (not recommended)")
-            }
-        else:
-            logging.info(f"✅ {dofile_path} - Security check passed")
-
-    # Initialize monitors
-    monitors = []
-    if config.IS_MONITOR:
-        if config.MAX_RAM_MB is not None:
-            monitors.append(RAMMonitor(max_ram_mb=config.MAX_RAM_MB))
+    if guard_result := _guard_check(dofile_path):
+        return guard_result
 
-    # Initialize Stata executor with system configuration
-    stata_executor = StataDo(
-        stata_cli=STATA_CLI,  # Path to Stata executable
-        log_file_path=log_base_path,  # Directory for log files
-        is_unix=IS_UNIX,  # Whether the OS is Unix-like
-        cwd=cwd,
-        monitors=monitors
-    )
+    stata_executor = _stata_executor()
 
     # Execute the do-file and get log file path
     logging.info(f"Try to running file {dofile_path}")
 
+    line_count = 0
+
+    async def stream_log_lines(lines: List[str]):
+        nonlocal line_count
+        line_count += len(lines)
+        await ctx.report_progress(progress=line_count, message=lines[-1][:200])
+        await ctx.info("\n".join(lines))
+
     try:
-        log_file_path = stata_executor.execute_dofile(dofile_path, log_file_name)
+        log_file_path = await stata_executor.execute_dofile_async(
+            dofile_path, log_file_name, use_cache=use_cache,
+            on_log_lines=stream_log_lines if ctx is not None else None
+        )
         logging.info(f"{dofile_path} is executed successfully. Log file path: {log_file_path}")
     except RAMLimitExceededError as e:
         return {"error": f"Out of max RAM limit: {e}"}
@@ -269,17 +286,316 @@ def stata_do(dofile_path: str,
     result: Dict[str, Any] = {"log_file_path": log_file_path}
 
     # Return log content based on user preference
-    if is_read_log:
-        result["log_content"] = stata_executor.read_log(log_file_path)
+    if is_parse_log:
+        result["log_parsed"] = _parse_log(log_file_path)
+    elif is_read_log:
+        result.update(_read_log_content(log_file_path, offset, limit, tail, unit))
 
     return result
 
 
+@stata_mcp.tool(name="stata_submit", description="Run a stata-code via Stata in the background and return a job id")
+async def stata_submit(dofile_path: str,
+                       log_file_name: str = None,
+                       use_cache: bool = False) -> Dict[str, Any]:
+    """
+    Submit a Stata do-file to run in the background and return its job id at once.
+
+    Use this for long-running do-files; other tools stay responsive while the job runs.
+    Poll it with `stata_status`, get the log with `stata_result`, or stop it with `stata_cancel`.
+    While the job is running, its info carries the latest log lines under "log_tail".
+
+    Args:
+        dofile_path (str): Absolute or relative path to the Stata do-file (.do) to execute.
+        log_file_name (str, optional): Set log file name without a time-string. If None, using nowtime as filename
+        use_cache (bool, optional): Whether to return the cached log if the same do-file already ran
+                                    on unchanged data. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: The job info with "job_id", "dofile_path", "status" and "elapsed_seconds",
+            or the security check result / "error" if the do-file is not submitted.
+
+    Example:
+        >>> stata_submit("/path/to/bootstrap.do")
+        {"job_id": "3f2a9c81d0e4", "dofile_path": "/path/to/bootstrap.do", "status": "running", "elapsed_seconds": 0.0}
+    """
+    dofile_path = Path(dofile_path)
+    if guard_result := _guard_check(dofile_path):
+        return guard_result
+
+    log_tail = deque(maxlen=20)
+
+    async def on_log_lines(lines: List[str]):
+        log_tail.extend(lines)
+
+    stata_executor = _stata_executor()
+    job = stata_jobs.submit(
+        stata_executor.execute_dofile_async(dofile_path, log_file_name, use_cache=use_cache, on_log_lines=on_log_lines),
+        dofile_path,
+        log_tail=log_tail
+    )
+    logging.info(f"Submitted {dofile_path} as job {job.job_id}")
+    return job.to_dict()
+
+
+@stata_mcp.tool(name="stata_status", description="Get the status of a background Stata job")
+def stata_status(job_id: str) -> Dict[str, Any]:
+    """
+    Get the status of a job submitted with `stata_submit`.
+
+    Args:
+        job_id (str): The job id returned by `stata_submit`.
+
+    Returns:
+        Dict[str, Any]: The job info, "status" is one of "running", "finished", "failed" or "cancelled".
+            A running job also returns its latest log lines as "log_tail".
+    """
+    job = stata_jobs.get(job_id)
+    if job is None:
+        return {"error": f"Job {job_id} not found"}
+    return job.to_dict()
+
+
+@stata_mcp.tool(name="stata_result", description="Get the log of a finished background Stata job")
+def stata_result(job_id: str,
+                 is_read_log: bool = True,
+                 offset: int = 0,
+                 limit: int = None,
+                 tail: int = None,
+                 unit: str = "line",
+                 is_parse_log: bool = False) -> Dict[str, Any]:
+    """
+    Get the result of a job submitted with `stata_submit`.
+
+    Args:
+        job_id (str): The job id returned by `stata_submit`.
+        is_read_log (bool, optional): Whether to read and return the log file content. Defaults to True.
+        offset, limit, tail, unit: Return a window of the log, same as `stata_do`.
+        is_parse_log (bool, optional): Return the results extracted from the log instead, same as `stata_do`.
+
+    Returns:
+        Dict[str, Any]: The job info, plus "log_content" once the job is finished.
+            A job which is still running only returns its info, check "status".
+    """
+    job = stata_jobs.get(job_id)
+    if job is None:
+        return {"error": f"Job {job_id} not found"}
+
+    result = job.to_dict()
+    if job.status == "finished" and is_parse_log:
+        result["log_parsed"] = _parse_log(job.log_file_path)
+    elif job.status == "finished" and is_read_log:
+        result.update(_read_log_content(job.log_file_path, offset, limit, tail, unit))
+    return result
+
+
+@stata_mcp.tool(name="stata_cancel", description="Cancel a running background Stata job")
+def stata_cancel(job_id: str) -> Dict[str, Any]:
+    """
+    Cancel a job submitted with `stata_submit`, the Stata process running it is killed.
+
+    Args:
+        job_id (str): The job id returned by `stata_submit`.
+
+    Returns:
+        Dict[str, Any]: The job info with "cancelled" telling whether the job was cancelled by this call.
+    """
+    job = stata_jobs.get(job_id)
+    if job is None:
+        return {"error": f"Job {job_id} not found"}
+
+    cancelled = stata_jobs.cancel(job_id)
+    logging.info(f"Cancel job {job_id}: {cancelled}")
+    return {**job.to_dict(), "cancelled": cancelled}
+
+
+@stata_mcp.tool(name="stata_do_batch", description="Run several independent stata-codes via Stata in parallel")
+async def stata_do_batch(dofile_paths: List[str],
+                         priority: int = 0,
+                         use_cache: bool = False) -> Dict[str, Any]:
+    """
+    Execute several independent Stata do-files at the same time and return a log file path for each.
+
+    The do-files run in separate Stata processes, at most `STATA.scheduler.MAX_CONCURRENCY` at once,
+    and a new one only starts while the free RAM is above `STATA.scheduler.MIN_FREE_RAM_MB`.
+    Do not batch do-files which depend on each other's output, their order is not guaranteed.
+
+    Args:
+        dofile_paths (List[str]): Paths to the Stata do-files (.do) to execute.
+        priority (int, optional): Higher priority batches start before lower ones queued earlier. Defaults to 0.
+        use_cache (bool, optional): Whether to return the cached log if the same do-file already ran
+                                    on unchanged data. Defaults to False.
+
+    Returns:
+        Dict[str, Any]: {"results": [...]} in the same order as dofile_paths, each item contains
+            "dofile_path" and either "log_file_path", "error", or the security check result.
+
+    Example:
+        >>> await stata_do_batch(["/path/to/spec_1.do", "/path/to/spec_2.do"])
+        {"results": [{"dofile_path": "/path/to/spec_1.do", "log_file_path": "/log/file/base/20251012185447123456.log"},
+                     {"dofile_path": "/path/to/spec_2.do", "log_file_path": "/log/file/base/20251012185447234567.log"}]}
+    """
+    results: List[Dict[str, Any]] = []
+    futures = {}
+    for index, dofile_path in enumerate(dofile_paths):
+        results.append({"dofile_path": dofile_path})
+        dofile_path = Path(dofile_path)
+        if guard_result := _guard_check(dofile_path):
+            results[index].update(guard_result)
+            continue
+
+        stata_executor = _stata_executor()
+        run = partial(stata_executor.execute_dofile, dofile_path, use_cache=use_cache)
+        futures[index] = asyncio.wrap_future(stata_scheduler.submit(run, priority=priority))
+
+    logging.info(f"Scheduled {len(futures)} of {len(dofile_paths)} do-file(s) in a batch")
+    outcomes = await asyncio.gather(*futures.values(), return_exceptions=True)
+    for index, outcome in zip(futures.keys(), outcomes):
+        if isinstance(outcome, RAMLimitExceededError):
+            results[index]["error"] = f"Out of max RAM limit: {outcome}"
+        elif isinstance(outcome, BaseException):
+            logging.error(f"Failed to execute {results[index]['dofile_path']}. Error: {str(outcome)}")
+            results[index]["error"] = str(outcome)
+        else:
+            results[index]["log_file_path"] = outcome
+
+    return {"results": results}
+
+
+# =============================================================================
+# Lazily created resources, nothing heavy runs before the server answers `initialize`
+# =============================================================================
+
+@cache
+def _get_stata_cli() -> str:
+    """Locate Stata on first use, the finder scans the usual install directories."""
+    stata_cli = config.STATA_CLI
+    logging.info(f"Using Stata CLI: {stata_cli}")
+    return stata_cli
+
+
+@cache
+def _get_stata_pool() -> StataPool | None:
+    """Start the warm pool of persistent Stata workers, only for Unix-like systems (disabled while POOL_SIZE is 0)."""
+    if not IS_UNIX or config.POOL_SIZE <= 0:
+        return None
+    stata_pool = StataPool(stata_cli=_get_stata_cli(),
+                           cwd=cwd,
+                           size=config.POOL_SIZE,
+                           max_jobs_per_worker=config.POOL_MAX_JOBS)
+    atexit.register(stata_pool.close)
+    logging.info(f"Started Stata pool with {stata_pool.size} worker(s)")
+    return stata_pool
+
+
+@cache
+def _get_help() -> "StataHelp":
+    # pexpect is only imported once help is requested
+    from .core.stata.builtin_tools.help import StataHelp
+
+    return StataHelp(stata_cli=_get_stata_cli(),
+                     project_tmp_dir=tmp_base_path,
+                     cache_dir=STATA_MCP_DIRECTORY / "help")
+
+
+@cache
+def _get_guard_validator():
+    from .guard import GuardValidator
+
+    return GuardValidator()  # TODO: It may be make an error for windows user
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `mcp_servers.STATA_CLI` available without resolving it at import time
+    if name == "STATA_CLI":
+        return _get_stata_cli()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _guard_check(dofile_path: Path) -> Dict[str, Any] | None:
+    """Validate the dofile with the security guard, return the response to send back if it must not run."""
+    if not config.IS_GUARD:
+        return None
+
+    # Read dofile content
+    try:
+        with open(dofile_path, 'r', encoding='utf-8') as f:
+            dofile_content = f.read()
+    except Exception as e:
+        logging.error(f"Failed to read dofile {dofile_path}: {str(e)}")
+        return {"error": f"Failed to read dofile for security check: {str(e)}"}
+
+    # Perform security validation
+    report = _get_guard_validator().validate(dofile_content)
+
+    if not report.is_safe:
+        warning_msg = "⚠️  Security warning: Dangerous commands detected:\n"
+        for item in report.dangerous_items:
+            warning_msg += f"  - Line {item.line}: {item.type} '{item.content}'\n"
+        logging.warning(warning_msg)
+        return {
+            "action": "Security check, dofile not executed",
+            "warning": warning_msg,
+            "suggesting": ("Modify the dofile to ensure safety\n"
+                           "or set environment variable `STATA_MCP__IS_GUARD` to `false` (not recommended)")
+        }
+
+    logging.info(f"✅ {dofile_path} - Security check passed")
+    return None
+
+
+def _read_log_content(log_file_path: str | Path,
+                      offset: int = 0,
+                      limit: int = None,
+                      tail: int = None,
+                      unit: str = "line") -> Dict[str, Any]:
+    """Read the whole log, or only the requested window of it with its position."""
+    if offset == 0 and limit is None and tail is None:
+        return {"log_content": StataDo.read_log(log_file_path)}
+
+    window = StataDo.read_log_window(log_file_path, offset, limit, tail, unit)
+    if "error" in window:
+        return {"log_content": window["error"]}
+    content = window.pop("content")
+    return {"log_content": content, "log_window": window}
+
+
+def _parse_log(log_file_path: str | Path) -> Dict[str, Any]:
+    """Extract the structured results of a log, see `StataLogParser`."""
+    try:
+        return StataLogParser.parse_file(log_file_path)
+    except Exception as e:
+        logging.error(f"Failed to parse log {log_file_path}: {str(e)}")
+        return {"error": f"Failed to parse logfile-{log_file_path}: {e}"}
+
+
+def _stata_executor() -> StataDo:
+    """Build a Stata executor with the system configuration and fresh monitors."""
+    # Initialize monitors
+    monitors = []
+    if config.IS_MONITOR:
+        from .monitor import RAMMonitor
+
+        if config.MAX_RAM_MB is not None:
+            monitors.append(RAMMonitor(max_ram_mb=config.MAX_RAM_MB))
+
+    # Initialize Stata executor with system configuration
+    return StataDo(
+        stata_cli=_get_stata_cli(),  # Path to Stata executable
+        log_file_path=log_base_path,  # Directory for log files
+        is_unix=IS_UNIX,  # Whether the OS is Unix-like
+        cwd=cwd,
+        monitors=monitors,
+        pool=_get_stata_pool(),  # Reuse warm Stata workers if the pool is enabled
+        cache=do_result_cache
+    )
+
+
 @stata_mcp.tool(name="ado_package_install", description="Install ado package from ssc or github")
-def ado_package_install(package: str,
-                        source: str = "ssc",
-                        is_replace: bool = True,
-                        package_source_from: str = None) -> str:
+async def ado_package_install(package: str,
+                              source: str = "ssc",
+                              is_replace: bool = True,
+                              package_source_from: str = None) -> str:
     """
     Install a package from SSC or GitHub
 
@@ -353,6 +669,8 @@ def ado_package_install(package: str,
     source = source.lower()
 
     if IS_UNIX:
+        from .core.stata.builtin_tools.ado_install import GITHUB_Install, NET_Install, SSC_Install
+
         SOURCE_MAPPING: Dict = {
             "github": GITHUB_Install,
             "net": NET_Install,
@@ -364,7 +682,8 @@ def ado_package_install(package: str,
 
         # set the args for the special cases
         args = [package, package_source_from] if source == "net" else [package]
-        install_msg = installer(STATA_CLI, is_replace).install(*args)
+        # The install drives Stata through pexpect and can take a minute, keep the event loop free
+        install_msg = await asyncio.to_thread(lambda: installer(_get_stata_cli(), is_replace).install(*args))
 
         if installer.check_installed_from_msg(install_msg):
             logging.info(f"{package} is installed successfully.")
@@ -377,7 +696,7 @@ def ado_package_install(package: str,
         from_message = f"from({package_source_from})" if (package_source_from and source == "net") else ""
         replace_str = "replace" if is_replace else ""
         tmp_file = write_dofile(f"{source} install {package}, {replace_str} {from_message}")
-        return stata_do(tmp_file, is_read_log=True).get("log_content")
+        return (await stata_do(tmp_file, is_read_log=True)).get("log_content")
 
 
 # =============================================================================
@@ -388,25 +707,42 @@ def ado_package_install(package: str,
     name="get_data_info",
     description="Get descriptive statistics for the data file"
 )
-def get_data_info(data_path: str,
-                  vars_list: List[str] | None = None,
-                  encoding: str = "utf-8") -> str:
+async def get_data_info(data_path: str,
+                        vars_list: List[str] | None = None,
+                        encoding: str = "utf-8",
+                        sample: int | float | None = None,
+                        metadata_only: bool = False,
+                        sheet: str | int | None = None) -> str:
     """
     Get descriptive statistics for the data file.
 
     Args:
-        data_path (str): the data file's absolutely path.
-            Current, only allow [dta, csv, tsv, psv, xlsx, xls] file.
+        data_path (str): the data file's absolutely path, or an http(s) URL (downloaded once, then cached).
+            Current, only allow [dta, csv, tsv, psv, xlsx, xls, parquet, feather] file.
         vars_list (List[str] | None): the vars you want to get info (default is None, means all vars).
         encoding (str): data file encoding method (dta file is not supported this arg),
             if you do not know your data ignore this arg, for most of the data files are `UTF-8`.
+        sample (int | float | None): summarize a sample instead of all the rows, a number of rows (e.g. 10000)
+            or a fraction (e.g. 0.01). Use it for a quick look at large files: the overview gets a `sample`
+            entry (method, population) and numeric variables get 95% confidence intervals (`ci`) of the
+            mean and quartiles. Sampled summaries are not cached (default is None, all rows).
+        metadata_only (bool): answer from the file metadata without reading the data where the format
+            allows it (default is False):
+            - .dta: describe the variables from the header, like Stata's `describe` (obs, data label and,
+              per variable, the storage type, display format, value label and variable label), no statistics
+            - Parquet: summarize the integer and boolean variables from the statistics stored in the file
+              (obs, min and max only), the other variables are summarized as usual
+            Other formats are summarized as usual.
+        sheet (str | int | None): for Excel files, the sheet to summarize, a name or a 0-based position
+            (default is None, the first sheet). The overview lists every sheet under `sheet_names`.
 
     Returns:
         str: JSON string containing data summary with following structure:
             - overview: Basic information including source, obs, var_numbers, var_list
             - info_config: Configuration settings (metrics, max_display, decimal_places)
             - vars_detail: Detailed statistics for each variable
-            - saved_path: Path to cached JSON file
+            - saved_path: Path to the summary cache database
+            Excel files also get `sheet` and `sheet_names` in the overview.
 
     Examples:
         >>> get_data_info("/Applications/Stata/auto.dta")
@@ -432,7 +768,8 @@ def get_data_info(data_path: str,
                         'obs': 74,
                         'value_list': ['AMC Pacer', 'Chev. Chevette', 'Chev. Nova',
                                       'Honda Accord', 'Merc. Monarch', 'Olds Cutl Supr',
-                                      'Olds Delta 88', 'Pont. Catalina', 'Renault Le Car', 'Volvo 260']
+                                      'Olds Delta 88', 'Pont. Catalina', 'Renault Le Car', 'Volvo 260'],
+                        'distinct': 74, 'distinct_estimated': False
                     }
                 },
                 'price': {
@@ -461,11 +798,29 @@ def get_data_info(data_path: str,
                 },
                 ...
             },
-            'saved_path': '$cwd/stata-mcp-folder/stata-mcp-tmp/data_info__auto_dta__hash_c557a2db346b.json'
+            'saved_path': '$cwd/stata-mcp-folder/stata-mcp-tmp/data_info.sqlite3'
         }
     """
-    data_path = Path(data_path).expanduser().resolve()
-    data_extension = data_path.suffix.lower().strip(".")
+    # Reading, sampling or downloading the data can take minutes, keep the event loop free
+    return await asyncio.to_thread(_get_data_info, data_path, vars_list, encoding, sample, metadata_only, sheet)
+
+
+def _get_data_info(data_path: str,
+                   vars_list: List[str] | None,
+                   encoding: str,
+                   sample: int | float | None,
+                   metadata_only: bool,
+                   sheet: str | int | None = None) -> str:
+    """Summarize the data file with the handler of its extension, see `get_data_info`."""
+    # pandas is only imported once data info is requested
+    from .core.data_info import get_data_handler
+
+    if urlparse(str(data_path)).scheme in ("http", "https"):
+        # Remote files are downloaded into the cache by the handler
+        data_extension = Path(urlparse(data_path).path).suffix.lower().strip(".")
+    else:
+        data_path = Path(data_path).expanduser().resolve()
+        data_extension = data_path.suffix.lower().strip(".")
 
     # Get the appropriate data handler class from the registry
     data_info_cls = get_data_handler(data_extension)
@@ -474,8 +829,20 @@ def get_data_info(data_path: str,
         logging.error(f"Unsupported file extension: {data_extension} for data file: {data_path}")
         return f"Unsupported file extension now: {data_extension}"
 
-    data_info = data_info_cls(data_path, vars_list, encoding=encoding, cache_dir=tmp_base_path)
+    handler_kwargs = {}
+    if sheet is not None:
+        if not hasattr(data_info_cls, "sheet_names"):
+            return f"The sheet argument is only supported for Excel files, not for {data_extension} files"
+        handler_kwargs["sheet_name"] = sheet
+
     try:
+        data_info = data_info_cls(data_path, vars_list, encoding=encoding, cache_dir=tmp_base_path,
+                                  sample=sample, metadata_only=metadata_only, **handler_kwargs)
+        if metadata_only and hasattr(data_info, "describe"):
+            # Formats with a header describing the variables (.dta), no data is read
+            info = data_info.describe()
+            logging.info(f"Successfully described {data_path} from its header")
+            return str(info)
         info = data_info.info
         if data_info.is_cache:
             saved_path = info.get("saved_path", None)
@@ -496,16 +863,26 @@ def get_data_info(data_path: str,
     name="read_file",
     description="Reads a file and returns its content as a string"
 )
-def read_file(file_path: str, encoding: str = "utf-8") -> str:
+def read_file(file_path: str,
+              encoding: str = "utf-8",
+              offset: int = 0,
+              limit: int = None,
+              tail: int = None,
+              unit: str = "line") -> str | Dict[str, Any]:
     """
     Reads the content of a file and returns it as a string.
 
     Args:
         file_path (str): The full path to the file to be read.
         encoding (str, optional): The encoding used to decode the file. Defaults to "utf-8".
+        offset (int, optional): First line (or byte) to return, 0-based. Defaults to 0.
+        limit (int, optional): Maximum lines (or bytes) to return. Defaults to None, the whole file.
+        tail (int, optional): Return only the last `tail` lines (or bytes), overrides `offset`.
+        unit (str, optional): Unit of offset/limit/tail, "line" or "byte". Defaults to "line".
 
     Returns:
-        str: The content of the file as a string.
+        str | Dict[str, Any]: The content of the file as a string. If offset, limit or tail is set,
+            a dict with the "content" of the window and its "start", "end", "total", "unit" and "has_more".
 
     Raises:
         PermissionError: If the file is not within the allowed stata-mcp-folder directory.
@@ -535,6 +912,14 @@ def read_file(file_path: str, encoding: str = "utf-8") -> str:
     if not path.exists():
         raise FileNotFoundError(f"The file at {file_path} does not exist.")
 
+    if offset != 0 or limit is not None or tail is not None:
+        # Served from the line-offset index, the file is never read as a whole
+        try:
+            return LogIndex.for_file(path).window(offset, limit, tail, unit, encoding)
+        except OSError as e:
+            logging.error(f"Failed to read file {file_path}: {str(e)}")
+            raise IOError(f"An error occurred while reading the file: {e}")
+
     try:
         with open(path, "r", encoding=encoding) as file:
             log_content = file.read()
@@ -732,6 +1117,11 @@ __all__ = [
     # Functions (Core)
     "get_data_info",
     "stata_do",
+    "stata_submit",
+    "stata_status",
+    "stata_result",
+    "stata_cancel",
+    "stata_do_batch",
     "write_dofile",
     "append_dofile",
 
@@ -9,7 +9,8 @@ def set_config(key, value):
 
 
 def get_nowtime():
-    return datetime.strftime(datetime.now(), "%Y%m%d%H%M%S")
+    # Microsecond precision, concurrent stata_do calls must not share a log file
+    return datetime.strftime(datetime.now(), "%Y%m%d%H%M%S%f")
 
 
 def get_os():
@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : benchmark.py
+
+"""
+Stata MCP Startup Benchmark
+This script measures how long a cold MCP server takes to answer `initialize`,
+and checks the import-time budget of the package
+"""
+
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Starts the stdio server the same way as the `stata-mcp` entry point
+SERVER_COMMAND = [sys.executable, "-c", "import sys; sys.argv = ['stata-mcp']; from stata_mcp.cli import main; main()"]
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "stata-mcp-benchmark", "version": "0.0.0"},
+    },
+}
+
+# Cumulative `python -X importtime` budget (ms) per module, not counting EXTERNAL_MODULES
+IMPORT_BUDGETS_MS: Dict[str, int] = {
+    "stata_mcp.cli": 150,  # `stata-mcp --version`, `install`, `--usable`
+    "stata_mcp.mcp_servers": 300,  # stdio startup
+}
+
+# Dependencies the server cannot start without, their import time is reported but not budgeted
+# (the mcp SDK alone takes about 500 ms, mostly pydantic models)
+EXTERNAL_MODULES: List[str] = ["mcp"]
+
+# Heavy dependencies which must only be imported by the tools needing them
+DEFERRED_MODULES: List[str] = ["pandas", "numpy", "psutil", "pexpect", "requests", "openai", "agents"]
+
+
+def measure_initialize(timeout: float = 60) -> float:
+    """
+    Start a fresh stdio server and measure the time until it answers `initialize`.
+
+    Returns:
+        float: Seconds from process start to the initialize response
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        SERVER_COMMAND,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        proc.stdin.write(json.dumps(INITIALIZE_REQUEST) + "\n")
+        proc.stdin.flush()
+        while True:
+            line = proc.stdout.readline()
+            if not line:
+                raise RuntimeError("The server exited before answering initialize")
+            if time.perf_counter() - start > timeout:
+                raise TimeoutError(f"No initialize response within {timeout}s")
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Not a JSON-RPC message
+            if message.get("id") == INITIALIZE_REQUEST["id"]:
+                return time.perf_counter() - start
+    finally:
+        proc.stdin.close()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def measure_import(module: str = "stata_mcp.mcp_servers") -> float:
+    """Measure the import time of `module` in a fresh interpreter, in seconds."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_importtime(module: str) -> Dict[str, int]:
+    """
+    Import `module` in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        Dict[str, int]: cumulative import time in microseconds of every module imported
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    ).stderr
+
+    cumulative = {}
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*(\S+)", line)
+        if match:
+            cumulative[match.group(2)] = int(match.group(1))
+    return cumulative
+
+
+def check_import_budget() -> List[str]:
+    """Check IMPORT_BUDGETS_MS and DEFERRED_MODULES, return the violations found."""
+    violations = []
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        imported = measure_importtime(module)
+        external_ms = sum(imported.get(external, 0) for external in EXTERNAL_MODULES) / 1000
+        cost_ms = imported.get(module, 0) / 1000 - external_ms
+        status = "✅" if cost_ms <= budget_ms else "❌"
+        print(f"{status} import {module:<22} {cost_ms:8.1f} ms (budget {budget_ms} ms, "
+              f"+ {external_ms:.1f} ms of {', '.join(EXTERNAL_MODULES)})")
+        if cost_ms > budget_ms:
+            violations.append(f"import {module} took {cost_ms:.1f} ms, over the {budget_ms} ms budget")
+        for heavy in DEFERRED_MODULES:
+            if heavy in imported:
+                violations.append(f"import {module} pulls in {heavy}, it must be imported lazily")
+    for violation in violations:
+        print(f"  - {violation}")
+    return violations
+
+
+def _report(name: str, samples: List[float]) -> None:
+    ms = [s * 1000 for s in samples]
+    print(f"{name:<24} min {min(ms):8.1f} ms   median {statistics.median(ms):8.1f} ms   max {max(ms):8.1f} ms")
+
+
+def benchmark(repeat: int = 5) -> int:
+    """Run the startup benchmark and print the results, return the exit code."""
+    print(f"\n===== Stata MCP Startup Benchmark ({repeat} runs) =====\n")
+    try:
+        _report("import mcp_servers", [measure_import() for _ in range(repeat)])
+        _report("initialize (stdio)", [measure_initialize() for _ in range(repeat)])
+
+        print("\n===== Import-time Budget =====\n")
+        violations = check_import_budget()
+    except Exception as e:
+        print(f"Benchmark failed: {e}")
+        return 1
+    # Non-zero exit code, so CI can enforce the budget with `stata-mcp --benchmark`
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(benchmark())
@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : lazy.py
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module(name: str, mapping: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the PEP 562 `__getattr__` and `__dir__` of a package whose exports are imported on first access.
+
+    Importing the package then stays cheap, each submodule is only imported with the first
+    name taken from it, and the name is cached in the package afterwards.
+
+    Args:
+        name: `__name__` of the package
+        mapping: {exported name: relative submodule defining it}
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_module(__name__, {"StataDo": ".stata_do"})
+    """
+    def __getattr__(attr: str) -> Any:
+        if attr in mapping:
+            value = getattr(importlib.import_module(mapping[attr], name), attr)
+            setattr(sys.modules[name], attr, value)  # __getattr__ is only called for missing names
+            return value
+        raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[name])) | set(mapping))
+
+    return __getattr__, __dir__
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : conftest.py
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+# A stand-in for the Stata CLI: it reads the commands StataDo and the pool workers send on
+# stdin one line at a time (or the batch do-file after `/e do`), writes the log, prints
+# `display "<text>"` to stdout and understands a few do-file lines of its own:
+#   sleep <ms>     wait, like Stata's sleep
+#   alloc <mb>     hold that much memory until the end of the do-file
+#   error          write `r(111);` and stop the do-file, as an error in Stata does
+#   exit           quit the whole process, like `exit, clear STATA`
+#   pid            write the process id to the log
+# Any other line is echoed to the log after a ". " prompt.
+STUB_STATA = r'''#!{python}
+import os
+import re
+import sys
+import time
+
+commands = sys.stdin if len(sys.argv) == 1 else open(sys.argv[-1])
+log, memory = None, []
+for command in (line.strip() for line in commands):
+    if match := re.match(r'log using "(.+?)"', command):
+        log = open(match[1], "w")
+    elif match := re.match(r'do "(.+?)"', command):
+        for line in open(match[1]).read().splitlines():
+            log.write(f". {{line}}\n")
+            log.flush()
+            words = line.split()
+            if words[:1] == ["sleep"]:
+                time.sleep(float(words[1]) / 1000)
+            elif words[:1] == ["alloc"]:
+                memory.append(bytearray(int(words[1]) * 1024 * 1024))
+            elif words[:1] == ["error"]:
+                log.write("r(111);\n")
+                break
+            elif words[:1] == ["exit"]:
+                sys.exit(0)
+            elif words[:1] == ["pid"]:
+                log.write(f"{{os.getpid()}}\n")
+        memory.clear()
+    elif match := re.match(r'display "(.*)"', command):
+        print(f". {{command}}", match[1], sep="\n", flush=True)
+    elif command.endswith("log close") and log is not None:
+        log.close()
+        log = None
+    elif command.startswith("exit"):
+        break
+'''
+
+
+@pytest.fixture(autouse=True)
+def no_user_config(tmp_path, monkeypatch):
+    """Ignore the `[data_info]` table of the user's config file."""
+    from stata_mcp.core.data_info import DataInfoBase
+    monkeypatch.setattr(DataInfoBase, "CFG_FILE", tmp_path / "missing-config.toml")
+
+
+@pytest.fixture
+def stub_stata(tmp_path: Path) -> Path:
+    """Path to an executable which behaves like the Stata CLI for the commands StataDo sends."""
+    stata_cli = tmp_path / "stata-mp"
+    stata_cli.write_text(STUB_STATA.format(python=sys.executable))
+    stata_cli.chmod(stata_cli.stat().st_mode | stat.S_IXUSR)
+    return stata_cli
+
+
+@pytest.fixture
+def write_dofile(tmp_path: Path):
+    """Write a do-file from its lines and return its path."""
+    def write(*lines: str, name: str = "job.do") -> Path:
+        dofile = tmp_path / name
+        dofile.write_text("\n".join(lines) + os.linesep)
+        return dofile
+    return write
+
+
+@pytest.fixture(scope="session")
+def mcp_servers(tmp_path_factory):
+    """The MCP server module, imported in a scratch working directory (it creates its folders there)."""
+    workdir = tmp_path_factory.mktemp("server")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(workdir)
+        monkeypatch.setenv("HOME", str(workdir))
+        import stata_mcp.mcp_servers as mcp_servers
+    return mcp_servers
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_data_info_dta.py
+
+import ast
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import DtaDataInfo
+from stata_mcp.core.data_info.dta_header import DtaRows, read_dta_header
+
+READ_OPTIONS = DtaDataInfo.READ_OPTIONS
+
+
+@pytest.fixture(params=[114, 117, 118, 119])
+def dta_file(request, tmp_path):
+    n = 3000
+    df = pd.DataFrame({
+        "price": np.arange(n, dtype="float64") * 1.5,
+        "rep78": (np.arange(n) % 5).astype("int16"),
+        "make": [f"car {i % 37}" for i in range(n)],
+        "date": pd.to_datetime("2020-01-01") + pd.to_timedelta(np.arange(n) % 400, unit="D"),
+    })
+    df.loc[7, "price"] = np.nan
+    kwargs = {}
+    if request.param >= 117:
+        df["note"] = ["n" * 3000 + str(i % 11) for i in range(n)]
+        kwargs["convert_strl"] = ["note"]
+    file_path = tmp_path / f"data{request.param}.dta"
+    df.to_stata(file_path, version=request.param, write_index=False, data_label="Test data",
+                variable_labels={"price": "Price", "rep78": "Repair record"},
+                convert_dates={"date": "td"}, **kwargs)
+    return file_path
+
+
+def test_header_matches_pandas(dta_file):
+    header = read_dta_header(dta_file)
+    assert header.obs == len(pd.read_stata(dta_file, **READ_OPTIONS))
+    with pd.read_stata(dta_file, iterator=True) as reader:
+        assert header.data_label == reader.data_label
+        assert header.varlist == list(reader.variable_labels())
+        assert {var.name: var.label for var in header.variables} == reader.variable_labels()
+
+
+def test_read_blocks_matches_pandas(dta_file):
+    blocks = [(0, 3), (100, 10), (1500, 7), (2990, 10)]
+    rows = [row for start, length in blocks for row in range(start, start + length)]
+    full = pd.read_stata(dta_file, **READ_OPTIONS)
+
+    with DtaRows(dta_file, read_dta_header(dta_file), blocks) as f:
+        part = pd.read_stata(f, **READ_OPTIONS)
+    pd.testing.assert_frame_equal(part, full.iloc[rows].reset_index(drop=True))
+
+    projected = DtaDataInfo(dta_file, ["make", "price"], is_cache=False)._read_blocks(blocks)
+    pd.testing.assert_frame_equal(projected, full[["make", "price"]].iloc[rows].reset_index(drop=True))
+
+
+def test_chunked_summary_matches_pandas(dta_file, tmp_path):
+    full = pd.read_stata(dta_file, **READ_OPTIONS)
+    data_info = DtaDataInfo(dta_file, ["price", "rep78"], cache_dir=tmp_path, is_cache=False)
+    data_info.CHUNK_BYTES = 1000  # Many chunks
+    vars_detail = data_info.summary()["vars_detail"]
+    for var_name in ["price", "rep78"]:
+        assert vars_detail[var_name]["summary"]["obs"] == full[var_name].count()
+        assert vars_detail[var_name]["summary"]["mean"] == round(full[var_name].mean(), 3)
+
+
+def test_metadata_only_describes_from_the_header(dta_file, mcp_servers, monkeypatch):
+    def read_stata(*args, **kwargs):
+        raise AssertionError("the data section must not be read")
+
+    monkeypatch.setattr(pd, "read_stata", read_stata)
+    info = ast.literal_eval(asyncio.run(mcp_servers.get_data_info(str(dta_file), ["price", "make"], metadata_only=True)))
+    assert info["obs"] == 3000
+    assert info["data_label"] == "Test data"
+    assert info["vars_detail"]["price"] == {"type": "float", "storage": "double", "format": "%10.0g",
+                                            "value_label": "", "label": "Price"}
+    assert info["vars_detail"]["make"]["storage"] == "str6"
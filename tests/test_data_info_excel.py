@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_data_info_excel.py
+
+import ast
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import ExcelDataInfo
+from stata_mcp.core.data_info.xlsx import has_calamine
+
+ENGINES = ["openpyxl"] + (["calamine"] if has_calamine() else [])
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    first = pd.DataFrame({"x": np.arange(50) * 0.5, "name": [f"n{i % 7}" for i in range(50)]})
+    second = pd.DataFrame({"y": np.arange(30) ** 2, "when": pd.date_range("2024-01-01", periods=30)})
+    second.loc[3, "y"] = np.nan
+    file_path = tmp_path / "book.xlsx"
+    with pd.ExcelWriter(file_path) as writer:
+        first.to_excel(writer, sheet_name="first", index=False)
+        second.to_excel(writer, sheet_name="second", index=False)
+    return file_path
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("sheet", ["second", 1])
+def test_streamed_sheet_matches_pandas(workbook, tmp_path, engine, sheet):
+    expected = pd.read_excel(workbook, sheet_name=sheet, engine=engine)
+    data_info = ExcelDataInfo(workbook, cache_dir=tmp_path, is_cache=False, streaming=True, chunksize=7,
+                              sheet_name=sheet, engine=engine)
+    chunks = pd.concat(list(data_info._iter_chunks()), ignore_index=True)
+    pd.testing.assert_frame_equal(chunks, expected, check_dtype=False)
+
+    summary = data_info.summary()
+    assert summary["overview"]["sheet"] == "second"
+    assert summary["overview"]["sheet_names"] == ["first", "second"]
+    assert summary["vars_detail"]["y"]["summary"]["mean"] == round(expected["y"].mean(), 3)
+
+
+def test_get_data_info_selects_the_sheet(workbook, mcp_servers):
+    first = ast.literal_eval(asyncio.run(mcp_servers.get_data_info(str(workbook))))
+    second = ast.literal_eval(asyncio.run(mcp_servers.get_data_info(str(workbook), sheet="second")))
+
+    assert first["overview"]["var_list"] == ["x", "name"]
+    assert second["overview"]["var_list"] == ["y", "when"]  # Not the cached summary of the first sheet
+    assert second["overview"]["obs"] == 30
+    assert second["overview"]["sheet_names"] == ["first", "second"]
+    assert "only supported for Excel" in asyncio.run(mcp_servers.get_data_info(str(workbook.with_suffix(".csv")), sheet=1))
+
+
+def test_unknown_sheet(workbook, tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        ExcelDataInfo(workbook, cache_dir=tmp_path, sheet_name="third").summary()
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_data_info_parquet.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import ParquetDataInfo
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    df = pd.DataFrame({
+        "i": pd.array([1, 5, None, 9, -3] * 4, dtype="Int64"),
+        "f": np.arange(20) / 3,
+    })
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=7)
+    return tmp_path / "data.parquet", df
+
+
+def test_metadata_only_reads_row_group_statistics(parquet_file, tmp_path, monkeypatch):
+    file_path, df = parquet_file
+    data_info = ParquetDataInfo(file_path, cache_dir=tmp_path, is_cache=False, metadata_only=True)
+    read_vars = []
+    monkeypatch.setattr(ParquetDataInfo, "_read_data",
+                        lambda self: read_vars.extend(self.usecols) or df[self.usecols])
+
+    vars_detail = data_info.summary()["vars_detail"]
+    assert vars_detail["i"]["summary"] == {"obs": int(df["i"].count()), "min": float(df["i"].min()),
+                                           "max": float(df["i"].max())}
+    assert read_vars == ["f"]  # The integer variable is not read
+    assert vars_detail["f"]["summary"]["mean"] == round(df["f"].mean(), 3)
+
+
+def test_default_summary_reads_every_metric(parquet_file, tmp_path):
+    file_path, df = parquet_file
+    summary = ParquetDataInfo(file_path, cache_dir=tmp_path, is_cache=False).summary()["vars_detail"]["i"]["summary"]
+    assert summary == {
+        "obs": 16,
+        "mean": round(df["i"].mean(), 3),
+        "stderr": round(df["i"].std() / np.sqrt(16), 3),
+        "min": -3.0,
+        "max": 9.0,
+    }
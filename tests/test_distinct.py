@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_distinct.py
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import CsvDataInfo
+from stata_mcp.core.data_info.distinct import DistinctSketch
+
+
+def smallest_hashes(values: pd.Series, n: int, seed: int = 0) -> list:
+    """The `n` distinct values with the smallest seeded hashes, computed with pandas alone."""
+    distinct = pd.Series(values.unique())
+    hashes = pd.util.hash_pandas_object(distinct, index=False, hash_key=f"stata-mcp{seed:07d}")
+    return sorted(distinct.iloc[np.argsort(hashes.to_numpy(), kind="stable")[:n]].astype(str).tolist())
+
+
+@pytest.fixture
+def makes() -> pd.Series:
+    rng = np.random.default_rng(7)
+    return pd.Series(rng.choice([f"make {i}" for i in range(300)], 5000), dtype=object)
+
+
+def test_exact_below_k(makes):
+    sketch = DistinctSketch(k=1024)
+    sketch.update(makes)
+
+    assert sketch.is_exact
+    assert sketch.cardinality == makes.nunique() == 300
+    assert sketch.sample(10) == smallest_hashes(makes, 10)
+
+
+def test_independent_of_order_and_chunks(makes):
+    whole = DistinctSketch(k=64)
+    whole.update(makes)
+
+    chunked, other = DistinctSketch(k=64), DistinctSketch(k=64)
+    shuffled = makes.sample(frac=1, random_state=1).reset_index(drop=True)
+    for start in range(0, 3000, 450):
+        chunked.update(shuffled.iloc[start:min(start + 450, 3000)])
+    other.update(shuffled.iloc[3000:])
+    chunked.merge(other)
+
+    assert not whole.is_exact
+    assert chunked.hashes.tolist() == whole.hashes.tolist()
+    assert chunked.sample(10) == whole.sample(10) == smallest_hashes(makes, 10)
+    assert chunked.cardinality == whole.cardinality
+
+
+def test_estimate_within_bounds():
+    values = pd.Series([f"id{i}" for i in range(200_000)] * 2, dtype=object)
+    sketch = DistinctSketch(k=1024)
+    for start in range(0, len(values), 20_000):
+        sketch.update(values.iloc[start:start + 20_000])
+
+    relative_error = abs(sketch.cardinality - values.nunique()) / values.nunique()
+    assert relative_error < 3 / math.sqrt(1024 - 2)  # Three standard errors
+    assert len(sketch.values) == 1024
+
+
+def test_other_seed_other_sample(makes):
+    sketch = DistinctSketch(k=1024, seed=1)
+    sketch.update(makes)
+    assert sketch.sample(10) == smallest_hashes(makes, 10, seed=1) != smallest_hashes(makes, 10)
+
+
+def test_string_summary_matches_pandas(makes, tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"make": makes.where(makes != "make 0")}).to_csv(path, index=False)
+    expected = pd.read_csv(path)["make"]
+    assert expected.nunique() == 299
+
+    for streaming in (False, True):
+        summary = CsvDataInfo(path, is_cache=False, streaming=streaming, chunksize=500).summary()
+        assert summary["vars_detail"]["make"]["summary"] == {
+            "obs": expected.count(),
+            "value_list": smallest_hashes(expected.dropna(), 10),
+            "distinct": expected.nunique(),
+            "distinct_estimated": False,
+        }
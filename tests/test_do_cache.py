@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_do_cache.py
+
+import asyncio
+
+import pytest
+
+from stata_mcp.core.stata.stata_do import DoResultCache
+from stata_mcp.core.stata.stata_do.do import StataDo
+
+
+@pytest.fixture
+def cache(tmp_path) -> DoResultCache:
+    (tmp_path / "auto.dta").write_bytes(b"auto")
+    return DoResultCache(tmp_path / "cache", cwd=tmp_path)
+
+
+@pytest.mark.parametrize("lines", [
+    ["use auto, clear", "summarize price", "regress price mpg"],
+    ["use auto", "bysort foreign: egen m = mean(price)", "forvalues i = 1/3 {", "display `i'", "}"],
+    ["use auto", "merge 1:1 _n using auto.dta", "quietly tab foreign"],
+    ["use auto", "set seed 42", "gen u = runiform()", "sample 10"],
+])
+def test_read_only_do_files_have_a_key(cache, write_dofile, lines):
+    assert cache.key(write_dofile(*lines)) is not None
+
+
+@pytest.mark.parametrize("line", [
+    "graph twoway scatter price mpg, saving(fig)",
+    "bootstrap, reps(50) saving(boot): regress price mpg",
+    "estimates save model",
+    "putexcel A1 = 1",
+    "collect export table.docx",
+    "etable, export(table.docx)",
+    "esttab using table.rtf",
+    "outreg2 using table",
+    "log using extra.log",
+    "file write fh \"x\"",
+    "python: print(1)",
+    "mata: x = 1",
+    "shell ls",
+    "!ls",
+    "gen u = rnormal()",
+    "sample 10",
+    "tabulate foreign using other",
+    "cd ..",
+    "mycommand price",
+])
+def test_side_effects_are_never_cached(cache, write_dofile, line):
+    assert cache.key(write_dofile("use auto", line)) is None
+
+
+def test_key_follows_commands_and_data(cache, write_dofile, tmp_path):
+    dofile = write_dofile("use auto", "summarize price // comment")
+    key = cache.key(dofile)
+    assert cache.key(write_dofile("* note", "use auto", "", "summarize price", name="same.do")) == key
+    (tmp_path / "auto.dta").write_bytes(b"auto, edited")
+    assert cache.key(dofile) != key
+    assert cache.key(write_dofile("use missing", "summarize")) is None
+
+
+def test_cache_is_opt_in(stub_stata, write_dofile, tmp_path, cache):
+    (tmp_path / "logs").mkdir()
+    executor = StataDo(str(stub_stata), tmp_path / "logs", is_unix=True, cwd=tmp_path, cache=cache)
+    dofile = write_dofile("use auto", "summarize price")
+
+    asyncio.run(executor.execute_dofile_async(dofile, "first"))
+    asyncio.run(executor.execute_dofile_async(dofile, "second"))
+    assert cache.stats == {"hits": 0, "misses": 0}
+
+    asyncio.run(executor.execute_dofile_async(dofile, "first", use_cache=True))
+    log_file = asyncio.run(executor.execute_dofile_async(dofile, "second", use_cache=True))
+    assert cache.stats == {"hits": 1, "misses": 1}
+    assert log_file.read_text() == ". use auto\n. summarize price\n"
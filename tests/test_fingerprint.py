@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_fingerprint.py
+
+import hashlib
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import CsvDataInfo
+from stata_mcp.core.data_info.fingerprint import FileFingerprint
+
+
+def blake2b(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def edit_in_place(path, offset: int, data: bytes):
+    """Overwrite some bytes without changing the size, then bump the mtime."""
+    st = os.stat(path)
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(np.random.default_rng(0).bytes(100_000))
+    return path
+
+
+def test_full_mode_hashes_every_byte(data_file, tmp_path):
+    fingerprint = FileFingerprint(tmp_path / "index", mode="full", buffer_size=4096)
+    assert fingerprint.fingerprint(data_file) == blake2b(data_file.read_bytes())
+
+    edit_in_place(data_file, 50_000, b"\x00\x01")
+    assert fingerprint.fingerprint(data_file) == blake2b(data_file.read_bytes())
+
+
+def test_sample_mode_hashes_spread_blocks(data_file, tmp_path):
+    fingerprint = FileFingerprint(tmp_path / "index", mode="sample", sample_blocks=4, block_size=1000)
+    data = data_file.read_bytes()
+    step = (len(data) - 1000) / 3
+    expected = hashlib.blake2b(str(len(data)).encode(), digest_size=16)
+    for i in range(4):
+        expected.update(data[int(i * step):int(i * step) + 1000])
+
+    assert fingerprint.fingerprint(data_file) == expected.hexdigest()
+
+    # A copy keeps its fingerprint, an edit between the sampled blocks is not seen
+    copy = shutil.copy(data_file, tmp_path / "copy.bin")
+    assert fingerprint.fingerprint(copy) == expected.hexdigest()
+    edit_in_place(data_file, 20_000, b"\x00\x01")
+    assert fingerprint.fingerprint(data_file) == expected.hexdigest()
+    edit_in_place(data_file, 0, b"\x00\x01")
+    assert fingerprint.fingerprint(data_file) != expected.hexdigest()
+
+
+def test_sample_mode_hashes_small_files_whole(tmp_path):
+    path = tmp_path / "small.bin"
+    path.write_bytes(b"x" * 100)
+    fingerprint = FileFingerprint(tmp_path / "index", mode="sample", sample_blocks=4, block_size=1000)
+    assert fingerprint.fingerprint(path) == blake2b(b"x" * 100)
+
+
+def test_stat_mode_reads_no_byte(data_file, tmp_path):
+    fingerprint = FileFingerprint(tmp_path / "index", mode="stat")
+    st = os.stat(data_file)
+    data_file.unlink()  # Any read of the data file would fail
+
+    digest = FileFingerprint._compute(fingerprint, data_file, st)
+    assert digest == blake2b(f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}".encode())
+
+
+def test_memoized_until_the_file_changes(data_file, tmp_path, monkeypatch):
+    fingerprint = FileFingerprint(tmp_path / "index", mode="full")
+    computed = []
+    compute = FileFingerprint._compute
+    monkeypatch.setattr(FileFingerprint, "_compute",
+                        lambda self, path, st: computed.append(path) or compute(self, path, st))
+
+    first = fingerprint.fingerprint(data_file)
+    assert FileFingerprint(tmp_path / "index", mode="full").fingerprint(data_file) == first
+    edit_in_place(data_file, 0, b"\x00")
+    assert fingerprint.fingerprint(data_file) != first
+    assert len(computed) == 2
+
+
+def test_invalid_mode(tmp_path):
+    with pytest.raises(ValueError, match="Fingerprint mode"):
+        FileFingerprint(tmp_path, mode="md5")
+
+
+@pytest.mark.parametrize("mode", ["stat", "sample", "full"])
+def test_edited_data_is_summarized_again(mode, tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"x": [1, 2, 3, 4]}).to_csv(path, index=False)
+    first = CsvDataInfo(path, cache_dir=tmp_path, fingerprint_mode=mode).summary()
+
+    edit_in_place(path, path.read_bytes().index(b"4"), b"9")  # Same size, new value
+    second = CsvDataInfo(path, cache_dir=tmp_path, fingerprint_mode=mode).summary()
+
+    expected = pd.read_csv(path)["x"]
+    assert first["vars_detail"]["x"]["summary"]["max"] == 4
+    assert second["vars_detail"]["x"]["summary"]["max"] == expected.max() == 9
+    assert second["vars_detail"]["x"]["summary"]["mean"] == round(expected.mean(), 3)
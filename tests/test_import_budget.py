@@ -0,0 +1,37 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_import_budget.py
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from stata_mcp.utils.benchmark import check_import_budget
+
+
+def test_import_budget():
+    assert check_import_budget() == []
+
+
+@pytest.mark.parametrize("package, name", [
+    ("stata_mcp.core.stata", "StataDo"),
+    ("stata_mcp.evaluate", "ScoreModel"),
+    ("stata_mcp.agent_as", "StataAgent"),
+])
+def test_lazy_exports(package, name):
+    code = (f"import sys, {package} as package; "
+            f"assert {name!r} in dir(package) and {name!r} not in vars(package); "
+            f"value = package.{name}; "
+            f"assert vars(package)[{name!r}] is value; print(value.__name__)")
+    # The agent modules build an OpenAI client at import time
+    env = {"OPENAI_API_KEY": "test", **os.environ}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == name
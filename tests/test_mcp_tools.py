@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_mcp_tools.py
+
+import ast
+import asyncio
+import time
+
+import pandas as pd
+
+
+def test_get_data_info_does_not_block_the_event_loop(mcp_servers, monkeypatch):
+    monkeypatch.setattr(mcp_servers, "_get_data_info", lambda *args: time.sleep(0.5) or "{}")
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.05)
+
+    async def main():
+        ticker = asyncio.create_task(tick())
+        result = await mcp_servers.get_data_info("data.csv")
+        ticker.cancel()
+        return result
+
+    assert asyncio.run(main()) == "{}"
+    assert len(ticks) >= 5
+
+
+def test_get_data_info_summarizes_csv(mcp_servers, tmp_path):
+    pd.DataFrame({"x": [1.0, 2.0, 4.0], "s": ["a", "b", "a"]}).to_csv(tmp_path / "data.csv", index=False)
+    info = ast.literal_eval(asyncio.run(mcp_servers.get_data_info(str(tmp_path / "data.csv"))))
+    assert info["overview"]["obs"] == 3
+    assert info["vars_detail"]["x"]["summary"]["mean"] == round(7 / 3, 3)
+    assert info["vars_detail"]["s"]["summary"]["value_list"] == ["a", "b"]
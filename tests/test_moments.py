@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_moments.py
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info.moments import NUMERIC_METRICS, summarize_numeric_frame
+
+
+def pandas_summary(series: pd.Series, decimal_places: int = 3) -> dict:
+    """The definitions of a numeric summary, one pandas call per metric."""
+    values = pd.to_numeric(series, errors="coerce").dropna().astype("float64")
+    stats = {
+        "obs": int(values.size),
+        "mean": values.mean(),
+        "stderr": values.std(ddof=1) / np.sqrt(values.size),
+        "min": values.min(),
+        "max": values.max(),
+        "q1": values.quantile(0.25),
+        "med": values.median(),
+        "q3": values.quantile(0.75),
+        "skewness": values.skew(),
+        "kurtosis": values.kurtosis(),
+    }
+    return {key: value if key == "obs" else round(float(value), decimal_places) for key, value in stats.items()}
+
+
+def assert_same(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float) and math.isnan(value):
+            assert actual[key] is None or math.isnan(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, abs=1e-9), key
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "normal": rng.normal(10, 3, 1001),
+        "with_missing": np.where(rng.random(1001) < 0.2, np.nan, rng.exponential(2, 1001)),
+        "integers": rng.integers(-50, 50, 1001),
+        "boolean": rng.random(1001) < 0.3,
+        "constant": np.full(1001, 4.0),
+        "numeric_text": rng.integers(0, 9, 1001).astype(str).astype(object),
+        "two_values": [1.0, 2.0] + [np.nan] * 999,
+    })
+
+
+def test_summary_matches_pandas(frame):
+    summary = summarize_numeric_frame(frame, NUMERIC_METRICS)
+    for column in frame.columns:
+        assert_same(summary[column], pandas_summary(frame[column]))
+
+
+def test_only_requested_metrics(frame):
+    summary = summarize_numeric_frame(frame[["normal"]], ["mean", "max"], decimal_places=1)
+    assert summary["normal"] == {"obs": 1001, "mean": round(frame["normal"].mean(), 1),
+                                 "max": round(frame["normal"].max(), 1)}
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_parallel.py
+
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import CsvDataInfo
+from stata_mcp.core.data_info import parallel
+from stata_mcp.core.data_info.moments import NUMERIC_METRICS, summarize_numeric_frame
+from stata_mcp.core.data_info.parallel import summarize_numeric_parallel
+from test_moments import assert_same, pandas_summary
+
+
+@pytest.fixture(autouse=True)
+def shutdown_pool():
+    yield
+    parallel._reset_executor()
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(6)
+    return pd.DataFrame({
+        "normal": rng.normal(10, 3, 2001),
+        "with_missing": np.where(rng.random(2001) < 0.3, np.nan, rng.exponential(2, 2001)),
+        "integers": rng.integers(-50, 50, 2001),
+        "boolean": rng.random(2001) < 0.3,
+        "empty": np.full(2001, np.nan),
+    })
+
+
+@pytest.mark.parametrize("workers", [2, 3, 8])
+def test_parallel_matches_pandas(frame, workers):
+    summary = summarize_numeric_parallel(frame, NUMERIC_METRICS, workers=workers)
+
+    assert list(summary) == list(frame.columns)
+    for column in frame.columns:
+        assert_same(summary[column], pandas_summary(frame[column]))
+    for column, expected in summarize_numeric_frame(frame, NUMERIC_METRICS).items():
+        assert_same(summary[column], expected)
+
+
+def test_broken_pool_falls_back_to_this_process(frame, monkeypatch):
+    class BrokenExecutor:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("a worker died")
+
+        def shutdown(self, **kwargs):
+            pass
+
+    monkeypatch.setattr(parallel, "get_executor", lambda workers: BrokenExecutor())
+    summary = summarize_numeric_parallel(frame, ["mean", "max"], workers=2)
+
+    for column, expected in summarize_numeric_frame(frame, ["mean", "max"]).items():
+        assert_same(summary[column], expected)
+
+
+def test_data_info_uses_the_pool(frame, tmp_path, monkeypatch):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    calls = []
+    monkeypatch.setattr("stata_mcp.core.data_info.base.MIN_CELLS", 0)
+    monkeypatch.setattr("stata_mcp.core.data_info.base.summarize_numeric_parallel",
+                        lambda *args, **kwargs: calls.append(kwargs) or summarize_numeric_parallel(*args, **kwargs))
+
+    in_pool = CsvDataInfo(path, is_cache=False, workers=2).summary()["vars_detail"]
+    in_process = CsvDataInfo(path, is_cache=False, workers=1).summary()["vars_detail"]
+
+    assert len(calls) == 1
+    assert in_pool.keys() == in_process.keys()
+    for var, detail in in_pool.items():
+        assert detail["type"] == in_process[var]["type"]
+        assert_same(detail["summary"], in_process[var]["summary"])
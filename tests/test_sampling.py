@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_sampling.py
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import CsvDataInfo, DataInfoBase, ParquetDataInfo
+from test_moments import assert_same, pandas_summary
+
+
+@pytest.fixture
+def all_metrics(tmp_path, monkeypatch):
+    config = tmp_path / "config.toml"
+    config.write_text('[data_info]\nmetrics = ["q1", "q3"]\n')
+    monkeypatch.setattr(DataInfoBase, "CFG_FILE", config)
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(4)
+    return pd.DataFrame({
+        "id": np.arange(10_000),
+        "x": rng.lognormal(1, 0.5, 10_000),
+        "y": np.where(rng.random(10_000) < 0.1, np.nan, rng.normal(0, 1, 10_000)),
+    })
+
+
+def pandas_intervals(series: pd.Series, z: float = 1.96) -> dict:
+    """Normal interval of the mean and order-statistic intervals of the quartiles, from pandas."""
+    values = series.dropna().sort_values().to_numpy()
+    n = values.size
+    half_width = z * series.std(ddof=1) / math.sqrt(n)
+    intervals = {"mean": [round(series.mean() - half_width, 3), round(series.mean() + half_width, 3)]}
+    for name, p in [("q1", 0.25), ("q3", 0.75)]:
+        spread = z * math.sqrt(n * p * (1 - p))
+        low = min(max(math.floor(n * p - spread) - 1, 0), n - 1)
+        high = min(max(math.ceil(n * p + spread) - 1, 0), n - 1)
+        intervals[name] = [round(values[low], 3), round(values[high], 3)]
+    return intervals
+
+
+def test_block_sample_matches_pandas(frame, tmp_path, all_metrics):
+    path = tmp_path / "data.parquet"
+    frame.to_parquet(path, row_group_size=700)
+    data_info = ParquetDataInfo(path, sample=300)
+    summary = data_info.summary()
+
+    blocks = data_info._sample_blocks(10_000, 300)
+    rows = pd.concat([frame.iloc[start:start + length] for start, length in blocks])
+    assert summary["overview"]["sample"] == {
+        "method": "block", "population": 10_000, "population_estimated": False,
+        "fraction": 0.03, "confidence": 0.95,
+    }
+    assert summary["overview"]["obs"] == len(rows) == 300
+    for var in ["x", "y"]:
+        detail = dict(summary["vars_detail"][var]["summary"])
+        intervals = detail.pop("ci")
+        expected = {key: value for key, value in pandas_summary(rows[var]).items() if key in detail}
+        assert_same(detail, expected)
+        assert intervals == pytest.approx(pandas_intervals(rows[var]), abs=1e-9)
+
+
+def test_blocks_are_disjoint_and_sorted():
+    data_info = CsvDataInfo.__new__(CsvDataInfo)  # Only the class constants are used
+    blocks = data_info._sample_blocks(1_000_000, 50_000)
+
+    starts = [start for start, _ in blocks]
+    assert starts == sorted(starts)
+    assert all(start + length <= next_start for (start, length), next_start in zip(blocks, starts[1:]))
+    assert sum(length for _, length in blocks) == pytest.approx(50_000, rel=0.02)
+    assert data_info._sample_blocks(100, 500) == [(0, 100)]
+
+
+@pytest.mark.parametrize("sample", [250, 0.05])
+def test_reservoir_sample_matches_pandas(frame, tmp_path, sample):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    data_info = CsvDataInfo(path, sample=sample, chunksize=999)
+    summary = data_info.summary()
+
+    # The same keys, one per row in file order, whatever the chunks
+    keys = np.random.default_rng(DataInfoBase.SAMPLE_SEED).random(len(frame))
+    if isinstance(sample, int):
+        chosen = np.sort(np.argsort(keys)[:sample])
+    else:
+        chosen = np.flatnonzero(keys < sample)
+    rows = pd.read_csv(path).iloc[chosen]
+
+    assert summary["overview"]["sample"]["method"] == "reservoir"
+    assert summary["overview"]["sample"]["population"] == 10_000
+    assert summary["overview"]["obs"] == len(rows)
+    for var in ["x", "y"]:
+        detail = dict(summary["vars_detail"][var]["summary"])
+        intervals = detail.pop("ci")
+        assert_same(detail, {key: value for key, value in pandas_summary(rows[var]).items() if key in detail})
+        assert intervals["mean"] == pytest.approx(pandas_intervals(rows[var])["mean"], abs=1e-9)
+
+
+def test_csv_byte_blocks_are_whole_rows(tmp_path):
+    rng = np.random.default_rng(5)
+    frame = pd.DataFrame({"id": np.arange(200_000), "x": rng.normal(0, 1, 200_000).round(6)})
+    path = tmp_path / "big.csv"
+    frame.to_csv(path, index=False)
+    data_info = CsvDataInfo(path, sample=1000)
+
+    sample, info = data_info._read_sample()
+
+    assert info["method"] == "block" and info["population_estimated"] is True
+    assert info["population"] == pytest.approx(200_000, rel=0.05)
+    # Every sampled line is a row of the file, read whole
+    pd.testing.assert_frame_equal(sample.reset_index(drop=True),
+                                  frame.set_index("id").loc[sample["id"]].reset_index())
+    assert len(sample) == pytest.approx(1000, rel=0.05)
+
+
+def test_sampled_summary_is_not_cached(frame, tmp_path):
+    path = tmp_path / "data.parquet"
+    frame.to_parquet(path)
+    summary = ParquetDataInfo(path, sample=0.1, cache_dir=tmp_path).summary()
+
+    assert summary["saved_path"] == "Result is not saved."
+    assert not (tmp_path / "data_info.sqlite3").exists()
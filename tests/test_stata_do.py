@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_stata_do.py
+
+import asyncio
+
+import psutil
+import pytest
+
+from stata_mcp.core.stata.stata_do.do import StataDo
+from stata_mcp.core.types import RAMLimitExceededError
+from stata_mcp.monitor import RAMMonitor
+
+
+def make_executor(stub_stata, tmp_path, monitors=None) -> StataDo:
+    log_path = tmp_path / "logs"
+    log_path.mkdir()
+    return StataDo(str(stub_stata), log_path, is_unix=True, cwd=tmp_path, monitors=monitors)
+
+
+def test_execute_dofile_async_writes_log(stub_stata, write_dofile, tmp_path):
+    executor = make_executor(stub_stata, tmp_path, monitors=[RAMMonitor(max_ram_mb=4096)])
+    log_file = asyncio.run(executor.execute_dofile_async(write_dofile("display 1", "display 2"), "run"))
+    assert log_file.read_text() == ". display 1\n. display 2\n"
+
+
+def test_cancel_monitored_run_kills_stata(stub_stata, write_dofile, tmp_path):
+    executor = make_executor(stub_stata, tmp_path, monitors=[RAMMonitor(max_ram_mb=4096)])
+    dofile = write_dofile("sleep 30000")
+
+    def stata_children():
+        # Other children (e.g. the forkserver of the data-info pool) are not ours to check
+        return [child for child in psutil.Process().children()
+                if str(stub_stata) in " ".join(child.cmdline())]
+
+    async def run_and_cancel():
+        task = asyncio.create_task(executor.execute_dofile_async(dofile, "run"))
+        while not (tmp_path / "logs" / "run.log").exists() or not stata_children():
+            await asyncio.sleep(0.05)
+        stata_pids = [child.pid for child in stata_children()]
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return stata_pids
+
+    stata_pids = asyncio.run(run_and_cancel())
+    assert stata_pids
+    assert not any(psutil.pid_exists(pid) and psutil.Process(pid).status() != psutil.STATUS_ZOMBIE
+                   for pid in stata_pids)
+
+
+def test_ram_limit_kills_async_run(stub_stata, write_dofile, tmp_path):
+    executor = make_executor(stub_stata, tmp_path, monitors=[RAMMonitor(max_ram_mb=64)])
+    dofile = write_dofile("alloc 256", "sleep 30000")
+    with pytest.raises(RAMLimitExceededError):
+        asyncio.run(asyncio.wait_for(executor.execute_dofile_async(dofile, "run"), timeout=20))
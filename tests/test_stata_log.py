@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_stata_log.py
+
+import json
+from pathlib import Path
+
+import pytest
+
+from stata_mcp.core.stata.stata_log import StataLogParser
+from stata_mcp.core.stata.stata_log.tabulate import TabulateParser
+
+LOGS = Path(__file__).parent / "fixtures" / "logs"
+
+
+@pytest.mark.parametrize("name", ["regress", "xtreg", "summarize", "tabulate", "error"])
+def test_parse_fixture_log(name):
+    expected = json.loads((LOGS / f"{name}.json").read_text())
+    assert StataLogParser.parse_file(LOGS / f"{name}.log") == expected
+
+
+def test_factor_variable_rows():
+    result = StataLogParser.parse_file(LOGS / "regress.log")["results"][1]
+    coefficients = result["coefficients"]
+
+    assert coefficients["rep78: 1"] == {"coef": 0, "note": "base"}
+    assert coefficients["rep78: 5"]["ci_high"] == 7212.075
+    # "foreign#" wraps onto the next line of the table
+    assert coefficients["foreign#domestic: Domestic#1"] == {"coef": 0, "note": "empty"}
+    assert list(coefficients)[-1] == "_cons"
+
+
+def test_omitted_and_single_value_rows():
+    result = StataLogParser.parse_file(LOGS / "xtreg.log")["results"][0]
+
+    assert result["coefficients"]["grade"] == {"coef": 0, "note": "omitted"}
+    assert result["stats"]["rho"] == 0.58999766
+    assert "sigma_u" not in result["coefficients"]
+    # Nothing after the closing line of the table, e.g. the F test of u_i
+    assert result["stats"]["Prob > F"] == 0.0
+    assert result["stats"]["Number of obs"] == 28091
+
+
+def test_error_code():
+    parsed = StataLogParser.parse_file(LOGS / "error.log")
+
+    assert parsed["errors"] == [{
+        "code": 111,
+        "line": 6,
+        "command": "regress price mpg nosuchvar",
+        "message": "variable nosuchvar not found",
+    }]
+
+
+def test_find_column_ends_right_aligned():
+    header = "  Car type |         0          1 |     Total"
+    row = "  Domestic |         0         52 |        52 "
+    ends = TabulateParser._find_column_ends(row)
+
+    assert [header[end - 1] for end in ends] == ["0", "1"]
+
+    parser = TabulateParser("tabulate foreign domestic")
+    for line in ["           |       domestic", header, "-----------+----------------------+----------", row]:
+        parser.feed(line)
+    assert parser._column_labels() == ["0", "1"]
+
+
+def test_twoway_labels_and_chi2():
+    results = StataLogParser.parse_file(LOGS / "tabulate.log")["results"]
+    chi2, with_key, unlabeled = results[1], results[2], results[3]
+
+    assert chi2["row_variable"] == "Repair record 1978"
+    assert chi2["columns"] == ["Domestic", "Foreign"]
+    assert chi2["tests"] == {"Pearson chi2(4)": {"stat": 27.264, "p": 0.0}}
+    # The key box and the row percentages of the `row` option are skipped
+    assert {key: with_key[key] for key in ("columns", "rows", "total")} == {
+        key: chi2[key] for key in ("columns", "rows", "total")
+    }
+    assert unlabeled["col_variable"] == "domestic"
+    assert unlabeled["total"] == {"counts": [22, 52], "total": 74}
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_stata_pool.py
+
+import time
+
+import pytest
+
+from stata_mcp.core.stata.stata_do import StataDo, StataPool
+
+
+@pytest.fixture
+def make_pool(stub_stata, tmp_path):
+    pools = []
+
+    def make(**kwargs) -> StataPool:
+        pools.append(StataPool(str(stub_stata), cwd=tmp_path, **kwargs))
+        return pools[-1]
+
+    yield make
+    for pool in pools:
+        pool.close()
+
+
+def worker_pid(log_file) -> int:
+    return int(log_file.read_text().splitlines()[-1])
+
+
+def test_worker_is_reused(make_pool, write_dofile, tmp_path):
+    pool = make_pool(size=1)
+    dofile = write_dofile("display 1", "pid")
+
+    first = worker_pid(pool.execute(dofile, tmp_path / "first.log"))
+    second = worker_pid(pool.execute(dofile, tmp_path / "second.log"))
+
+    assert first == second
+    assert (tmp_path / "first.log").read_text() == f". display 1\n. pid\n{first}\n"
+
+
+def test_worker_is_recycled_after_max_jobs(make_pool, write_dofile, tmp_path):
+    pool = make_pool(size=1, max_jobs_per_worker=1)
+    dofile = write_dofile("pid")
+
+    pids = [worker_pid(pool.execute(dofile, tmp_path / f"{i}.log")) for i in range(3)]
+
+    assert len(set(pids)) == 3
+
+
+def test_crashed_worker_is_replaced(make_pool, write_dofile, tmp_path):
+    pool = make_pool(size=1)
+
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        pool.execute(write_dofile("exit", name="crash.do"), tmp_path / "crash.log")
+
+    log_file = pool.execute(write_dofile("display 2", name="next.do"), tmp_path / "next.log")
+    assert log_file.read_text() == ". display 2\n"
+
+
+def test_jobs_run_on_all_workers(make_pool, write_dofile, tmp_path):
+    pool = make_pool(size=2)
+    dofile = write_dofile("sleep 300", "pid")
+
+    started = time.monotonic()
+    futures = [pool.submit(dofile, tmp_path / f"{i}.log") for i in range(2)]
+    pids = {worker_pid(future.result(timeout=20)) for future in futures}
+
+    assert len(pids) == 2
+    assert time.monotonic() - started < 0.6 * 2
+
+
+def test_cancel_kills_running_worker(make_pool, write_dofile, tmp_path):
+    pool = make_pool(size=1)
+    future = pool.submit(write_dofile("sleep 30000", name="long.do"), tmp_path / "long.log")
+    while not (tmp_path / "long.log").exists():
+        time.sleep(0.05)
+
+    assert pool.cancel(future)
+    with pytest.raises(RuntimeError):
+        future.result(timeout=10)
+
+    log_file = pool.execute(write_dofile("display 3", name="next.do"), tmp_path / "next.log")
+    assert log_file.read_text() == ". display 3\n"
+
+
+def test_stata_do_runs_through_pool(make_pool, write_dofile, tmp_path):
+    log_path = tmp_path / "logs"
+    log_path.mkdir()
+    executor = StataDo(str(tmp_path / "unused"), log_path, is_unix=True, cwd=tmp_path, pool=make_pool(size=1))
+
+    log_file = executor.execute_dofile(write_dofile("display 4"), "run")
+
+    assert log_file == log_path / "run.log"
+    assert log_file.read_text() == ". display 4\n"
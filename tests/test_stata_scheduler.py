@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_stata_scheduler.py
+
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from stata_mcp.core.stata.stata_do import StataDo, StataScheduler
+
+
+class Tracker:
+    """Run do-files with StataDo and record how many overlap and in which order they start."""
+
+    def __init__(self, stub_stata, tmp_path):
+        log_path = tmp_path / "logs"
+        log_path.mkdir()
+        self.executor = StataDo(str(stub_stata), log_path, is_unix=True, cwd=tmp_path)
+        self.started = []
+        self.peak = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def job(self, dofile, name):
+        return partial(self._run, dofile, name)
+
+    def _run(self, dofile, name):
+        with self._lock:
+            self.started.append(name)
+            self._running += 1
+            self.peak = max(self.peak, self._running)
+        try:
+            return self.executor.execute_dofile(dofile, name)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+
+@pytest.fixture
+def tracker(stub_stata, tmp_path) -> Tracker:
+    return Tracker(stub_stata, tmp_path)
+
+
+def test_concurrency_is_bounded(tracker, write_dofile):
+    scheduler = StataScheduler(max_concurrency=2)
+    dofile = write_dofile("sleep 200", "display 1")
+
+    futures = [scheduler.submit(tracker.job(dofile, f"job{i}")) for i in range(5)]
+    logs = [future.result(timeout=30) for future in futures]
+
+    assert tracker.peak == 2
+    assert [log.read_text() for log in logs] == [". sleep 200\n. display 1\n"] * 5
+    # The slot is released just after the future resolves
+    deadline = time.monotonic() + 5
+    while scheduler.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scheduler.running == 0 and scheduler.pending == 0
+
+
+def test_higher_priority_starts_first(tracker, write_dofile):
+    scheduler = StataScheduler(max_concurrency=1)
+    blocker = scheduler.submit(tracker.job(write_dofile("sleep 500", name="blocker.do"), "blocker"))
+    while not tracker.started:
+        time.sleep(0.01)
+    dofile = write_dofile("display 1")
+
+    futures = [
+        scheduler.submit(tracker.job(dofile, "low"), priority=0),
+        scheduler.submit(tracker.job(dofile, "high"), priority=5),
+        scheduler.submit(tracker.job(dofile, "low2"), priority=0),
+    ]
+    for future in [blocker, *futures]:
+        future.result(timeout=30)
+
+    assert tracker.started == ["blocker", "high", "low", "low2"]
+
+
+def test_low_free_ram_runs_one_job_at_a_time(tracker, write_dofile):
+    # No machine has this much free RAM, so a job is only admitted when nothing runs
+    scheduler = StataScheduler(max_concurrency=4, min_free_ram_mb=1 << 40, admission_interval=0.05)
+    dofile = write_dofile("sleep 100")
+
+    futures = [scheduler.submit(tracker.job(dofile, f"job{i}")) for i in range(3)]
+    for future in futures:
+        future.result(timeout=30)
+
+    assert tracker.peak == 1
+    assert tracker.started == ["job0", "job1", "job2"]
+
+
+def test_failed_job_does_not_block_the_queue(tracker, write_dofile):
+    scheduler = StataScheduler(max_concurrency=1)
+
+    def fail():
+        raise RuntimeError("Stata is not installed")
+
+    failed = scheduler.submit(fail)
+    done = scheduler.submit(tracker.job(write_dofile("display 1"), "after"))
+
+    with pytest.raises(RuntimeError, match="not installed"):
+        failed.result(timeout=10)
+    assert done.result(timeout=30).read_text() == ". display 1\n"
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_streaming.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import CsvDataInfo, DataInfoBase
+from stata_mcp.core.data_info.streaming import NumericAccumulator
+from test_moments import assert_same, pandas_summary
+
+
+@pytest.fixture
+def all_metrics(tmp_path, monkeypatch):
+    """Every allowed metric, through the `[data_info]` table of the config file."""
+    config = tmp_path / "config.toml"
+    config.write_text('[data_info]\nmetrics = ["q1", "q3", "skewness", "kurtosis"]\n')
+    monkeypatch.setattr(DataInfoBase, "CFG_FILE", config)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "normal": rng.normal(10, 3, 1001),
+        "with_missing": np.where(rng.random(1001) < 0.2, np.nan, rng.exponential(2, 1001)),
+        "integers": rng.integers(-50, 50, 1001),
+        "make": rng.choice(["AMC", "Buick", "Cad."], 1001),
+        # Numbers in the first chunks, text from row 900 on
+        "mixed": [str(i % 7) for i in range(900)] + ["none"] * 101,
+    })
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def summarize(path, **kwargs):
+    return CsvDataInfo(path, is_cache=False, **kwargs).summary()["vars_detail"]
+
+
+def test_streaming_matches_pandas(csv_file, all_metrics):
+    vars_detail = summarize(csv_file, streaming=True, chunksize=64)
+    df = pd.read_csv(csv_file)
+
+    for var in ["normal", "with_missing", "integers"]:
+        expected = pandas_summary(df[var])
+        del expected["med"]  # Not an allowed metric
+        assert vars_detail[var]["type"] == "float"
+        assert_same(vars_detail[var]["summary"], expected)
+
+
+def test_streaming_matches_in_memory(csv_file, all_metrics):
+    assert summarize(csv_file, streaming=True, chunksize=64) == summarize(csv_file, streaming=False)
+
+
+def test_streaming_keeps_the_configured_metrics(csv_file):
+    summary = summarize(csv_file, streaming=True, chunksize=64)["normal"]["summary"]
+    assert list(summary) == ["obs", "mean", "stderr", "min", "max"]
+
+
+def test_numeric_variable_turns_to_text(csv_file):
+    summary = summarize(csv_file, streaming=True, chunksize=100)["mixed"]
+    expected = pd.read_csv(csv_file, dtype={"mixed": str})["mixed"]
+
+    assert summary["type"] == "str"
+    assert summary["summary"]["obs"] == expected.count() == 1001
+    assert summary["summary"]["distinct"] == expected.nunique() == 8
+    assert summary["summary"]["distinct_estimated"] is False
+
+
+def test_merged_accumulators_match_pandas():
+    values = np.random.default_rng(2).gamma(2.0, 3.0, 2000)
+    first, second = NumericAccumulator(), NumericAccumulator()
+    for chunk in np.array_split(values[:1000], 7):
+        first.update(chunk)
+    second.update(values[1000:])
+    first.merge(second)
+
+    assert_same(first.get_summary(), pandas_summary(pd.Series(values)))
+
+
+def test_sketched_quartiles_stay_close():
+    values = np.random.default_rng(3).normal(0, 1, 200_000)
+    accumulator = NumericAccumulator(sketch_size=256)
+    for chunk in np.array_split(values, 50):
+        accumulator.update(chunk)
+    summary = accumulator.get_summary(decimal_places=6)
+    expected = pandas_summary(pd.Series(values), decimal_places=6)
+
+    # Moments stay exact, the quartiles come from a compacted sketch
+    assert not accumulator.sketch.is_exact
+    for key in ["obs", "mean", "stderr", "min", "max", "skewness", "kurtosis"]:
+        assert summary[key] == pytest.approx(expected[key], abs=1e-6), key
+    for key, q in [("q1", 0.25), ("med", 0.5), ("q3", 0.75)]:
+        rank = (values < summary[key]).mean()
+        assert abs(rank - q) < 0.01, key
@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_summary_cache.py
+
+import numpy as np
+import pandas as pd
+
+from stata_mcp.core.data_info import CsvDataInfo, SummaryCache
+
+
+def test_summary_cache_merges_variables(tmp_path, monkeypatch):
+    df = pd.DataFrame({"x": np.arange(10.0), "y": np.arange(10.0) ** 2, "z": list("abcdeabcde")})
+    df.to_csv(tmp_path / "data.csv", index=False)
+    computed = []
+    summarize = CsvDataInfo._summarize
+    monkeypatch.setattr(CsvDataInfo, "_summarize",
+                        lambda self, selected_vars: computed.append(selected_vars) or summarize(self, selected_vars))
+
+    first = CsvDataInfo(tmp_path / "data.csv", ["x"], cache_dir=tmp_path).summary()
+    second = CsvDataInfo(tmp_path / "data.csv", ["x", "y"], cache_dir=tmp_path).summary()
+    third = CsvDataInfo(tmp_path / "data.csv", ["y", "x"], cache_dir=tmp_path).summary()
+
+    assert computed == [["x"], ["y"]]  # Only the variables not cached yet are computed
+    assert second["vars_detail"]["x"] == first["vars_detail"]["x"]
+    assert third["overview"]["var_list"] == ["y", "x"]
+    assert third["vars_detail"]["y"]["summary"]["mean"] == round(df["y"].mean(), 3)
+    assert third["saved_path"] == (tmp_path / "data_info.sqlite3").as_posix()
+
+
+def test_summary_cache_evicts_least_recently_used(tmp_path):
+    cache = SummaryCache(tmp_path / "cache.sqlite3", max_bytes=4096)
+    detail = {"type": "str", "var": "v", "summary": {"value_list": ["x" * 1000]}}
+    for i in range(8):
+        cache.put(f"data{i}", "config", f"data{i}.csv", 10, {"v": detail})
+
+    assert cache.get("data7", "config", ["v"]) == (10, {"v": detail})
+    assert cache.get("data0", "config", ["v"]) == (None, {})
@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 - Present Sepine Tam, Inc. All Rights Reserved
+#
+# @Author : Sepine Tam
+# @Email  : sepinetam@gmail.com
+# @File   : test_variable_type.py
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stata_mcp.core.data_info import DataInfoBase
+
+
+def pandas_type(series: pd.Series) -> str:
+    """The exact definition: every value which is not NA converts to a number."""
+    try:
+        pd.to_numeric(series.dropna(), errors="raise")
+        return "float"
+    except (ValueError, TypeError):
+        return "str"
+
+
+@pytest.mark.parametrize("series", [
+    pd.Series(np.arange(5000)),
+    pd.Series(np.arange(5000) / 7),
+    pd.Series([True, False] * 10),
+    pd.Series(pd.array([1, None, 3], dtype="Int64")),
+    pd.Series(["1", "2.5", None, "-3e4"] * 500),
+    pd.Series(["1"] * 250_000 + ["x"]),  # The only text value is the last one
+    pd.Series(["a", "b", None] * 100),
+    pd.Series(["1", "b"] * 100, dtype="string"),
+    pd.Series([None, None], dtype=object),
+])
+def test_type_matches_pandas(series):
+    assert DataInfoBase._determine_variable_type(series) == pandas_type(series)
+
+
+@pytest.mark.parametrize("series", [
+    pd.Series(pd.date_range("2020-01-01", periods=10)),
+    pd.Series(pd.to_timedelta(np.arange(10), unit="D")),
+    pd.Series(pd.period_range("2020-01", periods=10, freq="M")),
+])
+def test_dates_are_text(series):
+    assert DataInfoBase._determine_variable_type(series) == "str"
+
+
+def test_categorical_follows_its_categories():
+    assert DataInfoBase._determine_variable_type(pd.Series([1, 2, 1], dtype="category")) == "float"
+    assert DataInfoBase._determine_variable_type(pd.Series(["a", "b"], dtype="category")) == "str"